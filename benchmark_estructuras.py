@@ -0,0 +1,868 @@
+#
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Universidad EAN (Bogotá - Colombia)
+# Departamento de Sistemas
+# Faculta de Ingeniería
+#
+# Mediciones de rendimiento de las estructuras de datos del curso.
+# Se ejecuta con: python benchmark_estructuras.py [nombre ...]
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import asyncio
+import json
+import os
+import queue
+import random
+import shlex
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from io import StringIO
+from itertools import chain
+
+import numpy as np
+
+from ean_estructuras_datos import (Bicola, Cola, ColaAsincrona, ColaConcurrente, Departamento, Lista, ListaNumerica,
+                                   ListaOrdenada, Municipio, MunicipioCompacto, NodoArbin, Persona, PersonaCompacta,
+                                   Pila, PilaConcurrente, PilaPersistente,
+                                   a_postfijo, altura_arbol, compilar_expresion, concatenar_listas, copiar_lista,
+                                   crear_arbol_de_lista, crear_lista, dividir_expresion, elevar, es_menor_que,
+                                   escribir_csv, escribir_jsonl, evaluar_lote, fusionar_ordenadas, hojas_arbol,
+                                   inorden, ordenar_externo, por_niveles, postorden, preorden, resto_lista, tam_arbol,
+                                   unir, validar_delimitadores)
+
+
+# ---------------------------------------------------------------------
+# Utilidades
+
+def medir(descripcion: str, funcion: Callable[[], object], repeticiones: int = 1) -> float:
+    """
+    Ejecuta la función varias veces y muestra el mejor tiempo obtenido
+    :param descripcion: el texto que se muestra junto al tiempo
+    :param funcion: la operación a medir
+    :param repeticiones: cuántas veces se repite la medición
+    :return: el mejor tiempo en segundos
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    print(f"  {descripcion:<50} {mejor * 1000:12.2f} ms")
+    return mejor
+
+
+def personas_aleatorias(n: int, semilla: int = 2025, clase: type = Persona) -> Lista[Persona]:
+    """
+    Crea una lista de personas con datos aleatorios, parecidos a los del archivo del curso
+    :param n: la cantidad de personas
+    :param semilla: la semilla del generador de números aleatorios
+    :param clase: la clase de las personas, Persona o PersonaCompacta
+    :return: la lista de personas
+    """
+    azar = random.Random(semilla)
+    niveles = ["PRIMARIA", "BACHILLERATO", "PREGRADO", "POSTGRADO"]
+    resultado = Lista[Persona]()
+    for cedula in range(n):
+        resultado.agregar(clase(
+            1_000_000 + cedula, f"PERSONA {cedula}", azar.randint(18, 90), azar.choice("MF"),
+            azar.randint(0, 5), azar.choice(niveles), azar.randint(1, 6),
+            azar.randint(1_000_000, 20_000_000), azar.randint(45, 120), azar.randint(150, 200),
+            azar.random() < 0.2, azar.random() < 0.5, azar.random() < 0.4, azar.random() < 0.3))
+    return resultado
+
+
+# ---------------------------------------------------------------------
+# Mediciones
+
+def ordenar_por_intercambio(lista: Lista, menor_que: Callable[..., bool]) -> Lista:
+    """
+    El algoritmo de ordenamiento que usaba Lista.ordenar antes del motor O(n log n)
+    """
+    lista = copiar_lista(lista)
+    for i in range(lista.tam - 1):
+        for j in range(i + 1, lista.tam):
+            if menor_que(lista[j], lista[i]):
+                lista[i], lista[j] = lista[j], lista[i]
+    return lista
+
+
+def benchmark_ordenar() -> None:
+    print("Ordenamiento de personas por 'estrato, edad'")
+    for n in (500, 2_000, 100_000):
+        personas = personas_aleatorias(n)
+        print(f" n = {n}")
+        if n <= 2_000:
+            medir("intercambio con es_menor_que (anterior)",
+                  lambda: ordenar_por_intercambio(personas, lambda x, y: es_menor_que(x, y, "estrato, edad")))
+        medir("ordenar(atributo=...)", lambda: personas.ordenar(atributo="estrato, edad"), 3)
+        medir("ordenar(atributo=...) con campo descendente", lambda: personas.ordenar(atributo="estrato, -edad"), 3)
+        medir("ordenar(menor_que=...)",
+              lambda: personas.ordenar(menor_que=lambda x, y: es_menor_que(x, y, "estrato, edad")))
+        medir("ordenar_en_sitio(atributo=...)", lambda: personas.ordenar_en_sitio(atributo="estrato, edad"), 3)
+
+
+def es_menor_que_sin_compilar(objeto1, objeto2, atributos: str) -> bool:
+    """
+    La versión de es_menor_que que analizaba los atributos en cada comparación
+    """
+    for nombre_attr in [atrib.strip() for atrib in atributos.split(",")]:
+        nomatrib = nombre_attr.split("(")[0].strip() if nombre_attr.endswith(")") else nombre_attr
+        if not hasattr(objeto1, nomatrib) or not hasattr(objeto2, nomatrib):
+            raise AttributeError(nomatrib)
+        if nombre_attr.endswith(")"):
+            valor1, valor2 = getattr(objeto1, nomatrib)(), getattr(objeto2, nomatrib)()
+        else:
+            valor1, valor2 = getattr(objeto1, nomatrib), getattr(objeto2, nomatrib)
+        if valor1 < valor2:
+            return True
+        if valor1 > valor2:
+            return False
+    return False
+
+
+def benchmark_comparadores() -> None:
+    print("Comparadores compilados para 'estrato, edad, ingresos'")
+    personas = personas_aleatorias(100_000)
+    atributos = "estrato, edad, ingresos"
+    anterior = lambda x, y: es_menor_que_sin_compilar(x, y, atributos)
+    medir("mayor(menor_que=<sin compilar>) (anterior)", lambda: personas.mayor(menor_que=anterior), 3)
+    medir("mayor(menor_que=es_menor_que)", lambda: personas.mayor(lambda x, y: es_menor_que(x, y, atributos)), 3)
+    medir("mayor(atributo=...)", lambda: personas.mayor(atributo=atributos), 3)
+    medir("menor(atributo=...)", lambda: personas.menor(atributo=atributos), 3)
+
+
+def benchmark_consultas() -> None:
+    print("Cadena filtrar -> seleccionar -> promedio sobre 300.000 personas")
+    personas = personas_aleatorias(300_000)
+    medir("filtrar().seleccionar().promedio() (listas intermedias)",
+          lambda: personas.filtrar(lambda p: p.fuma).seleccionar(lambda p: p.ingresos).promedio(), 3)
+    medir("consulta().filtrar().seleccionar().promedio()",
+          lambda: personas.consulta().filtrar(lambda p: p.fuma).seleccionar(lambda p: p.ingresos).promedio(), 3)
+    medir("filtrar().primero (lista intermedia)", lambda: personas.filtrar(lambda p: p.edad > 80).primero, 3)
+    medir("consulta().encontrar_primero()",
+          lambda: personas.consulta().encontrar_primero(lambda p: p.edad > 80), 3)
+
+
+def benchmark_tabla_columnar() -> None:
+    print("Agregados sobre 300.000 personas: Lista contra TablaColumnar")
+    personas = personas_aleatorias(300_000)
+    medir("Lista.a_tabla_columnar() (conversión)", personas.a_tabla_columnar)
+    tabla = personas.a_tabla_columnar()
+    medir("Lista.sumar(ingresos)", lambda: personas.sumar(lambda p: p.ingresos), 3)
+    medir("TablaColumnar.sumar('ingresos')", lambda: tabla.sumar("ingresos"), 3)
+    medir("Lista.promedio(edad)", lambda: personas.promedio(lambda p: p.edad), 3)
+    medir("TablaColumnar.promedio('edad')", lambda: tabla.promedio("edad"), 3)
+    medir("Lista.contar(estrato >= 4 y fuma)", lambda: personas.contar(lambda p: p.estrato >= 4 and p.fuma), 3)
+    medir("TablaColumnar.contar(estrato >= 4 y fuma)", lambda: tabla.contar(lambda t: (t["estrato"] >= 4) & t["fuma"]), 3)
+    medir("Lista.ordenar(atributo='estrato, -edad')", lambda: personas.ordenar(atributo="estrato, -edad"), 3)
+    medir("TablaColumnar.ordenar('estrato, -edad')", lambda: tabla.ordenar("estrato, -edad"), 3)
+
+
+def resto_lista_copiando(lista: Lista) -> Lista:
+    """
+    La versión de resto_lista que copiaba los elementos uno por uno
+    """
+    resultado = Lista()
+    for indice in lista.indices:
+        if indice >= 1:
+            resultado.agregar(lista[indice])
+    return resultado
+
+
+def benchmark_vistas() -> None:
+    print("Suma recursiva con resto_lista")
+
+    def suma(lista: Lista, resto: Callable[[Lista], Lista]) -> int:
+        if lista.vacia:
+            return 0
+        return lista[0] + suma(resto(lista), resto)
+
+    limite = sys.getrecursionlimit()
+    sys.setrecursionlimit(50_000)
+    try:
+        for n in (1_000, 3_000, 10_000):
+            numeros = Lista[int]()
+            for i in range(n):
+                numeros.agregar(i)
+            print(f" n = {n}")
+            if n <= 3_000:
+                medir("resto_lista copiando (anterior)", lambda: suma(numeros, resto_lista_copiando))
+            medir("resto_lista con vistas", lambda: suma(numeros, resto_lista), 3)
+            medir("copiar_lista", lambda: copiar_lista(numeros), 3)
+    finally:
+        sys.setrecursionlimit(limite)
+
+
+def benchmark_indices() -> None:
+    print("10.000 búsquedas de personas por cédula en una lista de 100.000")
+    personas = personas_aleatorias(100_000)
+    azar = random.Random(7)
+    cedulas = [1_000_000 + azar.randrange(100_000) for _ in range(10_000)]
+    pocas = cedulas[:200]
+    medir("encontrar_primero (200 búsquedas)",
+          lambda: [personas.encontrar_primero(lambda p: p.cedula == c) for c in pocas])
+    medir("buscar_por sin índice (200 búsquedas)", lambda: [personas.buscar_por("cedula", c) for c in pocas])
+    medir("crear_indice('cedula', unico=True)", lambda: personas.crear_indice("cedula", unico=True))
+    medir("buscar_por con índice (10.000 búsquedas)", lambda: [personas.buscar_por("cedula", c) for c in cedulas], 3)
+    medir("crear_indice('estrato, genero')", lambda: personas.crear_indice("estrato, genero"))
+    medir("buscar_todos_por con índice", lambda: personas.buscar_todos_por("estrato, genero", (3, "M")), 3)
+    medir("filtrar por estrato y genero",
+          lambda: personas.filtrar(lambda p: p.estrato == 3 and p.genero == "M"), 3)
+
+
+def benchmark_iteracion() -> None:
+    print("Construcción y recorrido de una lista de 1.000.000 de números")
+    n = 1_000_000
+    numeros = Lista.desde_iterable(range(n))
+
+    def agregar_uno_por_uno() -> Lista[int]:
+        resultado = Lista[int]()
+        for i in range(n):
+            resultado.agregar(i)
+        return resultado
+
+    def recorrer_con_indices() -> int:
+        total = 0
+        for i in numeros.indices:
+            total += numeros[i]
+        return total
+
+    def recorrer_con_for() -> int:
+        total = 0
+        for numero in numeros:
+            total += numero
+        return total
+
+    medir("agregar uno por uno (anterior)", agregar_uno_por_uno, 3)
+    medir("Lista.desde_iterable", lambda: Lista.desde_iterable(range(n)), 3)
+    medir("crear_lista(*elementos)", lambda: crear_lista(*range(n)), 3)
+    medir("concatenar_listas", lambda: concatenar_listas(numeros, numeros), 3)
+    medir("for i in lista.indices: lista[i] (anterior)", recorrer_con_indices, 3)
+    medir("for elemento in lista", recorrer_con_for, 3)
+    medir("sum(lista)", lambda: sum(numeros), 3)
+
+
+def benchmark_estadisticas() -> None:
+    print("Resumen de ingresos de 300.000 personas")
+    personas = personas_aleatorias(300_000)
+    ingresos = lambda p: p.ingresos
+
+    def cinco_recorridos() -> tuple:
+        return (personas.contar(), personas.sumar(ingresos), personas.promedio(ingresos),
+                personas.mayor(atributo="ingresos"), personas.menor(atributo="ingresos"))
+
+    medir("contar + sumar + promedio + mayor + menor (anterior)", cinco_recorridos, 3)
+    medir("estadisticas(selector) en un recorrido", lambda: personas.estadisticas(ingresos), 3)
+
+
+def benchmark_agrupar() -> None:
+    print("Ingresos totales por 'estrato, nivel_educativo' en 300.000 personas")
+    personas = personas_aleatorias(300_000)
+
+    def un_filtrar_por_clave() -> dict:
+        claves = {(p.estrato, p.nivel_educativo) for p in personas}
+        return {clave: personas.filtrar(lambda p: (p.estrato, p.nivel_educativo) == clave)
+                .sumar(lambda p: p.ingresos) for clave in claves}
+
+    medir("un filtrar por clave (anterior)", un_filtrar_por_clave)
+    medir("agrupar(clave, ingresos=('sumar', ...))",
+          lambda: personas.agrupar("estrato, nivel_educativo", ingresos=("sumar", "ingresos")), 3)
+    medir("agrupar(clave) con los elementos de cada grupo", lambda: personas.agrupar("estrato, nivel_educativo"), 3)
+
+
+def benchmark_seleccion() -> None:
+    print("Las 10 personas con más ingresos y la mediana de ingresos en 300.000 personas")
+    personas = personas_aleatorias(300_000)
+    medir("ordenar(...) y tomar 10", lambda: personas.ordenar(atributo="ingresos", descendente=True)[:10], 3)
+    medir("mayores(10, atributo=...)", lambda: personas.mayores(10, atributo="ingresos"), 3)
+    medir("ordenar(...) y tomar el del medio",
+          lambda: personas.ordenar(atributo="ingresos")[(personas.tam - 1) // 2], 3)
+    medir("mediana(atributo=...)", lambda: personas.mediana(atributo="ingresos"), 3)
+    medir("k_esimo(1000, atributo=...)", lambda: personas.k_esimo(1000, atributo="ingresos"), 3)
+
+
+def puntaje_costoso(persona: Persona) -> float:
+    """
+    Un cálculo artificialmente costoso sobre una persona, para medir el paralelismo
+    """
+    total = 0.0
+    for i in range(1, 400):
+        total += (persona.ingresos % i) / (persona.edad + i)
+    return total
+
+
+def benchmark_paralelo() -> None:
+    print("seleccionar con una función costosa sobre 40.000 personas")
+    personas = personas_aleatorias(40_000)
+    medir("seleccionar (serial)", lambda: personas.seleccionar(puntaje_costoso))
+    trabajadores = 1
+    while trabajadores <= (os.cpu_count() or 1):
+        with personas.paralelo(trabajadores) as ejecutor:
+            medir(f"paralelo({trabajadores}).seleccionar", lambda: ejecutor.seleccionar(puntaje_costoso))
+        trabajadores *= 2
+
+
+def benchmark_lista_ordenada() -> None:
+    print("1.000 consultas de rango por edad sobre 100.000 personas")
+    personas = personas_aleatorias(100_000)
+    azar = random.Random(11)
+    rangos = [(edad, edad + azar.randint(0, 5)) for edad in (azar.randint(18, 90) for _ in range(1_000))]
+    pocos = rangos[:50]
+    medir("contar con un recorrido (50 consultas)",
+          lambda: [personas.contar(lambda p: desde <= p.edad <= hasta) for desde, hasta in pocos])
+    medir("crear ListaOrdenada(atributo='edad')", lambda: ListaOrdenada(personas, atributo="edad"), 3)
+    ordenada = ListaOrdenada(personas, atributo="edad")
+    medir("contar_en_rango (1.000 consultas)",
+          lambda: [ordenada.contar_en_rango(desde, hasta) for desde, hasta in rangos], 3)
+    medir("rango (1.000 consultas)", lambda: [ordenada.rango(desde, hasta) for desde, hasta in rangos])
+    nuevas = personas_aleatorias(1_000, 3)
+    medir("1.000 agregar en la ListaOrdenada", lambda: [ordenada.agregar(p) for p in nuevas])
+    otra = ListaOrdenada(personas_aleatorias(100_000, 5), atributo="edad")
+    medir("fusionar dos listas de 100.000", lambda: ordenada.fusionar(otra), 3)
+    medir("fusionar_ordenadas de cuatro listas", lambda: fusionar_ordenadas(ordenada, otra, ordenada, otra), 3)
+
+
+def benchmark_unir() -> None:
+    print("Unión de 100.000 municipios con 1.000 departamentos")
+    azar = random.Random(13)
+    departamentos = Lista.desde_iterable(
+        Departamento(f"DEPTO {i}", 10, f"CAPITAL {i}", 1000.0, 100_000, 1.0, 0.7, 1900, azar.choice(["ANDINA", "CARIBE"]))
+        for i in range(1_000))
+    municipios = Lista.desde_iterable(
+        Municipio(i, f"MUNICIPIO {i}", azar.randint(0, 10_000), azar.randint(0, 10_000),
+                  f"DEPTO {azar.randrange(1_100)}", False)
+        for i in range(100_000))
+    pocos = municipios[:2_000]
+    medir("ciclos anidados (2.000 municipios)",
+          lambda: Lista.desde_iterable((m, d) for m in pocos for d in departamentos if m.departamento == d.nombre))
+    medir("unir inner (hash)", lambda: unir(municipios, departamentos, "departamento", "nombre"), 3)
+    medir("unir left (hash)", lambda: unir(municipios, departamentos, "departamento", "nombre", tipo="left"), 3)
+    municipios_ordenados = municipios.ordenar(atributo="departamento")
+    departamentos_ordenados = departamentos.ordenar(atributo="nombre")
+    medir("unir inner (mezcla de listas ordenadas)",
+          lambda: unir(municipios_ordenados, departamentos_ordenados, "departamento", "nombre", ordenadas=True), 3)
+
+
+def benchmark_ordenar_externo() -> None:
+    print("Ordenamiento externo de 200.000 personas generadas en flujo")
+    n = 200_000
+
+    def generar():
+        return (persona for inicio in range(0, n, 20_000)
+                for persona in personas_aleatorias(20_000, inicio))
+
+    def consumir(registros) -> int:
+        cantidad = 0
+        for _ in registros:
+            cantidad += 1
+        return cantidad
+
+    for max_en_memoria in (10_000, 50_000, n):
+        tracemalloc.start()
+        medir(f"ordenar_externo(max_en_memoria={max_en_memoria})",
+              lambda: consumir(ordenar_externo(generar(), atributo="estrato, edad", max_en_memoria=max_en_memoria)))
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {'memoria máxima':<50} {pico / 2 ** 20:12.1f} MB")
+
+
+def str_concatenando(lista: Lista) -> str:
+    """
+    La versión de Lista.__str__ que concatenaba con +=
+    """
+    resultado = 'Lista['
+    n = 1
+    for elemento in lista:
+        resultado += str(elemento)
+        if n < lista.tam:
+            resultado += ', '
+        n += 1
+    return resultado + ']'
+
+
+def benchmark_escritura() -> None:
+    print("Representación y escritura de 100.000 personas")
+    personas = personas_aleatorias(100_000)
+    medir("str concatenando con += (anterior)", lambda: str_concatenando(personas))
+    medir("str(lista)", lambda: str(personas), 3)
+    medir("repr(lista)", lambda: repr(personas), 3)
+    with tempfile.TemporaryDirectory() as directorio:
+        medir("escribir_csv", lambda: escribir_csv(personas, os.path.join(directorio, "p.csv")), 3)
+        medir("escribir_jsonl", lambda: escribir_jsonl(personas, os.path.join(directorio, "p.jsonl")), 3)
+
+
+def invertir_insertando(lista: Lista) -> Lista:
+    """
+    Versión anterior de invertir: inserta cada elemento al principio
+    """
+    resultado = Lista()
+    for elemento in lista:
+        resultado.insertar_al_principio(elemento)
+    return resultado
+
+
+def benchmark_instantaneas() -> None:
+    print("Copias de una lista de 1.000.000 de números")
+    numeros = Lista.desde_iterable(range(1_000_000))
+    medir("copia completa (Lista.desde_iterable)", lambda: Lista.desde_iterable(numeros), 3)
+    medir("copiar_lista (instantánea)", lambda: copiar_lista(numeros), 3)
+    medir("instantánea + primera escritura", lambda: numeros.instantanea().agregar(0), 3)
+    medir("invertir (vista)", lambda: numeros.invertir(), 3)
+    pocos = Lista.desde_iterable(range(20_000))
+    medir("invertir 20.000 insertando al principio (anterior)", lambda: invertir_insertando(pocos))
+
+
+def benchmark_colas() -> None:
+    print("Cola con 100.000 elementos: encolar todos y luego desencolar todos")
+    n = 100_000
+
+    def con_lista() -> None:
+        cola = Lista()
+        for i in range(n):
+            cola.agregar(i)
+        while not cola.vacia:
+            cola.eliminar(0)
+
+    def con_cola() -> None:
+        cola = Cola()
+        for i in range(n):
+            cola.encolar(i)
+        while not cola.vacia:
+            cola.desencolar()
+
+    def con_bicola() -> None:
+        bicola = Bicola()
+        for i in range(n):
+            bicola.encolar_al_frente(i)
+        while not bicola.vacia:
+            bicola.desencolar_al_final()
+
+    medir("Lista (agregar / eliminar(0))", con_lista)
+    medir("Cola (encolar / desencolar)", con_cola, 3)
+    medir("Bicola (encolar_al_frente / desencolar_al_final)", con_bicola, 3)
+
+    def al_principio(estructura, agregar: Callable) -> None:
+        for i in range(20_000):
+            agregar(estructura, i)
+
+    medir("Lista.insertar_al_principio 20.000 veces", lambda: al_principio(Lista(), Lista.insertar_al_principio))
+    medir("Bicola.encolar_al_frente 20.000 veces", lambda: al_principio(Bicola(), Bicola.encolar_al_frente), 3)
+
+
+def bytes_por_registro(crear: Callable[[], object]) -> float:
+    """
+    Mide cuánta memoria ocupa en promedio cada registro de la estructura creada
+    """
+    tracemalloc.start()
+    estructura = crear()
+    usada = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return usada / len(estructura)
+
+
+def benchmark_compactos() -> None:
+    print("Memoria por registro (incluye los valores de los campos)")
+    n = 100_000
+
+    def municipios(clase: type) -> Lista:
+        azar = random.Random(11)
+        return Lista.desde_iterable(clase(i, f"MUNICIPIO {i}", azar.randint(0, 10**6), azar.randint(0, 10**5),
+                                          "DEPARTAMENTO", azar.random() < 0.03) for i in range(n))
+
+    for descripcion, crear in (("Persona", lambda: personas_aleatorias(n)),
+                               ("PersonaCompacta", lambda: personas_aleatorias(n, clase=PersonaCompacta)),
+                               ("Municipio", lambda: municipios(Municipio)),
+                               ("MunicipioCompacto", lambda: municipios(MunicipioCompacto))):
+        print(f"  {descripcion:<50} {bytes_por_registro(crear):12.1f} bytes")
+    medir("crear 100.000 Persona", lambda: personas_aleatorias(n))
+    medir("crear 100.000 PersonaCompacta", lambda: personas_aleatorias(n, clase=PersonaCompacta))
+
+
+def benchmark_numericas() -> None:
+    print("Operaciones sobre los ingresos de 300.000 personas")
+    personas = personas_aleatorias(300_000)
+    ingresos = personas.seleccionar(lambda p: p.ingresos)
+    numericos = personas.seleccionar(lambda p: p.ingresos, numerica=True)
+    medir("seleccionar", lambda: personas.seleccionar(lambda p: p.ingresos), 3)
+    medir("seleccionar(numerica=True)", lambda: personas.seleccionar(lambda p: p.ingresos, numerica=True), 3)
+    medir("Lista.sumar", lambda: ingresos.sumar(), 3)
+    medir("ListaNumerica.sumar", lambda: numericos.sumar(), 3)
+    medir("Lista.promedio", lambda: ingresos.promedio(), 3)
+    medir("ListaNumerica.promedio", lambda: numericos.promedio(), 3)
+    medir("Lista.mayor", lambda: ingresos.mayor(), 3)
+    medir("ListaNumerica.mayor", lambda: numericos.mayor(), 3)
+    medir("Lista.transformar (x * 1.19)", lambda: ingresos.transformar(lambda x: x * 1.19), 3)
+    medir("ListaNumerica * 1.19", lambda: numericos * 1.19, 3)
+    medir("ListaNumerica.sumas_acumuladas", lambda: numericos.sumas_acumuladas(), 3)
+    print(f"  {'memoria Lista (bytes por número)':<50} {bytes_por_registro(lambda: Lista.desde_iterable(x * 3 for x in ingresos)):12.1f}")
+    print(f"  {'memoria ListaNumerica (bytes por número)':<50} {bytes_por_registro(lambda: numericos * 3):12.1f}")
+
+
+def benchmark_pilas() -> None:
+    print("Pila con 200.000 elementos en cada almacenamiento")
+    n = 200_000
+    for almacenamiento in ("enlazada", "arreglo"):
+        print(f" almacenamiento = {almacenamiento}")
+
+        def apilar_y_desapilar() -> None:
+            pila = Pila(almacenamiento)
+            for i in range(n):
+                pila.apilar(i)
+            while not pila.vacia:
+                pila.desapilar()
+
+        def llena() -> Pila:
+            pila = Pila(almacenamiento)
+            pila.apilar_varios(range(n))
+            return pila
+
+        pila = llena()
+        medir("apilar / desapilar uno por uno", apilar_y_desapilar)
+        medir("apilar_varios", llena, 3)
+        medir("desapilar_n(n)", lambda: llena().desapilar_n(n), 3)
+        medir("tam (1.000 veces)", lambda: [pila.tam for _ in range(1_000)], 3)
+        medir("recorrer desde el tope", lambda: sum(pila), 3)
+        print(f"  {'memoria (bytes por elemento)':<50} {bytes_por_registro(llena):12.1f}")
+
+
+def benchmark_pilas_persistentes() -> None:
+    print("Guardar una copia de la pila en cada paso")
+    for n in (500, 2_000):
+        print(f" n = {n} pasos (apilar y guardar la pila)")
+
+        def con_pila() -> list:
+            pila = Pila()
+            copias = []
+            for i in range(n):
+                pila.apilar(i)
+                copias.append(pila.copiar())
+            return copias
+
+        def con_persistente() -> list:
+            pila = PilaPersistente()
+            copias = []
+            for i in range(n):
+                pila = pila.apilar(i)
+                copias.append(pila.copiar())
+            return copias
+
+        medir("Pila.copiar", con_pila)
+        medir("PilaPersistente", con_persistente, 3)
+
+    print("Búsqueda con backtracking: caminos de 12 pasos con cada prefijo guardado")
+
+    def caminos(pila, paso: int, guardados: list) -> None:
+        guardados.append(pila.copiar())
+        if paso == 12:
+            return
+        for movimiento in (-1, 1):
+            if isinstance(pila, PilaPersistente):
+                caminos(pila.apilar(movimiento), paso + 1, guardados)
+            else:
+                pila.apilar(movimiento)
+                caminos(pila, paso + 1, guardados)
+                pila.desapilar()
+
+    medir("Pila (apilar / desapilar / copiar)", lambda: caminos(Pila(), 0, []))
+    medir("PilaPersistente", lambda: caminos(PilaPersistente(), 0, []), 3)
+
+
+def dividir_expresion_shlex(expresion: str) -> Lista[str]:
+    """
+    Versión anterior de dividir_expresion, con shlex
+    """
+    res = Lista[str]()
+    for elem in list(shlex.shlex(StringIO(expresion))):
+        res.agregar(elem)
+    return res
+
+
+def evaluar_sin_compilar(expresion: str, valores: dict) -> float:
+    """
+    Evalúa la expresión analizando el texto cada vez: tokens, postfijo y una Pila para evaluar
+    """
+    operaciones = {'+': lambda a, b: a + b, '-': lambda a, b: a - b, '*': lambda a, b: a * b,
+                   '/': lambda a, b: a / b, '^': elevar}
+    pila = Pila()
+    for token in a_postfijo(dividir_expresion(expresion)):
+        if token in operaciones:
+            derecho = pila.tope
+            pila.desapilar()
+            izquierdo = pila.tope
+            pila.desapilar()
+            pila.apilar(operaciones[token](izquierdo, derecho))
+        elif token[0].isdigit():
+            pila.apilar(float(token))
+        else:
+            pila.apilar(valores[token])
+    return pila.tope
+
+
+def benchmark_expresiones() -> None:
+    formula = "(a * x ^ 2 + b * x + c) / (x + 1) - 3.5 * (a - b)"
+    print(f"Fórmula: {formula}")
+    medir("dividir_expresion con shlex (1.000 veces, anterior)",
+          lambda: [dividir_expresion_shlex(formula) for _ in range(1_000)])
+    medir("dividir_expresion con regex (1.000 veces)",
+          lambda: [dividir_expresion(formula) for _ in range(1_000)], 3)
+    azar = random.Random(5)
+    filas = Lista.desde_iterable({"a": azar.randint(1, 9), "b": azar.randint(1, 9), "c": azar.randint(1, 9),
+                                  "x": azar.randint(0, 50)} for _ in range(100_000))
+    pocas = filas[:5_000]
+    expresion = compilar_expresion(formula)
+    medir("sin compilar, 5.000 filas", lambda: [evaluar_sin_compilar(formula, fila) for fila in pocas])
+    medir("ExpresionCompilada.evaluar, 5.000 filas", lambda: [expresion.evaluar(fila) for fila in pocas], 3)
+    medir("ExpresionCompilada.evaluar, 100.000 filas", lambda: [expresion.evaluar(fila) for fila in filas])
+    medir("evaluar_lote sobre una Lista, 100.000 filas", lambda: evaluar_lote(formula, filas), 3)
+    generador = np.random.default_rng(5)
+    columnas = {nombre: generador.integers(1, 10, 1_000_000) for nombre in "abc"}
+    columnas["x"] = generador.integers(0, 50, 1_000_000)
+    medir("evaluar_lote con arreglos de NumPy, 1.000.000 filas", lambda: evaluar_lote(formula, columnas), 3)
+
+
+def balanceado_con_pila(texto: str) -> bool:
+    """
+    El algoritmo del curso: una Pila con los símbolos de apertura, sobre el texto completo en memoria
+    """
+    parejas = {')': '(', ']': '[', '}': '{'}
+    pila = Pila()
+    for simbolo in texto:
+        if simbolo in '([{':
+            pila.apilar(simbolo)
+        elif simbolo in parejas:
+            if pila.vacia or pila.tope != parejas[simbolo]:
+                return False
+            pila.desapilar()
+    return pila.vacia
+
+
+def pico_de_memoria(funcion: Callable[[], object]) -> float:
+    """
+    Ejecuta la función y retorna el pico de memoria usada, en megabytes
+    """
+    tracemalloc.start()
+    funcion()
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico / 1_000_000
+
+
+def benchmark_delimitadores() -> None:
+    azar = random.Random(3)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "volcado.jsonl")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            for i in range(60_000):
+                registro = {"id": i, "nombre": f"Persona (\"{i}\") [x]", "hijos": [azar.randint(0, 9) for _ in range(5)],
+                            "direccion": {"calle": azar.randint(1, 200), "ciudad": "Bogotá", "tags": ["a", "b"]}}
+                archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            archivo.write("]\n")
+        megas = os.path.getsize(ruta) / 1_000_000
+        print(f"Validar un volcado JSON de {megas:.1f} MB con un error en la última línea")
+
+        def con_pila() -> bool:
+            with open(ruta, encoding="utf-8") as archivo:
+                return balanceado_con_pila(archivo.read())
+
+        medir("Pila sobre el texto completo (anterior)", con_pila)
+        tiempo = medir("validar_delimitadores", lambda: validar_delimitadores(ruta), 3)
+        resultado = validar_delimitadores(ruta)
+        print(f"  {resultado.mensaje} (línea {resultado.linea}, columna {resultado.columna}), "
+              f"profundidad máxima {resultado.profundidad_maxima}, {megas / tiempo:.1f} MB/s")
+        print(f"  {'pico de memoria Pila (MB)':<50} {pico_de_memoria(con_pila):12.1f}")
+        print(f"  {'pico de memoria validar_delimitadores (MB)':<50} "
+              f"{pico_de_memoria(lambda: validar_delimitadores(ruta)):12.1f}")
+
+
+def productores_y_consumidores(estructura, poner: Callable, sacar: Callable, cerrar: Callable,
+                               productores: int, consumidores: int, por_productor: int) -> None:
+    """
+    Prueba de carga con hilos: cada productor pone sus números y los consumidores
+    los sacan hasta que la estructura se cierra. Revisa que cada número se haya
+    recibido exactamente una vez.
+    """
+    recibidos = [[] for _ in range(consumidores)]
+
+    def producir(numero: int) -> None:
+        for i in range(numero * por_productor, (numero + 1) * por_productor):
+            poner(estructura, i)
+
+    def consumir(destino: list) -> None:
+        while True:
+            try:
+                destino.append(sacar(estructura))
+            except IndexError:
+                return
+
+    hilos_productores = [threading.Thread(target=producir, args=(i,)) for i in range(productores)]
+    hilos_consumidores = [threading.Thread(target=consumir, args=(destino,)) for destino in recibidos]
+    for hilo in hilos_productores + hilos_consumidores:
+        hilo.start()
+    for hilo in hilos_productores:
+        hilo.join()
+    cerrar(estructura)
+    for hilo in hilos_consumidores:
+        hilo.join()
+    todos = sorted(chain.from_iterable(recibidos))
+    assert todos == list(range(productores * por_productor)), "Se perdieron o repitieron elementos"
+
+
+def _sacar_de_queue(cola: queue.Queue):
+    elemento = cola.get()
+    if elemento is None:
+        cola.put(None)
+        raise IndexError
+    return elemento
+
+
+async def productores_y_consumidores_asincronos(estructura, poner: Callable, sacar: Callable, cerrar: Callable,
+                                                productores: int, consumidores: int, por_productor: int) -> None:
+    """
+    La misma prueba de carga, con tareas de asyncio
+    """
+    recibidos = [[] for _ in range(consumidores)]
+
+    async def producir(numero: int) -> None:
+        for i in range(numero * por_productor, (numero + 1) * por_productor):
+            await poner(estructura, i)
+
+    async def consumir(destino: list) -> None:
+        while True:
+            try:
+                destino.append(await sacar(estructura))
+            except IndexError:
+                return
+
+    tareas = [asyncio.create_task(consumir(destino)) for destino in recibidos]
+    await asyncio.gather(*(producir(i) for i in range(productores)))
+    cerrado = cerrar(estructura)
+    if asyncio.iscoroutine(cerrado):
+        await cerrado
+    await asyncio.gather(*tareas)
+    todos = sorted(chain.from_iterable(recibidos))
+    assert todos == list(range(productores * por_productor)), "Se perdieron o repitieron elementos"
+
+
+async def _sacar_de_asyncio(cola: asyncio.Queue):
+    elemento = await cola.get()
+    if elemento is None:
+        cola.put_nowait(None)
+        raise IndexError
+    return elemento
+
+
+async def _cerrar_asyncio(cola: asyncio.Queue) -> None:
+    await cola.put(None)
+
+
+def benchmark_concurrentes() -> None:
+    productores, consumidores, por_productor = 4, 4, 50_000
+    total = productores * por_productor
+    print(f"{productores} productores y {consumidores} consumidores, {total} elementos, capacidad 1.000")
+
+    def con_hilos(descripcion: str, crear: Callable, poner: Callable, sacar: Callable, cerrar: Callable) -> None:
+        tiempo = medir(descripcion, lambda: productores_y_consumidores(
+            crear(), poner, sacar, cerrar, productores, consumidores, por_productor))
+        print(f"  {'':<50} {total / tiempo:12,.0f} elementos/s")
+
+    con_hilos("ColaConcurrente (hilos)", lambda: ColaConcurrente(1_000),
+              ColaConcurrente.encolar, ColaConcurrente.desencolar, ColaConcurrente.cerrar)
+    con_hilos("PilaConcurrente (hilos)", lambda: PilaConcurrente(1_000),
+              PilaConcurrente.apilar, PilaConcurrente.desapilar, PilaConcurrente.cerrar)
+    con_hilos("queue.Queue (hilos, referencia)", lambda: queue.Queue(1_000),
+              queue.Queue.put, _sacar_de_queue, lambda cola: cola.put(None))
+
+    def con_tareas(descripcion: str, crear: Callable, poner: Callable, sacar: Callable, cerrar: Callable) -> None:
+        tiempo = medir(descripcion, lambda: asyncio.run(productores_y_consumidores_asincronos(
+            crear(), poner, sacar, cerrar, productores, consumidores, por_productor)))
+        print(f"  {'':<50} {total / tiempo:12,.0f} elementos/s")
+
+    con_tareas("ColaAsincrona (asyncio)", lambda: ColaAsincrona(1_000),
+               ColaAsincrona.encolar, ColaAsincrona.desencolar, ColaAsincrona.cerrar)
+    con_tareas("asyncio.Queue (referencia)", lambda: asyncio.Queue(1_000),
+               asyncio.Queue.put, _sacar_de_asyncio, _cerrar_asyncio)
+
+
+
+def crear_arbol_recursivo(lista: Lista, posicion: int = 0) -> NodoArbin:
+    """
+    La versión anterior de crear_arbol_de_lista: una llamada por nodo y acceso por posición
+    """
+    if posicion >= lista.tam:
+        return None
+    return NodoArbin(lista[posicion], crear_arbol_recursivo(lista, 2 * posicion + 1),
+                     crear_arbol_recursivo(lista, 2 * posicion + 2))
+
+
+def inorden_recursivo(arbol: NodoArbin) -> list:
+    if arbol is None:
+        return []
+    return inorden_recursivo(arbol.izq) + [arbol.info] + inorden_recursivo(arbol.der)
+
+
+def altura_recursiva(arbol: NodoArbin) -> int:
+    return 0 if arbol is None else 1 + max(altura_recursiva(arbol.izq), altura_recursiva(arbol.der))
+
+
+def benchmark_arboles() -> None:
+    lista = Lista.desde_iterable(range(300_000))
+    medir("crear_arbol_de_lista recursivo, 300.000 nodos (anterior)", lambda: crear_arbol_recursivo(lista))
+    medir("crear_arbol_de_lista iterativo, 300.000 nodos", lambda: crear_arbol_de_lista(lista), 3)
+    arbol = crear_arbol_de_lista(lista)
+    medir("inorden recursivo (anterior)", lambda: inorden_recursivo(arbol))
+    for recorrido in (preorden, inorden, postorden, por_niveles):
+        medir(f"{recorrido.__name__} iterativo", lambda: sum(1 for _ in recorrido(arbol)), 3)
+    medir("altura recursiva (anterior)", lambda: altura_recursiva(arbol))
+    for ayudante in (altura_arbol, tam_arbol, hojas_arbol):
+        medir(ayudante.__name__, lambda: ayudante(arbol), 3)
+    # Un árbol degenerado (una sola rama) es donde la recursión falla
+    raiz = None
+    for i in range(1_000_000):
+        raiz = NodoArbin(i, raiz)
+    try:
+        altura_recursiva(raiz)
+    except RecursionError:
+        print("  altura recursiva de una rama de 1.000.000 nodos: RecursionError")
+    medir("altura_arbol de una rama de 1.000.000 nodos", lambda: altura_arbol(raiz))
+    medir("postorden de una rama de 1.000.000 nodos", lambda: sum(1 for _ in postorden(raiz)))
+
+
+# ---------------------------------------------------------------------
+
+BENCHMARKS = {
+    "ordenar": benchmark_ordenar,
+    "comparadores": benchmark_comparadores,
+    "consultas": benchmark_consultas,
+    "tabla_columnar": benchmark_tabla_columnar,
+    "vistas": benchmark_vistas,
+    "indices": benchmark_indices,
+    "iteracion": benchmark_iteracion,
+    "estadisticas": benchmark_estadisticas,
+    "agrupar": benchmark_agrupar,
+    "seleccion": benchmark_seleccion,
+    "paralelo": benchmark_paralelo,
+    "lista_ordenada": benchmark_lista_ordenada,
+    "unir": benchmark_unir,
+    "ordenar_externo": benchmark_ordenar_externo,
+    "escritura": benchmark_escritura,
+    "instantaneas": benchmark_instantaneas,
+    "colas": benchmark_colas,
+    "compactos": benchmark_compactos,
+    "numericas": benchmark_numericas,
+    "pilas": benchmark_pilas,
+    "pilas_persistentes": benchmark_pilas_persistentes,
+    "expresiones": benchmark_expresiones,
+    "delimitadores": benchmark_delimitadores,
+    "concurrentes": benchmark_concurrentes,
+    "arboles": benchmark_arboles,
+}
+
+
+if __name__ == '__main__':
+    nombres = sys.argv[1:] or list(BENCHMARKS)
+    for nombre in nombres:
+        BENCHMARKS[nombre]()
+        print()
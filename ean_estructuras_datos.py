@@ -9,12 +9,35 @@
 # Fecha: Feb 11, 2025
 # Versión: 0.0.1 -> 11 de febrero de 2025
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import asyncio
+import codecs
+import csv
+import heapq
+import io
+import json
 import math
+import numbers
+import operator
+import os
+import pickle
+import random
+import re
+import tempfile
+import threading
+import time
+import weakref
 from math import sqrt
 # Definición de los tipos genéricos que usaremos
 from typing import TypeVar, Generic, List, Optional, Any
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import cmp_to_key, lru_cache, reduce
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice, repeat
+from operator import attrgetter, itemgetter, methodcaller
 
 
 T = TypeVar('T')
@@ -34,6 +57,126 @@ class Lista(Generic[T]):
         Constructor de la clase. Crea una lista vacía
         """
         self.__datos = []
+        # Cuántas listas y vistas comparten los datos. Si hay más de una, antes
+        # de modificar la lista se hace una copia propia (copia al escribir).
+        self.__referencias = [1]
+        # Devuelve la referencia compartida cuando la lista se separa o se destruye
+        self.__soltar = None
+        # Aumenta cada vez que la lista se modifica
+        self.__version = 0
+        # Índices hash por atributo, creados con crear_indice
+        self.__indices = {}
+
+
+    @property
+    def version(self) -> int:
+        """
+        Un número que aumenta cada vez que la lista se modifica. Sirve para
+        saber si la lista cambió desde la última vez que se revisó.
+        """
+        return self.__version
+
+
+    def instantanea(self) -> 'Lista[T]':
+        """
+        Obtiene una copia de la lista en O(1). Las dos listas comparten los datos
+        hasta que alguna de ellas se modifica; solo entonces la que cambia hace
+        su propia copia (copia al escribir). Si la copia se descarta sin
+        modificarse, la lista original vuelve a ser la única dueña de sus datos
+        y puede modificarlos sin copiarlos. Los índices no se copian.
+        :return: la copia de la lista
+        """
+        copia = Lista[T]()
+        copia.__datos = self.__datos
+        self.__compartir()
+        copia.__referencias = self.__referencias
+        copia.__soltar = weakref.finalize(copia, _soltar_referencia, self.__referencias)
+        return copia
+
+
+    def __copy__(self) -> 'Lista[T]':
+        """
+        Permite usar copy.copy(lista); es lo mismo que lista.instantanea()
+        """
+        return self.instantanea()
+
+
+    def __getstate__(self) -> dict:
+        """
+        Permite usar pickle y copy.deepcopy con la lista. El contador de
+        referencias y el finalizador no se guardan: la lista que se obtiene es la
+        única dueña de sus datos, aunque la original los comparta con otras.
+        """
+        estado = self.__dict__.copy()
+        del estado['_Lista__referencias'], estado['_Lista__soltar']
+        if self.__referencias[0] > 1:
+            # Otra lista serializada junto con esta no debe quedar con los mismos datos
+            estado['_Lista__datos'] = list(self.__datos)
+        return estado
+
+
+    def __setstate__(self, estado: dict) -> None:
+        self.__dict__.update(estado)
+        self.__referencias = [1]
+        self.__soltar = None
+
+
+    def __compartir(self) -> None:
+        """
+        Cuenta una lista o vista más que comparte los datos. Desde ese momento
+        esta lista también devuelve su referencia al separarse o al destruirse,
+        para que la última que quede pueda modificar los datos sin copiarlos.
+        """
+        self.__referencias[0] += 1
+        if self.__soltar is None:
+            self.__soltar = weakref.finalize(self, _soltar_referencia, self.__referencias)
+
+
+    def _datos(self) -> Sequence[T]:
+        """
+        Los elementos de la lista, para leerlos sin modificarlos. Los métodos que
+        solo consultan la lista los usan; una subclase que guarda sus elementos de
+        otra forma, como VistaLista, lo redefine para no tener que copiarlos.
+        """
+        return self.__datos
+
+
+    def _preparar_cambio(self) -> None:
+        """
+        Se llama antes de modificar los datos. Si se comparten con otras listas
+        o vistas, primero se hace una copia propia (copia al escribir).
+        """
+        if self.__referencias[0] > 1:
+            self.__separar()
+
+
+    def _reemplazar_datos(self, datos: list) -> None:
+        """
+        Devuelve la referencia a los datos compartidos, si los hay, y se queda con datos propios
+        :param datos: los nuevos datos, que no se comparten con ninguna otra lista
+        """
+        if self.__soltar is not None:
+            self.__soltar()
+            self.__soltar = None
+        self.__datos = datos
+        self.__referencias = [1]
+
+
+    def __separar(self) -> None:
+        """
+        Hace una copia propia de los datos, para no modificar las vistas que los comparten
+        """
+        self._reemplazar_datos(list(self.__datos))
+
+
+    def _vista(self, porcion: slice) -> 'VistaLista[T]':
+        """
+        Crea una vista de la porción de la lista, sin copiar los elementos
+        :param porcion: la porción de la lista, como en lista[inicio:fin:paso]
+        :return: la vista con los elementos de la porción
+        """
+        self.__compartir()
+        return VistaLista(self.__datos, range(len(self.__datos))[porcion], self.__referencias)
 
 
     # Propiedad que define el tamaño de la lista
@@ -48,6 +191,10 @@ class Lista(Generic[T]):
         :param elem: El elemento que vamos a agregar
         :return: None
         """
+        self._preparar_cambio()
+        self.__version += 1
+        if self.__indices:
+            self.__indexar_nuevo(elem, len(self.__datos))
         self.__datos.append(elem)
 
 
@@ -58,6 +205,11 @@ class Lista(Generic[T]):
         :param indice: la posición o índice del elemento que vamos a agregar
         :return: None
         """
+        self._preparar_cambio()
+        self.__version += 1
+        if self.__indices:
+            self.__verificar_unicos(elem)
+            self.__invalidar_indices()
         self.__datos.insert(indice, elem)
 
 
@@ -67,6 +219,11 @@ class Lista(Generic[T]):
         :param elem: el elemento que vamos a agregar
         :return: None
         """
+        self._preparar_cambio()
+        self.__version += 1
+        if self.__indices:
+            self.__verificar_unicos(elem)
+            self.__invalidar_indices()
         self.__datos.insert(0, elem)
 
 
@@ -76,17 +233,24 @@ class Lista(Generic[T]):
         :param indice: La posición o índice del elemento que vamos a eliminar
         :return: None
         """
-        tamx = len(self.__datos)
+        tamx = self.tam
         if -tamx <= indice < tamx:
+            self._preparar_cambio()
+            self.__version += 1
+            self.__invalidar_indices()
             self.__datos.pop(indice)
 
 
-    def __getitem__(self, indice: int) -> T:
+    def __getitem__(self, indice: int | slice) -> T:
         """
-        Permite obtener el elemento que se encuentra en el indice dado
-        :param indice: la posición en la lista
+        Permite obtener el elemento que se encuentra en el indice dado.
+        Si se recibe una porción, como lista[1:], se obtiene una vista
+        de esos elementos sin copiarlos.
+        :param indice: la posición en la lista, o una porción de la lista
         :return: el elemento en el indice indicado
         """
+        if isinstance(indice, slice):
+            return self._vista(indice)
         tamx = len(self.__datos)
         if -tamx <= indice < tamx:
             return self.__datos[indice]
@@ -101,8 +265,12 @@ class Lista(Generic[T]):
         :param elem: el elemento que vamos a guardar en la lista
         :return: None
         """
-        tamx = len(self.__datos)
+        tamx = self.tam
         if -tamx <= indice < tamx:
+            self._preparar_cambio()
+            self.__version += 1
+            if self.__indices:
+                self.__reindexar(self.__datos[indice], elem, indice % tamx)
             self.__datos[indice] = elem
 
 
@@ -115,20 +283,88 @@ class Lista(Generic[T]):
         return range(self.tam)
 
 
+    @staticmethod
+    def desde_iterable(elementos: Iterable[T]) -> 'Lista[T]':
+        """
+        Crea una lista con todos los elementos del iterable, en una sola operación
+        :param elementos: cualquier iterable: una lista de Python, una tupla, un generador, otra Lista...
+        :return: la nueva lista con los elementos
+        """
+        resultado = Lista[T]()
+        resultado.__datos = list(elementos)
+        return resultado
+
+
+    def extender(self, elementos: Iterable[T]) -> None:
+        """
+        Agrega al final de la lista todos los elementos del iterable
+        :param elementos: los elementos que vamos a agregar
+        :return: None
+        """
+        if elementos is self:
+            elementos = list(self._datos())
+        if self.__indices:
+            for elem in elementos:
+                self.agregar(elem)
+            return
+        self._preparar_cambio()
+        self.__version += 1
+        self.__datos.extend(elementos)
+
+
+    def __len__(self) -> int:
+        """
+        Permite usar len(lista). Es lo mismo que lista.tam
+        """
+        return len(self.__datos)
+
+
+    def __bool__(self) -> bool:
+        """
+        Permite usar la lista en una condición, como if lista:
+        Una lista vacía es falsa, como las listas de Python. Antes de que
+        existiera __len__ toda lista era verdadera, aunque estuviera vacía;
+        para revisar si hay elementos es más claro usar lista.vacia
+        """
+        return not self.vacia
+
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Permite recorrer la lista con for elemento in lista
+        """
+        return iter(self.__datos)
+
+
+    def __reversed__(self) -> Iterator[T]:
+        """
+        Permite recorrer la lista del último al primero con reversed(lista)
+        """
+        return reversed(self.__datos)
+
+
+    def __contains__(self, elemento: T) -> bool:
+        """
+        Permite usar elemento in lista
+        """
+        return elemento in self._datos()
+
+
     def __str__(self) -> str:
         """
         Permite obtener una representación como String de la lista
         :return: la lista guardada como un string
         """
-        resultado = 'Lista['
-        n = 1
-        for elemento in self.__datos:
-            resultado += str(elemento)
-            if n < len(self.__datos):
-                resultado += ', '
-            n += 1
-        resultado += ']'
-        return resultado
+        return 'Lista[' + ', '.join(map(str, self)) + ']'
+
+
+    def __repr__(self) -> str:
+        """
+        Representación abreviada de la lista: muestra como máximo LIMITE_REPR
+        elementos, para que imprimirla en un log no sea costoso
+        :return: la representación de la lista
+        """
+        return _repr_limitado('Lista', iter(self), len(self))
 
 
     def contiene_elemento(self, elemento: T) -> bool:
@@ -137,7 +373,7 @@ class Lista(Generic[T]):
         :param elemento: el elemento a buscar
         :return: True si el elemento está en la lista. False si no
         """
-        return elemento in self.__datos
+        return elemento in self._datos()
 
 
     def indice_elemento(self, elemento: T) -> int | None:
@@ -192,7 +428,13 @@ class Lista(Generic[T]):
         Elimina todos los elementos de la lista, dejándola vacía
         :return: None
         """
-        self.__datos.clear()
+        if self.__referencias[0] > 1:
+            self._reemplazar_datos([])
+        else:
+            self.__datos.clear()
+        self.__version += 1
+        for indice in self.__indices.values():
+            indice.vaciar()
 
 
     def __eq__(self, otra_lista) -> bool:
@@ -202,7 +444,10 @@ class Lista(Generic[T]):
         :return: True si son iguales, False si no
         """
         if isinstance(otra_lista, Lista):
-            return self.__datos == otra_lista.__datos
+            datos, otros = self._datos(), otra_lista._datos()
+            if isinstance(datos, list) and isinstance(otros, list):
+                return datos == otros
+            return len(datos) == len(otros) and all(a is b or a == b for a, b in zip(datos, otros))
         else:
             return False
 
@@ -214,7 +459,7 @@ class Lista(Generic[T]):
         :param accion: la operación a realizar sobre cada elemento de la lista
         :return: la lista original
         """
-        for elemento in self.__datos:
+        for elemento in self._datos():
             accion(elemento)
         return self
 
@@ -225,23 +470,24 @@ class Lista(Generic[T]):
         :param predicado: una función que devuelve True si el elemento cumple con el predicado
         :return: la lista de los elementos que cumplen con el predicado
         """
-        resultado = Lista[T]()
-        for elemento in self.__datos:
-            if predicado(elemento):
-                resultado.agregar(elemento)
-        return resultado
+        return Lista.desde_iterable(filter(predicado, self._datos()))
 
 
-    def seleccionar(self, selector: Callable[..., R]) -> 'Lista[R]':
+    def seleccionar(self, selector: Callable[..., R], numerica: bool = False) -> 'Lista[R]':
         """
         Por cada elemento de la lista, aplica el selector y lo agrega a la lista de resultados
         :param selector: la operación a realizar sobre cada elemento de la lista
+        :param numerica: si es True y todos los resultados son números (sin contar los booleanos),
+                         se retorna una ListaNumerica
         :return: la lista conteniendo la aplicación del selector a cada elemento de la lista
         """
-        resultado = Lista[R]()
-        for elemento in self.__datos:
-            resultado.agregar(selector(elemento))
-        return resultado
+        datos = self._datos()
+        if not numerica:
+            return Lista.desde_iterable(map(selector, datos))
+        valores = list(map(selector, datos))
+        if all(map(_es_numero, valores)):
+            return ListaNumerica(valores)
+        return Lista.desde_iterable(valores)
 
 
     def transformar(self, selector: Callable[..., R]) -> 'Lista[R]':
@@ -250,10 +496,7 @@ class Lista(Generic[T]):
         :param selector: la operación a realizar sobre cada elemento de la lista
         :return: la lista conteniendo la aplicación del selector a cada elemento de la lista
         """
-        resultado = Lista[R]()
-        for elemento in self.__datos:
-            resultado.agregar(selector(elemento))
-        return resultado
+        return Lista.desde_iterable(map(selector, self._datos()))
 
 
     def acumular(self, valor_inicial: R, operacion: Callable[..., R]) -> R:
@@ -266,7 +509,7 @@ class Lista(Generic[T]):
         :return: el último valor del acumulador
         """
         acumulador = valor_inicial
-        for elemento in self.__datos:
+        for elemento in self._datos():
             acumulador = operacion(acumulador, elemento)
         return acumulador
 
@@ -280,15 +523,14 @@ class Lista(Generic[T]):
         Halla la suma de todos los elementos de la lista
         :return: la suma de los elementos de la lista
         """
-        if len(self.__datos) == 0:
+        datos = self._datos()
+        if len(datos) == 0:
             return 0.0
         if selector is None:
             def selector(elemento):
                 return elemento
-        n = len(self.__datos)
         suma = 0.0
-        for i in range(n):
-            elemento = selector(self.__datos[i])
+        for elemento in map(selector, datos):
             if type(elemento) == int or type(elemento) == float:
                 suma += elemento
             else:
@@ -302,7 +544,7 @@ class Lista(Generic[T]):
         :param predicado: el predicado a aplicar a cada elemento de la lista
         :return: el primer elemento de la lista que cumple con el predicado o None si no hay ninguno
         """
-        for elemento in self.__datos:
+        for elemento in self._datos():
             if predicado(elemento):
                 return elemento
         return None
@@ -314,7 +556,7 @@ class Lista(Generic[T]):
         :param predicado: el predicado a aplicar a cada elemento de la lista
         :return: el último elemento de la lista que cumple con el predicado o None si no hay ninguno
         """
-        for elemento in reversed(self.__datos):
+        for elemento in reversed(self._datos()):
             if predicado(elemento):
                 return elemento
         return None
@@ -326,8 +568,8 @@ class Lista(Generic[T]):
         :param predicado: el predicado a aplicar a cada elemento de la lista
         :return: la posición del primer elemento de la lista que cumple con el predicado o None si no hay ninguno
         """
-        for i in self.indices:
-            if predicado(self.__datos[i]):
+        for i, elemento in enumerate(self._datos()):
+            if predicado(elemento):
                 return i
         return None
 
@@ -339,8 +581,8 @@ class Lista(Generic[T]):
         :return: la posición del último elemento de la lista que cumple con el predicado o None si no hay ninguno
         """
         pos_ultimo = None
-        for i in self.indices:
-            if predicado(self.__datos[i]):
+        for i, elemento in enumerate(self._datos()):
+            if predicado(elemento):
                 pos_ultimo = i
         return pos_ultimo
 
@@ -350,16 +592,13 @@ class Lista(Generic[T]):
         Obtiene el mayor elemento de la lista
         :return: el elemento más grande de la lista. El objeto debe tener definido el operador <
         """
-        if len(self.__datos) == 0:
+        datos = self._datos()
+        if len(datos) == 0:
             return None
         if menor_que is None:
-            if atributo is None:
-                def menor_que(elemento1: T, elemento2: T) -> bool:
-                    return elemento1 < elemento2
-            else:
-                menor_que = lambda e1, e2: es_menor_que(e1, e2, atributo)
-        mayor = self.__datos[0]
-        for elemento in self.__datos:
+            return max(datos, key=self.__clave(None, atributo))
+        mayor = datos[0]
+        for elemento in datos:
             if menor_que(mayor, elemento):
                 mayor = elemento
         return mayor
@@ -370,22 +609,81 @@ class Lista(Generic[T]):
         Obtiene y retorna el menor elemento de la lista
         :return: el elemento más pequeño de la lista. El objeto debe tener definido el operador <
         """
-        if len(self.__datos) == 0:
+        datos = self._datos()
+        if len(datos) == 0:
             return None
         if menor_que is None:
-            if atributo is None:
-                def menor_que(elemento1: T, elemento2: T) -> bool:
-                    return elemento1 < elemento2
-            else:
-                menor_que = lambda x, y: es_menor_que(x, y, atributo)
-        menor = self.__datos[0]
-        for elemento in self.__datos:
+            return min(datos, key=self.__clave(None, atributo))
+        menor = datos[0]
+        for elemento in datos:
             if menor_que(elemento, menor):
                 menor = elemento
         return menor
 
 
 
+    def mayores(self, k: int, menor_que: Callable[..., bool] = None, atributo: str = None) -> 'Lista[T]':
+        """
+        Obtiene los k elementos más grandes de la lista, sin ordenarla toda.
+        Usa un montículo de tamaño k, así que toma O(n log k).
+        :param k: la cantidad de elementos
+        :param menor_que: indica el criterio de comparación de los elementos de la lista
+        :param atributo: los atributos usados como criterio de comparación
+        :return: la lista con los k mayores, del más grande al más pequeño
+        """
+        return Lista.desde_iterable(heapq.nlargest(k, self._datos(), key=self.__clave(menor_que, atributo)))
+
+
+    def menores(self, k: int, menor_que: Callable[..., bool] = None, atributo: str = None) -> 'Lista[T]':
+        """
+        Obtiene los k elementos más pequeños de la lista, sin ordenarla toda.
+        Usa un montículo de tamaño k, así que toma O(n log k).
+        :param k: la cantidad de elementos
+        :param menor_que: indica el criterio de comparación de los elementos de la lista
+        :param atributo: los atributos usados como criterio de comparación
+        :return: la lista con los k menores, del más pequeño al más grande
+        """
+        return Lista.desde_iterable(heapq.nsmallest(k, self._datos(), key=self.__clave(menor_que, atributo)))
+
+
+    def k_esimo(self, k: int, menor_que: Callable[..., bool] = None, atributo: str = None) -> Optional[T]:
+        """
+        Obtiene el elemento que quedaría en la posición k si la lista estuviera ordenada,
+        sin ordenarla. Usa selección rápida (introselect), que toma O(n) en promedio.
+        :param k: la posición, empezando en cero. Las posiciones negativas cuentan desde el final
+        :param menor_que: indica el criterio de comparación de los elementos de la lista
+        :param atributo: los atributos usados como criterio de comparación
+        :return: el elemento, o None si la posición está fuera de la lista
+        """
+        datos = self._datos()
+        n = len(datos)
+        if not -n <= k < n:
+            return None
+        clave = self.__clave(menor_que, atributo)
+        claves = datos if clave is None else list(map(clave, datos))
+        return datos[_seleccionar(claves, k % n)]
+
+
+    def mediana(self, menor_que: Callable[..., bool] = None, atributo: str = None) -> Optional[T | float]:
+        """
+        Obtiene la mediana de la lista en O(n) promedio. Si la lista es de números, no hay
+        criterio de comparación y la cantidad es par, retorna el promedio de los dos del medio;
+        en otro caso retorna el elemento del medio (el menor de los dos si la cantidad es par).
+        :param menor_que: indica el criterio de comparación de los elementos de la lista
+        :param atributo: los atributos usados como criterio de comparación
+        :return: la mediana, o None si la lista está vacía
+        """
+        n = len(self._datos())
+        if n == 0:
+            return None
+        medio = self.k_esimo((n - 1) // 2, menor_que, atributo)
+        if n % 2 == 0 and menor_que is None and atributo is None and _es_numero(medio):
+            siguiente = self.k_esimo(n // 2)
+            if _es_numero(siguiente):
+                return (medio + siguiente) / 2
+        return medio
+
+
     def promedio(self, selector: Callable[..., R] = None) -> float:
         """
         Halla el promedio de los elementos de la lista de acuerdo al selector escogido
@@ -393,15 +691,15 @@ class Lista(Generic[T]):
                          tomará el valor del elemento.
         :return: el promedio de los elementos de la lista
         """
-        if len(self.__datos) == 0:
+        datos = self._datos()
+        if len(datos) == 0:
             return 0.0
         if selector is None:
             def selector(elemento):
                 return elemento
-        n = len(self.__datos)
+        n = len(datos)
         suma = 0.0
-        for i in range(n):
-            elemento = selector(self.__datos[i])
+        for elemento in map(selector, datos):
             if type(elemento) == int or type(elemento) == float:
                 suma += elemento
             else:
@@ -419,7 +717,7 @@ class Lista(Generic[T]):
             return self.tam
 
         cont = 0
-        for elemento in self.__datos:
+        for elemento in self._datos():
             if predicado(elemento):
                 cont += 1
         return cont
@@ -431,793 +729,4922 @@ class Lista(Generic[T]):
         :param predicado: el predicado a aplicar a cada elemento de la lista
         :return: el porcentaje de elementos que cumplen con el predicado
         """
+        datos = self._datos()
         if predicado is None:
             return 100.0
 
         cont = 0
-        for elemento in self.__datos:
+        for elemento in datos:
             if predicado(elemento):
                 cont += 1
-        return 0.0 if cont == 0 else 100.0 * cont / len(self.__datos)
+        return 0.0 if cont == 0 else 100.0 * cont / len(datos)
 
 
-    def ordenar(self, menor_que: Callable[..., bool] = None, atributo: str = None) -> 'Lista[T]':
+    def ordenar(self, menor_que: Callable[..., bool] = None, atributo: str = None,
+                descendente: bool = False) -> 'Lista[T]':
         """
-        Este método ordena la lista de acuerdo a lo que indique el parámetro
+        Este método ordena la lista de acuerdo a lo que indique el parámetro.
+        El ordenamiento es estable y toma O(n log n): las claves de cada elemento
+        se calculan una sola vez antes de ordenar.
         :param menor_que: indica el criterio de comparación de los elementos de la lista.
+        :param atributo: los atributos usados como criterio, por ejemplo "estrato, -edad".
+                         Un '-' antes del nombre ordena ese atributo de mayor a menor.
+        :param descendente: True si se quiere la lista ordenada de mayor a menor
         :return: la nueva lista ordenada, por el criterio dado.
         """
-        lista = copiar_lista(self)
-        if menor_que is None:
-            if atributo is None:
-                def menor_que(elemento1: T, elemento2: T) -> bool:
-                    return elemento1 < elemento2
-            else:
-                menor_que = lambda x, y: es_menor_que(x, y, atributo)
+        resultado = Lista[T]()
+        resultado.__datos = sorted(self._datos(), key=self.__clave(menor_que, atributo), reverse=descendente)
+        return resultado
+
+
+    def ordenar_en_sitio(self, menor_que: Callable[..., bool] = None, atributo: str = None,
+                         descendente: bool = False) -> None:
+        """
+        Ordena la misma lista, sin crear una copia, de acuerdo a lo que indiquen los parámetros
+        :param menor_que: indica el criterio de comparación de los elementos de la lista.
+        :param atributo: los atributos usados como criterio, por ejemplo "estrato, -edad".
+        :param descendente: True si se quiere la lista ordenada de mayor a menor
+        :return: None
+        """
+        self._preparar_cambio()
+        self.__version += 1
+        self.__invalidar_indices()
+        self.__datos.sort(key=self.__clave(menor_que, atributo), reverse=descendente)
 
-        for i in range(lista.tam - 1):
-            for j in range(i + 1, lista.tam):
-                if menor_que(lista[j], lista[i]):
-                    lista[i], lista[j] = lista[j], lista[i]
 
-        return lista
+    def __clave(self, menor_que: Callable[..., bool], atributo: Optional[str]) -> Optional[Callable[[T], Any]]:
+        """
+        Obtiene la función clave de los criterios, compilando los atributos con el primer elemento
+        """
+        datos = self._datos()
+        muestra = datos[0] if len(datos) > 0 else None
+        return clave_de_orden(menor_que, atributo, muestra)
 
 
     def invertir(self) -> 'Lista[T]':
-        resultado = Lista[T]()
-        for indice in range(self.tam):
-            elemento = self.__datos[indice]
-            resultado.insertar_al_principio(elemento)
-        return resultado
+        """
+        Obtiene la lista con los elementos en orden inverso. El resultado es
+        una VistaLista (una subclase de Lista) que comparte los datos, así que
+        toma O(1). Es independiente de esta lista: si alguna de las dos se
+        modifica, la otra no cambia. Antes se retornaba una Lista nueva, así
+        que type(resultado) ya no es Lista; use isinstance(resultado, Lista).
+        :return: una VistaLista con los elementos en orden inverso
+        """
+        return self._vista(slice(None, None, -1))
 
 
-# ---------------------------------------------------------------------
+    # Índices hash
 
-def concatenar_listas(lista1: Lista[T], lista2: Lista[T]) -> Lista[T]:
-    """
-    Une dos listas, anexando los elementos de la lista2 al final de la lista1
-    :param lista1: La lista a la izquierda
-    :param lista2: La lista a la derecha
-    :return: una lista con los elementos de la lista1 y la lista2
-    """
-    resultado = Lista[T]()
-    for i in lista1.indices:
-        elemento = lista1[i]
-        resultado.agregar(elemento)
+    def crear_indice(self, atributo: str, unico: bool = False) -> None:
+        """
+        Crea un índice hash por el atributo dado, para que las búsquedas con
+        buscar_por, buscar_todos_por y posicion_por tomen O(1). El índice se
+        mantiene al día cuando la lista se modifica.
+        :param atributo: los atributos que forman la clave, por ejemplo "cedula" o "departamento, nombre"
+        :param unico: True si no puede haber dos elementos con la misma clave
+        :return: None
+        """
+        datos = self._datos()
+        muestra = datos[0] if len(datos) > 0 else None
+        comparador = compilar_atributos(atributo) if muestra is None else comparador_para(atributo, muestra)
+        if any(desc for _, _, _, desc in comparador.campos):
+            raise ValueError(f"Un índice no puede tener atributos descendentes: '{atributo}'")
+        indice = _IndiceHash(comparador.clave, unico)
+        indice.construir(datos)
+        self.__indices[_normalizar_atributos(atributo)] = indice
 
-    for i in lista2.indices:
-        elemento = lista2[i]
-        resultado.agregar(elemento)
 
-    return resultado
+    def eliminar_indice(self, atributo: str) -> None:
+        """
+        Elimina el índice creado por el atributo dado, si existe
+        :param atributo: los atributos con los que se creó el índice
+        :return: None
+        """
+        self.__indices.pop(_normalizar_atributos(atributo), None)
 
 
-def crear_lista(*elementos: T) -> Lista[T]:
-    """
-    Permite crear una lista con los elementos recibidos como parámetro
-    :param elementos: los datos a guardar en la lista
-    :return: La nueva lista con los elementos recibidos
-    """
-    resultado = Lista[T]()
-    for elemento in elementos:
-        resultado.agregar(elemento)
-    return resultado
+    def tiene_indice(self, atributo: str) -> bool:
+        """
+        Permite saber si la lista tiene un índice por el atributo dado
+        :param atributo: los atributos con los que se creó el índice
+        :return: True si el índice existe
+        """
+        return _normalizar_atributos(atributo) in self.__indices
 
 
-def resto_lista(lista_original: Lista[T]) -> Lista[T]:
-    """
-    Retorna una nueva lista equivalente a la lista que se recibe como
-    parámetro, pero sin el primer elemento. Usado en recursiones.
-    :param lista_original: la lista con la que trabajamos
-    :return: la misma lista, pero sin el primer elemento
-    """
-    resultado = Lista[T]()
-    for indice in lista_original.indices:
-        if indice >= 1:
-            resultado.agregar(lista_original[indice])
-    return resultado
+    def __indice(self, atributo: str) -> Optional['_IndiceHash']:
+        indice = self.__indices.get(_normalizar_atributos(atributo))
+        if indice is not None and not indice.valido:
+            indice.construir(self._datos())
+        return indice
 
 
-def copiar_lista(lista: Lista[T], inicio = 0, fin = None) -> Lista[T]:
-    """
-    Obtiene una copia idéntica de la lista que se recibe como
-    parámetro.
-    :param lista: la lista con la que trabajamos
-    :return: una copia de la lista
-    """
-    resultado = Lista[T]()
-    ini = inicio
-    final = lista.tam if fin is None else fin
-    if ini >= final:
-        raise "Imposible realizar la copia"
-    for indice in range(ini, final):
-        elemento = lista[indice]
-        resultado.agregar(elemento)
-    return resultado
+    def __invalidar_indices(self) -> None:
+        for indice in self.__indices.values():
+            indice.valido = False
 
-# ---------------------------------------------------------------------
 
-class Node(Generic[T]):
-    """"
-    Este es un nodo de la lista que se usará para guardar datos en la pila
-    """
-    def __init__(self, value: T):
-        self.info = value
-        self.siguiente = None
+    def __verificar_unicos(self, elem: T) -> None:
+        for indice in self.__indices.values():
+            if indice.unico:
+                if not indice.valido:
+                    indice.construir(self._datos())
+                indice.verificar(elem)
 
 
-class Pila(Generic[T]):
-    """
-    Una pila es una estructura de datos que sigue la filosofía de
-    LIFO, el primero que entra es el último en salir.
-    """
+    def __indexar_nuevo(self, elem: T, posicion: int) -> None:
+        self.__verificar_unicos(elem)
+        for indice in self.__indices.values():
+            if indice.valido:
+                indice.agregar(elem, posicion)
 
-    # Constructor
-    def __init__(self):
-        self.__cabeza = None
 
-    # Agregar un elemento
-    def apilar(self, elem: T) -> None:
-        nodo = Node(elem)
-        nodo.siguiente = self.__cabeza
-        self.__cabeza = nodo
+    def __reindexar(self, anterior: T, nuevo: T, posicion: int) -> None:
+        for indice in self.__indices.values():
+            if indice.valido:
+                indice.reemplazar(anterior, nuevo, posicion)
 
 
-    # Elimina el primer elemento de la pila
-    def desapilar(self) -> None:
-        if self.__cabeza is None:
-            raise IndexError
-        self.__cabeza = self.__cabeza.siguiente
+    def posiciones_por(self, atributo: str, valor: Any) -> List[int]:
+        """
+        Obtiene las posiciones de los elementos cuyo atributo tiene el valor dado.
+        Si hay un índice por el atributo lo usa; si no, recorre la lista.
+        :param atributo: los atributos de la clave, por ejemplo "cedula"
+        :param valor: el valor buscado. Si la clave tiene varios atributos, es una tupla
+        :return: las posiciones en orden ascendente
+        """
+        indice = self.__indice(atributo)
+        if indice is not None:
+            return indice.posiciones(valor)
+        datos = self._datos()
+        if len(datos) == 0:
+            return []
+        clave = comparador_para(atributo, datos[0]).clave
+        return [i for i, elemento in enumerate(datos) if clave(elemento) == valor]
 
 
-    # Obtiene el primer elemento de la pila
-    @property
-    def tope(self) -> T:
-        if self.__cabeza is None:
-            raise IndexError
-        return self.__cabeza.info
-    
+    def posicion_por(self, atributo: str, valor: Any) -> Optional[int]:
+        """
+        Obtiene la posición del primer elemento cuyo atributo tiene el valor dado
+        :param atributo: los atributos de la clave, por ejemplo "cedula"
+        :param valor: el valor buscado
+        :return: la posición del elemento, o None si no hay ninguno
+        """
+        indice = self.__indice(atributo)
+        if indice is None:
+            datos = self._datos()
+            if len(datos) == 0:
+                return None
+            clave = comparador_para(atributo, datos[0]).clave
+            for i, elemento in enumerate(datos):
+                if clave(elemento) == valor:
+                    return i
+            return None
+        posiciones = indice.posiciones(valor)
+        return posiciones[0] if posiciones else None
 
-    # Permite saber si la pila está vacía
-    @property
-    def vacia(self) -> bool:
-        return self.__cabeza is None
 
-    # Crea una copia de la pila
-    def copiar(self) -> "Pila[T]":
-        copia = Pila[T]()
-        act = self.__cabeza
-        act_copia = None
-        while act:
-            nodo = Node(act.info)
-            if copia.__cabeza is None:
-                copia.__cabeza = nodo
-                act_copia = nodo
-            else:
-                act_copia.siguiente = nodo
-                act_copia = nodo
-            act = act.siguiente
-        return copia
-    
+    def buscar_por(self, atributo: str, valor: Any) -> Optional[T]:
+        """
+        Obtiene el primer elemento cuyo atributo tiene el valor dado, por ejemplo
+        personas.buscar_por("cedula", 1020304050). Con un índice toma O(1).
+        :param atributo: los atributos de la clave
+        :param valor: el valor buscado. Si la clave tiene varios atributos, es una tupla
+        :return: el elemento, o None si no hay ninguno
+        """
+        posicion = self.posicion_por(atributo, valor)
+        return None if posicion is None else self._datos()[posicion]
 
-    # Representación como str de la pila
-    def __str__(self):
-        act = self.__cabeza
-        out = ""
-        while act:
-            out += str(act.info) + " -> "
-            act = act.siguiente
-        return out if len(out) == 0 else out[:-4]
-    
 
-# ---------------------------------------------------------------------
-def crear_pila(*elementos: T) -> Pila[T]:
-    """
-    Permite crear una pila con los elementos recibidos como parámetro
-    :param elementos: los datos a guardar en la pila
-    :return: La nueva pila con los elementos recibidos
-    """
-    resultado = Pila[T]()
-    for elemento in elementos:
-        resultado.apilar(elemento)
-    return resultado
+    def buscar_todos_por(self, atributo: str, valor: Any) -> 'Lista[T]':
+        """
+        Obtiene todos los elementos cuyo atributo tiene el valor dado
+        :param atributo: los atributos de la clave, por ejemplo "departamento"
+        :param valor: el valor buscado
+        :return: la lista de los elementos, en el orden en que están en la lista
+        """
+        return Lista.desde_iterable(map(self._datos().__getitem__, self.posiciones_por(atributo, valor)))
 
 
-# ---------------------------------------------------------------------
-import pandas as pd
-from dataclasses import dataclass
+    def estadisticas(self, selector: Callable[..., int | float] = None) -> 'Estadisticas':
+        """
+        Calcula en un solo recorrido la cantidad, suma, promedio, mínimo, máximo,
+        varianza y desviación estándar de los elementos de la lista
+        :param selector: la operación que obtiene el valor numérico de cada elemento.
+                         Si no se especifica, se toma el valor del elemento.
+        :return: las estadísticas de los valores
+        """
+        resultado = Estadisticas(selector)
+        resultado.agregar_varios(self._datos())
+        return resultado
 
-@dataclass
-class Persona:
-    """
-    Clase que representa una persona
-    """
-    __cedula: int
-    __nombre: str
-    __edad: int
-    __genero: str
-    __num_hijos: int
-    __nivel_educativo: str
-    __estrato: int
-    __ingresos: int
-    __peso: int
-    __altura: int
-    __fuma: bool
-    __usa_lentes: bool
-    __tiene_casa: bool
-    __tiene_automovil: bool
-
-    @property
-    def nombre(self) -> str:
-        return self.__nombre
-
-    @property
-    def cedula(self) -> int:
-        return self.__cedula
 
-    @property
-    def edad(self) -> int:
-        return self.__edad
+    def agrupar(self, clave: str | Callable[..., Any], **agregados: tuple) -> dict:
+        """
+        Agrupa los elementos de la lista por una clave y calcula los agregados de
+        cada grupo en un solo recorrido, usando una tabla hash. Por ejemplo:
+        municipios.agrupar("departamento", poblacion=("sumar", "poblacion_total()"))
+        :param clave: los atributos que forman la clave, como en es_menor_que
+                      ("departamento" o "año, nombre"), o una función que la calcula
+        :param agregados: cada agregado es nombre=(operacion, selector). La operación es
+                          "contar", "sumar", "promedio", "mayor", "menor", "lista" o
+                          "estadisticas". El selector es un string de atributo, una función
+                          o None para usar el elemento. En "contar" el selector, si se da,
+                          es un predicado; sin selector se cuentan todos los elementos.
+        :return: un diccionario que asocia cada clave con un diccionario de sus agregados.
+                 Siempre incluye "cantidad". Si no se piden agregados, incluye "elementos",
+                 la lista con los elementos del grupo.
+        """
+        datos = self._datos()
+        if len(datos) == 0:
+            return {}
+        muestra = datos[0]
+        if isinstance(clave, str):
+            comparador = comparador_para(clave, muestra)
+            if any(desc for _, _, _, desc in comparador.campos):
+                raise ValueError(f"Una clave de agrupación no puede tener atributos descendentes: '{clave}'")
+            clave = comparador.clave
+        if not agregados:
+            agregados = {"elementos": ("lista", None)}
+        operaciones = []
+        for nombre, (operacion, selector) in agregados.items():
+            if operacion not in _AGREGADOS:
+                raise ValueError(f"Operación de agregación desconocida: '{operacion}'")
+            if isinstance(selector, str):
+                selector = comparador_para(selector, muestra).clave
+            elif selector is None and operacion == "contar":
+                # Sin predicado se cuentan todos, también los elementos falsos como 0 o ""
+                selector = _siempre
+            operaciones.append((nombre, operacion, selector))
+
+        grupos = {}
+        for elemento in datos:
+            k = clave(elemento)
+            estado = grupos.get(k)
+            if estado is None:
+                estado = [0] + [_AGREGADOS[operacion][0]() for _, operacion, _ in operaciones]
+                grupos[k] = estado
+            estado[0] += 1
+            for i, (_, operacion, selector) in enumerate(operaciones, 1):
+                valor = elemento if selector is None else selector(elemento)
+                estado[i] = _AGREGADOS[operacion][1](estado[i], valor)
+
+        resultado = {}
+        for k, estado in grupos.items():
+            agregado = {"cantidad": estado[0]}
+            for i, (nombre, operacion, _) in enumerate(operaciones, 1):
+                agregado[nombre] = _AGREGADOS[operacion][2](estado[i])
+            resultado[k] = agregado
+        return resultado
 
-    @property
-    def genero(self) -> str:
-        return self.__genero
 
-    @property
-    def num_hijos(self) -> int:
-        return self.__num_hijos
+    def paralelo(self, trabajadores: int = None, minimo: int = 10_000) -> 'EjecutorParalelo[T]':
+        """
+        Permite ejecutar seleccionar, filtrar y acumular usando varios procesos.
+        Sirve cuando la función que se aplica a cada elemento es costosa. Las
+        funciones deben poder enviarse a otro proceso: funciones definidas con
+        def en un módulo, no lambdas. Por ejemplo:
+        with personas.paralelo(4) as p:
+            puntajes = p.seleccionar(calcular_puntaje)
+        :param trabajadores: la cantidad de procesos. Por defecto, la cantidad de núcleos
+        :param minimo: con menos elementos que este número, todo se ejecuta en este proceso
+        :return: el ejecutor paralelo sobre los elementos de la lista
+        """
+        return EjecutorParalelo(self._datos(), trabajadores, minimo)
 
-    @property
-    def nivel_educativo(self) -> str:
-        return self.__nivel_educativo
 
-    @property
-    def estrato(self) -> int:
-        return self.__estrato
+    def a_tabla_columnar(self) -> 'TablaColumnar[T]':
+        """
+        Convierte la lista de registros (objetos de una dataclass) en una tabla
+        columnar, donde las sumas, conteos y filtros se hacen con NumPy
+        :return: la tabla columnar con los registros de la lista
+        """
+        return TablaColumnar.desde_lista(self)
 
-    @property
-    def ingresos(self) -> int:
-        return self.__ingresos
 
-    @property
-    def peso(self) -> int:
-        return self.__peso
+    def consulta(self) -> 'Consulta[T]':
+        """
+        Crea una consulta perezosa sobre la lista. Las etapas de la consulta
+        se ejecutan en un solo recorrido, sin crear listas intermedias. Por ejemplo:
+        personas.consulta().filtrar(lambda p: p.fuma).seleccionar(lambda p: p.edad).promedio()
+        :return: la consulta sobre los elementos de la lista
+        """
+        return Consulta(self._datos())
 
-    @property
-    def altura(self) -> int:
-        return self.__altura
 
-    @property
-    def fuma(self) -> bool:
-        return self.__fuma
+# ---------------------------------------------------------------------
 
-    @property
-    def usa_lentes(self) -> bool:
-        return self.__usa_lentes
+def _soltar_referencia(referencias: list) -> None:
+    """
+    Descuenta una lista o vista de las que comparten unos datos. Se llama
+    cuando una de ellas se separa o se destruye.
+    """
+    referencias[0] -= 1
 
-    @property
-    def tiene_casa(self) -> bool:
-        return self.__tiene_casa
 
-    @property
-    def tiene_automovil(self) -> bool:
-        return self.__tiene_automovil
+def _normalizar_atributos(atributos: str) -> str:
+    return ",".join(atrib.strip() for atrib in atributos.split(","))
 
 
-# ---------------------------------------------
-def leer_archivo_personas() -> Lista[Persona]:
+class _IndiceHash:
     """
-    Permite crear una lista con las personas que están
-    en el archivo
-    :return: la lista con las personas
+    Índice hash de una lista. Guarda, por cada clave, la posición del elemento
+    (índice único) o las posiciones de los elementos en orden (índice múltiple).
+    Cuando las posiciones cambian por una inserción o eliminación en la mitad
+    de la lista, el índice se marca como no válido y se reconstruye en la
+    siguiente búsqueda.
     """
-    archivo = "https://github.com/luiscobo/poo/raw/refs/heads/main/people.csv"
-    df = pd.read_csv(archivo, sep=";", encoding="utf-8")
-    resultado = Lista[Persona]()
-    for index, row in df.iterrows():
-        cedula = row["Cedula"]
-        nombre = row["Nombres"].upper()
-        edad = row["Edad"]
-        genero = row["Genero"]
-        num_hijos = row["No de hijos"]
-        nivel_educativo = row["Nivel Educativo"]
-        estrato = row["Estrato Socio"]
-        ingresos = row["Ingresos"]
-        peso = row["Peso"]
-        altura = row["Talla"]
-        fuma = row["Fuma"] == "SI"
-        usa_lentes = row["Usa Lentes"] == "SI"
-        tiene_casa = row["Tiene Casa"] == "SI"
-        tiene_automovil = row["Tiene Automovil"] == "SI"
-        p = Persona(cedula, nombre, edad, genero, num_hijos, nivel_educativo, estrato, ingresos, peso, altura, fuma, usa_lentes, tiene_casa, tiene_automovil)
-        resultado.agregar(p)
-    return resultado
 
-  
-# ---------------------------------------------------------------------
-@dataclass(frozen=True)
-class Departamento:
-    """
-    Clase que representa la información de un departamento de Colombia
-    """
-    nombre: str
-    cant_municipios: int
-    capital: str
-    superficie: float
-    poblacion: int
-    densidad: float
-    indice_desarrollo_humano: float
-    fecha_creacion: int
-    region: str
+    def __init__(self, clave: Callable[[Any], Any], unico: bool):
+        self.clave = clave
+        self.unico = unico
+        self.tabla = {}
+        self.valido = False
+
+
+    def construir(self, datos: list) -> None:
+        clave = self.clave
+        tabla = {}
+        if self.unico:
+            for posicion, elemento in enumerate(datos):
+                valor = clave(elemento)
+                if valor in tabla:
+                    raise ValueError(f"El valor {valor!r} está repetido en un índice único")
+                tabla[valor] = posicion
+        else:
+            for posicion, elemento in enumerate(datos):
+                valor = clave(elemento)
+                if valor in tabla:
+                    tabla[valor].append(posicion)
+                else:
+                    tabla[valor] = [posicion]
+        self.tabla = tabla
+        self.valido = True
 
 
-# ---------------------------------------------------------------------
+    def vaciar(self) -> None:
+        self.tabla = {}
+        self.valido = True
 
-@dataclass(frozen=True)
-class EquipoFutbol:
-    """Atributos"""
-    año: int
-    nombre: str
-    partidos_ganados_local: int
-    partidos_ganados_visitante: int
-    partidos_perdidos_local: int
-    partidos_perdidos_visitante: int
-    partidos_empatados: int
-    goles_local: int
-    goles_visitante: int
-    goles_en_contra: int 
 
+    def verificar(self, elemento: Any) -> None:
+        valor = self.clave(elemento)
+        if valor in self.tabla:
+            raise ValueError(f"El valor {valor!r} está repetido en un índice único")
 
-# ---------------------------------------------------------------------
 
-@dataclass(frozen=True)
-class Municipio:
-    """
-    Esta es la información de un municipio de Colombia
-    """
-    codigo: int
-    nombre: str
-    poblacion_urbana: int
-    poblacion_rural: int
-    departamento: str
-    es_capital: bool 
+    def posiciones(self, valor: Any) -> List[int]:
+        if self.unico:
+            posicion = self.tabla.get(valor)
+            return [] if posicion is None else [posicion]
+        return list(self.tabla.get(valor, ()))
 
-    def poblacion_total(self) -> int:
-        return self.poblacion_rural + self.poblacion_urbana
 
+    def agregar(self, elemento: Any, posicion: int) -> None:
+        valor = self.clave(elemento)
+        if self.unico:
+            self.tabla[valor] = posicion
+        elif valor in self.tabla:
+            insort(self.tabla[valor], posicion)
+        else:
+            self.tabla[valor] = [posicion]
 
-# ---------------------------------------------------------------------
 
-def leer_archivo_departamentos() -> Lista[Departamento]:
-    """
-    Permite obtener una lista de departamentos a partir del archivo
-    de datos que se encuentra en github
-    :return: Una lista con la información de los departamentos
-    """
-    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/departamentos2.csv"
-    df = pd.read_csv(archivo, encoding="utf-8")
-    resultado = Lista[Departamento]()
-    for index, row in df.iterrows():
-        nombre = row["Departamento"]
-        municipios = row["Municipios"]
-        capital = row["Capital"]
-        superficie = row["Superficie"]
-        poblacion = row["Población"]
-        densidad = row["Densidad"]
-        idh = row["IDH6"]
-        fecha = row["Fecha de creación"]
-        region = row["Región"]
-        depto = Departamento(nombre, cant_municipios=municipios, capital=capital, superficie=superficie,
-                             poblacion=poblacion, densidad=densidad, indice_desarrollo_humano=idh, fecha_creacion=fecha,
-                             region=region)
-        resultado.agregar(depto)
-    return resultado
+    def quitar(self, elemento: Any, posicion: int) -> None:
+        valor = self.clave(elemento)
+        if self.unico:
+            del self.tabla[valor]
+        else:
+            posiciones = self.tabla[valor]
+            posiciones.remove(posicion)
+            if not posiciones:
+                del self.tabla[valor]
 
 
-# ---------------------------------------------------------------------
+    def reemplazar(self, anterior: Any, nuevo: Any, posicion: int) -> None:
+        if self.unico and self.clave(anterior) != self.clave(nuevo):
+            self.verificar(nuevo)
+        self.quitar(anterior, posicion)
+        self.agregar(nuevo, posicion)
 
-def leer_archivo_equipos() -> Lista[EquipoFutbol]:
-    """
-    Permite obtener una lista con la información de los equipos de fútbol de la liga
-    :return: la lista de equipos de futbol
-    """
-    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/LaLiga.csv"
-    df = pd.read_csv(archivo, encoding="utf-8")
-    lista = Lista[EquipoFutbol]()
-    for index, row in df.iterrows():
-        año = int(row["season"][:4])
-        nombre = row["club"]
-        partidos_ganados_local = int(row["home_win"])
-        partidos_ganados_visitante = int(row["away_win"])
-        partidos_perdidos_local = int(row["home_loss"])
-        partidos_perdidos_visitante = int(row["away_loss"])
-        partidos_empatados = int(row["matches_drawn"])
-        goles_local = int(row["home_goals"])
-        goles_visitante = int(row["away_goals"])
-        goles_en_contra = int(row["goals_conceded"])
-        e = EquipoFutbol(año, nombre, partidos_ganados_local, partidos_ganados_visitante,
-                         partidos_perdidos_local, partidos_perdidos_visitante,
-                         partidos_empatados, goles_local, goles_visitante,
-                         goles_en_contra)
-        lista.agregar(e)
-    return lista
 
 # ---------------------------------------------------------------------
 
-def leer_archivo_municipios() -> Lista[Municipio]:
+# Cantidad máxima de elementos que se muestran en repr de las estructuras
+LIMITE_REPR = 20
+
+
+def _repr_limitado(nombre: str, elementos: Iterator, tam: int = None) -> str:
     """
-    Permite obtener una lista con la información de los municipios de 
-    :return: la lista de equipos de futbol
+    Construye la representación de una estructura mostrando como máximo LIMITE_REPR elementos
+    :param nombre: el nombre de la estructura
+    :param elementos: un iterador con los elementos
+    :param tam: la cantidad de elementos, si se conoce
+    :return: la representación, por ejemplo Lista[1, 2, 3, ...] (1000 elementos)
     """
-    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/municipios.csv"
-    df = pd.read_csv(archivo, encoding="utf-8")
-    lista = Lista[Municipio]()
-    for index, row in df.iterrows():
-        codigo = int(row["código"])
-        nombre = row["nombre"]
-        poblacion_urbana = int(row["poblaciónUrbana"])
-        poblacion_rural = int(row["poblaciónRural"])
-        departamento = row["departamento"]
-        es_capital = int(row["esCapital"]) == 1
-        m = Municipio(codigo=codigo, nombre=nombre, poblacion_rural=poblacion_rural,
-                      poblacion_urbana=poblacion_urbana, departamento=departamento,
-                      es_capital=es_capital)
-        lista.agregar(m)
-    return lista
+    primeros = list(islice(elementos, LIMITE_REPR + 1))
+    if len(primeros) <= LIMITE_REPR:
+        return nombre + '[' + ', '.join(map(repr, primeros)) + ']'
+    texto = nombre + '[' + ', '.join(map(repr, primeros[:LIMITE_REPR])) + ', ...]'
+    return texto if tam is None else f"{texto} ({tam} elementos)"
 
 
 # ---------------------------------------------------------------------
 
-def pila_municipios() -> Pila[Municipio]:
+class _Porcion(Sequence):
     """
-    Permite obtener una pila con la información de los municipios de 
-    :return: la lista de equipos de futbol
+    Los elementos de una vista, leídos de los datos de la lista original sin copiarlos
     """
-    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/municipios.csv"
-    df = pd.read_csv(archivo, encoding="utf-8")
-    pila = Pila[Municipio]()
-    for index, row in df.iterrows():
-        codigo = int(row["código"])
-        nombre = row["nombre"]
-        poblacion_urbana = int(row["poblaciónUrbana"])
-        poblacion_rural = int(row["poblaciónRural"])
-        departamento = row["departamento"]
-        es_capital = int(row["esCapital"]) == 1
-        m = Municipio(codigo=codigo, nombre=nombre, poblacion_rural=poblacion_rural,
-                      poblacion_urbana=poblacion_urbana, departamento=departamento,
-                      es_capital=es_capital)
-        pila.apilar(m)
-    return pila
 
+    def __init__(self, datos: list, rango: range):
+        self.__datos = datos
+        self.__rango = rango
 
-# ---------------------------------------------------------------------
-from io import StringIO
-import shlex
 
-def dividir_expresion(expresion: str) -> Lista[str]:
-    """
-    Esta función toma una expresión y obtiene los
-    diferentes tokens que hacen parte de ella
-    """
-    inp = StringIO(expresion)
-    res = Lista[str]()
-    for elem in list(shlex.shlex(inp)):
-        res.agregar(elem)
-    return res
+    def __len__(self) -> int:
+        return len(self.__rango)
 
 
-# ---------------------------------------------------------------------
-# Funciones auxiliares
+    def __getitem__(self, indice: int | slice) -> Any:
+        if isinstance(indice, slice):
+            return list(map(self.__datos.__getitem__, self.__rango[indice]))
+        return self.__datos[self.__rango[indice]]
 
-def elevar(x: int, y: int) -> int:
-    return int(int(x) ** int(y))
 
+    def __iter__(self) -> Iterator:
+        return map(self.__datos.__getitem__, self.__rango)
 
-# ---------------------------------------------------------------------
 
-class NodoArbin(Generic[T]):
-    """"
-    Este es un nodo de un árbol binario genérico
+    def __reversed__(self) -> Iterator:
+        return map(self.__datos.__getitem__, reversed(self.__rango))
+
+
+class VistaLista(Lista[T]):
     """
-    def __init__(self, info: T, izq: Optional["NodoArbin"] = None, der: Optional["NodoArbin"] = None):
-        self.info = info
-        self.izq = izq
-        self.der = der
+    Una vista de una porción de otra lista. Comparte los datos de la lista
+    original usando un rango de posiciones (inicio, fin y paso), así que crearla
+    toma O(1). Es una lista normal con semántica de copia al escribir: si se
+    modifica la vista, primero se copian sus elementos; si se modifica la lista
+    original, la original hace su propia copia. En ambos casos la vista conserva
+    los elementos que tenía al crearse. Las consultas (filtrar, sumar, mayor...)
+    leen los elementos de la lista original sin copiarlos.
+    """
+
+    def __init__(self, datos: list, rango: range, referencias: list):
+        """
+        Crea la vista
+        :param datos: los datos de la lista original
+        :param rango: las posiciones de los datos que hacen parte de la vista
+        :param referencias: el contador de las listas que comparten los datos, que ya
+                            cuenta esta vista. Se descuenta cuando la vista copia sus
+                            elementos o se destruye.
+        """
+        super().__init__()
+        self.__base = datos
+        self.__rango = rango
+        self.__referencias_base = referencias
+        self.__soltar_base = weakref.finalize(self, _soltar_referencia, referencias)
 
 
-    def es_hoja(self) -> bool:
+    def __soltar(self) -> None:
         """
-        Permite saber si este árbol es una hoja o no
-        :return: true si el nodo no tiene hijos, y false en caso contrario
+        Deja de compartir los datos de la lista original
         """
-        return self.izq is None and self.der is None
+        self.__base = None
+        self.__referencias_base = None
+        self.__soltar_base()
 
 
-def arbol_de_letras() -> NodoArbin[str]:
-    """
+    def __getstate__(self) -> dict:
+        """
+        La vista se guarda con una copia de sus elementos, sin la lista original
+        """
+        estado = super().__getstate__()
+        if self.__base is not None:
+            estado['_Lista__datos'] = list(self)
+        estado.update({'_VistaLista__base': None, '_VistaLista__referencias_base': None,
+                       '_VistaLista__soltar_base': None})
+        return estado
+
+
+    def _datos(self) -> Sequence[T]:
+        if self.__base is None:
+            return super()._datos()
+        return _Porcion(self.__base, self.__rango)
+
+
+    def _preparar_cambio(self) -> None:
+        if self.__base is not None:
+            # La primera modificación copia los elementos de la vista
+            datos = list(map(self.__base.__getitem__, self.__rango))
+            self.__soltar()
+            self._reemplazar_datos(datos)
+        super()._preparar_cambio()
+
+
+    def limpiar(self) -> None:
+        if self.__base is not None:
+            self.__soltar()
+        super().limpiar()
+
+
+    def instantanea(self) -> 'Lista[T]':
+        """
+        Mientras la vista no se ha modificado, la copia es otra vista de los mismos datos
+        """
+        if self.__base is None:
+            return super().instantanea()
+        return self._vista(slice(None))
+
+
+    def _vista(self, porcion: slice) -> 'VistaLista[T]':
+        if self.__base is None:
+            return super()._vista(porcion)
+        self.__referencias_base[0] += 1
+        return VistaLista(self.__base, self.__rango[porcion], self.__referencias_base)
+
+
+    @property
+    def tam(self) -> int:
+        if self.__base is None:
+            return super().tam
+        return len(self.__rango)
+
+
+    @property
+    def vacia(self) -> bool:
+        return self.tam == 0
+
+
+    @property
+    def primero(self) -> T:
+        return self[0]
+
+
+    @property
+    def ultimo(self) -> T:
+        return self[-1]
+
+
+    def __len__(self) -> int:
+        return self.tam
+
+
+    def __iter__(self) -> Iterator[T]:
+        if self.__base is None:
+            return super().__iter__()
+        return map(self.__base.__getitem__, self.__rango)
+
+
+    def __reversed__(self) -> Iterator[T]:
+        if self.__base is None:
+            return super().__reversed__()
+        return map(self.__base.__getitem__, reversed(self.__rango))
+
+
+    def __getitem__(self, indice: int | slice) -> T:
+        if self.__base is not None and not isinstance(indice, slice):
+            tamx = len(self.__rango)
+            if -tamx <= indice < tamx:
+                return self.__base[self.__rango[indice]]
+            return None
+        return super().__getitem__(indice)
+
+
+# ---------------------------------------------------------------------
+
+def _es_numero(valor: Any) -> bool:
+    """
+    Indica si el valor es un número real, incluidos los escalares de NumPy
+    (np.int64, np.float64, ...). Los booleanos no cuentan como números.
+    """
+    return isinstance(valor, numbers.Real) and not isinstance(valor, bool)
+
+
+def _seleccionar(claves: list, k: int) -> int:
+    """
+    Selección rápida (introselect): obtiene la posición del valor que quedaría
+    en la posición k si las claves se ordenaran de forma estable. Usa pivotes
+    aleatorios con partición en tres partes; si la recursión se hace demasiado
+    profunda, termina ordenando lo que falta.
+    :param claves: las claves de los elementos
+    :param k: la posición buscada, empezando en cero
+    :return: la posición en claves del elemento buscado
+    """
+    posiciones = list(range(len(claves)))
+    profundidad = 2 * max(1, len(posiciones)).bit_length()
+    while len(posiciones) > 16 and profundidad > 0:
+        pivote = claves[posiciones[random.randrange(len(posiciones))]]
+        menores = [p for p in posiciones if claves[p] < pivote]
+        if k < len(menores):
+            posiciones = menores
+        else:
+            iguales = [p for p in posiciones if not (claves[p] < pivote or pivote < claves[p])]
+            if k < len(menores) + len(iguales):
+                return iguales[k - len(menores)]
+            k -= len(menores) + len(iguales)
+            posiciones = [p for p in posiciones if pivote < claves[p]]
+        profundidad -= 1
+    return sorted(posiciones, key=claves.__getitem__)[k]
+
+
+# ---------------------------------------------------------------------
+
+def concatenar_listas(lista1: Lista[T], lista2: Lista[T]) -> Lista[T]:
+    """
+    Une dos listas, anexando los elementos de la lista2 al final de la lista1
+    :param lista1: La lista a la izquierda
+    :param lista2: La lista a la derecha
+    :return: una lista con los elementos de la lista1 y la lista2
+    """
+    if lista2.vacia:
+        return lista1.instantanea()
+    if lista1.vacia:
+        return lista2.instantanea()
+    resultado = Lista.desde_iterable(lista1)
+    resultado.extender(lista2)
+    return resultado
+
+
+def crear_lista(*elementos: T) -> Lista[T]:
+    """
+    Permite crear una lista con los elementos recibidos como parámetro
+    :param elementos: los datos a guardar en la lista
+    :return: La nueva lista con los elementos recibidos
+    """
+    return Lista.desde_iterable(elementos)
+
+
+def resto_lista(lista_original: Lista[T]) -> Lista[T]:
+    """
+    Retorna una nueva lista equivalente a la lista que se recibe como
+    parámetro, pero sin el primer elemento. Usado en recursiones.
+    El resultado es una vista que comparte los datos, así que toma O(1).
+    :param lista_original: la lista con la que trabajamos
+    :return: la misma lista, pero sin el primer elemento
+    """
+    return lista_original[1:]
+
+
+def copiar_lista(lista: Lista[T], inicio = 0, fin = None) -> Lista[T]:
+    """
+    Obtiene una copia idéntica de la lista que se recibe como
+    parámetro. La copia comparte los datos, así que toma O(1); los elementos
+    solo se copian si alguna de las dos se modifica, y modificar una nunca
+    cambia la otra. Si se copia toda la lista el resultado es
+    lista.instantanea(), una Lista (o una vista, si la lista es una vista que
+    no se ha modificado); si se copia una parte, es una VistaLista. En ambos
+    casos es una Lista nueva, aunque ya no de la misma subclase que la original.
+    :param lista: la lista con la que trabajamos
+    :param inicio: la posición del primer elemento a copiar
+    :param fin: la posición siguiente al último elemento a copiar
+    :return: una Lista, o una VistaLista si se copia solo una parte
+    """
+    ini = inicio
+    final = lista.tam if fin is None else fin
+    if ini >= final:
+        raise ValueError("Imposible realizar la copia")
+    if ini == 0 and final == lista.tam:
+        return lista.instantanea()
+    return lista[ini:final]
+
+# ---------------------------------------------------------------------
+
+_VACIO = object()
+
+
+def _agregar_a_lista(lista: Lista, valor: Any) -> Lista:
+    lista.agregar(valor)
+    return lista
+
+
+def _agregar_a_estadisticas(estadisticas: 'Estadisticas', valor: Any) -> 'Estadisticas':
+    estadisticas.agregar(valor)
+    return estadisticas
+
+
+def _siempre(elemento: Any) -> bool:
+    return True
+
+
+# Operaciones de Lista.agrupar: (estado inicial, actualizar estado, resultado final)
+_AGREGADOS = {
+    "contar": (lambda: 0, lambda estado, valor: estado + 1 if valor else estado, lambda estado: estado),
+    "sumar": (lambda: 0.0, lambda estado, valor: estado + valor, lambda estado: estado),
+    "promedio": (lambda: (0.0, 0), lambda estado, valor: (estado[0] + valor, estado[1] + 1),
+                 lambda estado: 0.0 if estado[1] == 0 else estado[0] / estado[1]),
+    "mayor": (lambda: _VACIO, lambda estado, valor: valor if estado is _VACIO or estado < valor else estado,
+              lambda estado: None if estado is _VACIO else estado),
+    "menor": (lambda: _VACIO, lambda estado, valor: valor if estado is _VACIO or valor < estado else estado,
+              lambda estado: None if estado is _VACIO else estado),
+    "lista": (Lista, _agregar_a_lista, lambda estado: estado),
+    "estadisticas": (lambda: Estadisticas(), _agregar_a_estadisticas, lambda estado: estado),
+}
+
+
+# ---------------------------------------------------------------------
+
+class Estadisticas:
+    """
+    Acumulador de estadísticas de una secuencia de valores: cantidad, suma,
+    promedio, mínimo, máximo, varianza y desviación estándar. Todo se calcula
+    en un solo recorrido; la varianza usa el método de Welford, que es estable
+    numéricamente. Se puede usar de forma incremental, agregando los valores
+    a medida que llegan (por ejemplo, mientras se lee un archivo).
+    """
+
+    def __init__(self, selector: Callable[..., int | float] = None):
+        """
+        Crea el acumulador vacío
+        :param selector: la operación que obtiene el valor numérico de cada elemento
+                         que se agregue. Si no se da, se usan los elementos mismos.
+        """
+        self.__selector = selector
+        self.__n = 0
+        self.__suma = 0.0
+        self.__media = 0.0
+        self.__m2 = 0.0
+        self.__minimo = None
+        self.__maximo = None
+
+
+    def agregar(self, elemento: Any) -> None:
+        """
+        Agrega un elemento a las estadísticas
+        :param elemento: el elemento. Se le aplica el selector, si lo hay
+        :return: None
+        """
+        valor = elemento if self.__selector is None else self.__selector(elemento)
+        self.__n += 1
+        self.__suma += valor
+        delta = valor - self.__media
+        self.__media += delta / self.__n
+        self.__m2 += delta * (valor - self.__media)
+        if self.__n == 1:
+            self.__minimo = self.__maximo = valor
+        elif valor < self.__minimo:
+            self.__minimo = valor
+        elif valor > self.__maximo:
+            self.__maximo = valor
+
+
+    def agregar_varios(self, elementos: Iterable) -> None:
+        """
+        Agrega todos los elementos del iterable a las estadísticas
+        :param elementos: los elementos. Se les aplica el selector, si lo hay
+        :return: None
+        """
+        valores = elementos if self.__selector is None else map(self.__selector, elementos)
+        n, suma, media, m2 = self.__n, self.__suma, self.__media, self.__m2
+        minimo, maximo = self.__minimo, self.__maximo
+        for valor in valores:
+            n += 1
+            suma += valor
+            delta = valor - media
+            media += delta / n
+            m2 += delta * (valor - media)
+            if n == 1:
+                minimo = maximo = valor
+            elif valor < minimo:
+                minimo = valor
+            elif valor > maximo:
+                maximo = valor
+        self.__n, self.__suma, self.__media, self.__m2 = n, suma, media, m2
+        self.__minimo, self.__maximo = minimo, maximo
+
+
+    def observar(self, elementos: Iterable[T]) -> Iterator[T]:
+        """
+        Recorre los elementos, agregándolos a las estadísticas, y los deja pasar
+        sin cambios. Sirve para calcular estadísticas mientras otro proceso
+        consume los elementos:  for p in est.observar(registros): ...
+        :param elementos: los elementos
+        :return: un generador con los mismos elementos
+        """
+        for elemento in elementos:
+            self.agregar(elemento)
+            yield elemento
+
+
+    def combinar(self, otra: 'Estadisticas') -> 'Estadisticas':
+        """
+        Combina las estadísticas de dos grupos de valores, como si se hubieran
+        calculado sobre todos los valores juntos
+        :param otra: las estadísticas del otro grupo
+        :return: unas nuevas estadísticas con los dos grupos
+        """
+        resultado = Estadisticas(self.__selector)
+        n = self.__n + otra.__n
+        if n == 0:
+            return resultado
+        delta = otra.__media - self.__media
+        resultado.__n = n
+        resultado.__suma = self.__suma + otra.__suma
+        resultado.__media = self.__media + delta * otra.__n / n
+        resultado.__m2 = self.__m2 + otra.__m2 + delta * delta * self.__n * otra.__n / n
+        minimos = [valor for valor in (self.__minimo, otra.__minimo) if valor is not None]
+        maximos = [valor for valor in (self.__maximo, otra.__maximo) if valor is not None]
+        resultado.__minimo = min(minimos)
+        resultado.__maximo = max(maximos)
+        return resultado
+
+
+    @property
+    def cantidad(self) -> int:
+        return self.__n
+
+
+    @property
+    def suma(self) -> float:
+        return self.__suma
+
+
+    @property
+    def promedio(self) -> float:
+        """
+        El promedio de los valores, o 0.0 si no hay valores
+        """
+        return self.__media
+
+
+    @property
+    def minimo(self) -> Optional[int | float]:
+        return self.__minimo
+
+
+    @property
+    def maximo(self) -> Optional[int | float]:
+        return self.__maximo
+
+
+    @property
+    def varianza(self) -> float:
+        """
+        La varianza poblacional de los valores
+        """
+        return 0.0 if self.__n == 0 else self.__m2 / self.__n
+
+
+    @property
+    def varianza_muestral(self) -> float:
+        """
+        La varianza muestral de los valores (dividiendo por n - 1)
+        """
+        return 0.0 if self.__n < 2 else self.__m2 / (self.__n - 1)
+
+
+    @property
+    def desviacion(self) -> float:
+        """
+        La desviación estándar poblacional de los valores
+        """
+        return sqrt(self.varianza)
+
+
+    @property
+    def desviacion_muestral(self) -> float:
+        """
+        La desviación estándar muestral de los valores
+        """
+        return sqrt(self.varianza_muestral)
+
+
+    def __str__(self) -> str:
+        return (f"Estadisticas(cantidad={self.cantidad}, suma={self.suma}, promedio={self.promedio}, "
+                f"minimo={self.minimo}, maximo={self.maximo}, desviacion={self.desviacion})")
+
+
+# ---------------------------------------------------------------------
+
+class Consulta(Generic[T]):
+    """
+    Una consulta perezosa sobre los elementos de una lista. Las etapas
+    (filtrar, seleccionar, limitar, saltar, ...) solo se registran, y se
+    ejecutan todas juntas en un único recorrido cuando se pide un resultado
+    (sumar, contar, mayor, a_lista, ...). Así no se crean listas intermedias.
+    """
+
+    def __init__(self, fuente, etapas: tuple = ()):
+        """
+        Crea la consulta sobre la fuente de datos
+        :param fuente: la secuencia con los elementos a consultar
+        :param etapas: las etapas que ya tiene registradas la consulta
+        """
+        self.__fuente = fuente
+        self.__etapas = etapas
+
+
+    def __agregar_etapa(self, tipo: str, valor: Any = None) -> 'Consulta':
+        return Consulta(self.__fuente, self.__etapas + ((tipo, valor),))
+
+
+    def filtrar(self, predicado: Callable[..., bool]) -> 'Consulta[T]':
+        """
+        Conserva solo los elementos que cumplen con el predicado
+        :param predicado: una función que devuelve True si el elemento cumple con el predicado
+        :return: la nueva consulta
+        """
+        return self.__agregar_etapa("filtrar", predicado)
+
+
+    def seleccionar(self, selector: Callable[..., R]) -> 'Consulta[R]':
+        """
+        Aplica el selector a cada elemento
+        :param selector: la operación a realizar sobre cada elemento
+        :return: la nueva consulta
+        """
+        return self.__agregar_etapa("seleccionar", selector)
+
+
+    def transformar(self, selector: Callable[..., R]) -> 'Consulta[R]':
+        """
+        Aplica el selector a cada elemento. Es lo mismo que seleccionar
+        :param selector: la operación a realizar sobre cada elemento
+        :return: la nueva consulta
+        """
+        return self.__agregar_etapa("seleccionar", selector)
+
+
+    def limitar(self, n: int) -> 'Consulta[T]':
+        """
+        Conserva como máximo los primeros n elementos
+        :param n: la cantidad máxima de elementos
+        :return: la nueva consulta
+        """
+        return self.__agregar_etapa("limitar", n)
+
+
+    def saltar(self, n: int) -> 'Consulta[T]':
+        """
+        Descarta los primeros n elementos
+        :param n: la cantidad de elementos a descartar
+        :return: la nueva consulta
+        """
+        return self.__agregar_etapa("saltar", n)
+
+
+    def invertir(self) -> 'Consulta[T]':
+        """
+        Recorre los elementos en orden inverso. Si es la primera etapa no se
+        copia nada; en otro caso hay que guardar los elementos de las etapas anteriores.
+        :return: la nueva consulta
+        """
+        return self.__agregar_etapa("invertir")
+
+
+    def __iter__(self):
+        """
+        Construye el recorrido de todas las etapas como un único generador
+        """
+        etapas = self.__etapas
+        if etapas and etapas[0][0] == "invertir":
+            iterador = reversed(self.__fuente)
+            etapas = etapas[1:]
+        else:
+            iterador = iter(self.__fuente)
+        for tipo, valor in etapas:
+            if tipo == "filtrar":
+                iterador = filter(valor, iterador)
+            elif tipo == "seleccionar":
+                iterador = map(valor, iterador)
+            elif tipo == "limitar":
+                iterador = islice(iterador, valor)
+            elif tipo == "saltar":
+                iterador = islice(iterador, valor, None)
+            else:
+                iterador = reversed(list(iterador))
+        return iterador
+
+
+    # Operaciones terminales
+
+    def a_lista(self) -> 'Lista[T]':
+        """
+        Ejecuta la consulta y guarda los resultados en una nueva lista
+        :return: la lista con los resultados
+        """
+        return Lista.desde_iterable(self)
+
+
+    def con_cada_elemento_haga(self, accion: Callable[..., None]) -> None:
+        """
+        Ejecuta la consulta y realiza la acción sobre cada resultado
+        :param accion: la operación a realizar sobre cada elemento
+        :return: None
+        """
+        for elemento in self:
+            accion(elemento)
+
+
+    def acumular(self, valor_inicial: R, operacion: Callable[..., R]) -> R:
+        """
+        Acumula los resultados de la consulta de izquierda a derecha
+        :param valor_inicial: el valor inicial del acumulador
+        :param operacion: la operación de acumulación
+        :return: el último valor del acumulador
+        """
+        acumulador = valor_inicial
+        for elemento in self:
+            acumulador = operacion(acumulador, elemento)
+        return acumulador
+
+
+    def sumar(self, selector: Callable[..., int | float] = None) -> int | float:
+        """
+        Halla la suma de los resultados de la consulta
+        :param selector: la operación a realizar sobre cada resultado antes de sumarlo
+        :return: la suma de los resultados
+        """
+        iterador = iter(self) if selector is None else map(selector, self)
+        return sum(iterador, 0.0)
+
+
+    def promedio(self, selector: Callable[..., int | float] = None) -> float:
+        """
+        Halla el promedio de los resultados de la consulta
+        :param selector: la operación a realizar sobre cada resultado
+        :return: el promedio, o 0.0 si la consulta no tiene resultados
+        """
+        iterador = iter(self) if selector is None else map(selector, self)
+        suma = 0.0
+        n = 0
+        for valor in iterador:
+            suma += valor
+            n += 1
+        return 0.0 if n == 0 else suma / n
+
+
+    def contar(self, predicado: Callable[..., bool] = None) -> int:
+        """
+        Cuenta los resultados de la consulta que cumplen con el predicado
+        :param predicado: el predicado. Si no se da, se cuentan todos los resultados
+        :return: la cantidad de resultados
+        """
+        iterador = iter(self) if predicado is None else filter(predicado, self)
+        n = 0
+        for _ in iterador:
+            n += 1
+        return n
+
+
+    def estadisticas(self, selector: Callable[..., int | float] = None) -> Estadisticas:
+        """
+        Calcula las estadísticas de los resultados de la consulta en un solo recorrido
+        :param selector: la operación que obtiene el valor numérico de cada resultado
+        :return: las estadísticas de los valores
+        """
+        resultado = Estadisticas(selector)
+        resultado.agregar_varios(self)
+        return resultado
+
+
+    def porcentaje(self, predicado: Callable[..., bool] = None) -> float:
+        """
+        Retorna el porcentaje de resultados de la consulta que cumplen con el predicado
+        :param predicado: el predicado a aplicar a cada resultado
+        :return: el porcentaje de resultados que cumplen con el predicado
+        """
+        if predicado is None:
+            return 100.0
+        total = 0
+        cont = 0
+        for elemento in self:
+            total += 1
+            if predicado(elemento):
+                cont += 1
+        return 0.0 if cont == 0 else 100.0 * cont / total
+
+
+    def __extremo(self, menor_que: Optional[Callable[..., bool]], atributo: Optional[str], mayor: bool) -> Optional[T]:
+        iterador = iter(self)
+        extremo = next(iterador, _VACIO)
+        if extremo is _VACIO:
+            return None
+        if menor_que is None:
+            clave = clave_de_orden(atributo=atributo, muestra=extremo)
+            funcion = max if mayor else min
+            return funcion(chain((extremo,), iterador), key=clave)
+        for elemento in iterador:
+            if (menor_que(extremo, elemento) if mayor else menor_que(elemento, extremo)):
+                extremo = elemento
+        return extremo
+
+
+    def mayor(self, menor_que: Callable[..., bool] = None, atributo: str = None) -> Optional[T]:
+        """
+        Obtiene el mayor de los resultados de la consulta
+        :param menor_que: el criterio de comparación de los resultados
+        :param atributo: los atributos usados como criterio de comparación
+        :return: el resultado más grande o None si no hay resultados
+        """
+        return self.__extremo(menor_que, atributo, True)
+
+
+    def menor(self, menor_que: Callable[..., bool] = None, atributo: str = None) -> Optional[T]:
+        """
+        Obtiene el menor de los resultados de la consulta
+        :param menor_que: el criterio de comparación de los resultados
+        :param atributo: los atributos usados como criterio de comparación
+        :return: el resultado más pequeño o None si no hay resultados
+        """
+        return self.__extremo(menor_que, atributo, False)
+
+
+    def encontrar_primero(self, predicado: Callable[..., bool] = None) -> Optional[T]:
+        """
+        Obtiene el primer resultado que cumple con el predicado. El recorrido se
+        detiene en cuanto lo encuentra.
+        :param predicado: el predicado. Si no se da, se retorna el primer resultado
+        :return: el primer resultado que cumple con el predicado o None si no hay ninguno
+        """
+        iterador = iter(self) if predicado is None else filter(predicado, self)
+        return next(iterador, None)
+
+
+    def alguno(self, predicado: Callable[..., bool]) -> bool:
+        """
+        Permite saber si algún resultado cumple con el predicado. Se detiene en el primero
+        :param predicado: el predicado a aplicar a cada resultado
+        :return: True si algún resultado cumple con el predicado
+        """
+        return any(map(predicado, self))
+
+
+    def todos(self, predicado: Callable[..., bool]) -> bool:
+        """
+        Permite saber si todos los resultados cumplen con el predicado. Se detiene en el primero que no
+        :param predicado: el predicado a aplicar a cada resultado
+        :return: True si todos los resultados cumplen con el predicado
+        """
+        return all(map(predicado, self))
+
+
+# ---------------------------------------------------------------------
+
+class ListaOrdenada(Generic[T]):
+    """
+    Lista que mantiene sus elementos ordenados por una clave. Las búsquedas
+    se hacen con búsqueda binaria, así que buscar, piso, techo, rango y
+    contar_en_rango toman O(log n) (más el tamaño del resultado). La clave
+    de cada elemento se calcula una sola vez, al agregarlo.
+    """
+
+    def __init__(self, elementos: Iterable[T] = (), clave: Callable[[T], Any] = None, atributo: str = None):
+        """
+        Crea la lista ordenada
+        :param elementos: los elementos iniciales, en cualquier orden (una Lista, por ejemplo)
+        :param clave: la función que obtiene la clave de cada elemento
+        :param atributo: los atributos que forman la clave, como en es_menor_que, por ejemplo
+                         "precio" o "departamento, -poblacion_urbana". Si no se da ni clave ni
+                         atributo, los elementos se comparan directamente.
+        """
+        self.__comparador = None
+        if clave is None and atributo is not None:
+            self.__comparador = compilar_atributos(atributo)
+            clave = self.__comparador.clave
+        self.__clave = clave
+        datos = list(elementos)
+        if clave is None:
+            datos.sort()
+            self.__claves = list(datos)
+        else:
+            pares = sorted(zip(map(clave, datos), datos), key=itemgetter(0))
+            self.__claves = [k for k, _ in pares]
+            datos = [elemento for _, elemento in pares]
+        self.__datos = datos
+
+
+    def __nueva(self, claves: list, datos: list) -> 'ListaOrdenada[T]':
+        """
+        Crea una lista ordenada con el mismo criterio, a partir de claves y datos ya ordenados
+        """
+        resultado = ListaOrdenada.__new__(ListaOrdenada)
+        resultado.__comparador = self.__comparador
+        resultado.__clave = self.__clave
+        resultado.__claves = claves
+        resultado.__datos = datos
+        return resultado
+
+
+    def __clave_de_valor(self, valor: Any) -> Any:
+        """
+        Convierte el valor buscado en una clave comparable con las guardadas. Solo
+        cambia algo cuando hay atributos descendentes: en ese caso las claves
+        guardadas son tuplas, aunque haya un solo atributo, con los valores
+        descendentes envueltos.
+        """
+        if self.__comparador is None:
+            return valor
+        campos = self.__comparador.campos
+        if not any(desc for _, _, _, desc in campos):
+            return valor
+        if len(campos) == 1:
+            return (_Descendente(valor),)
+        return tuple(_Descendente(v) if desc else v for v, (_, _, _, desc) in zip(valor, campos))
+
+
+    @property
+    def tam(self) -> int:
+        return len(self.__datos)
+
+
+    @property
+    def vacia(self) -> bool:
+        return len(self.__datos) == 0
+
+
+    @property
+    def primero(self) -> Optional[T]:
+        return self.__datos[0] if self.__datos else None
+
+
+    @property
+    def ultimo(self) -> Optional[T]:
+        return self.__datos[-1] if self.__datos else None
+
+
+    def __len__(self) -> int:
+        return len(self.__datos)
+
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__datos)
+
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self.__datos)
+
+
+    def __getitem__(self, indice: int) -> Optional[T]:
+        """
+        Obtiene el elemento que se encuentra en el índice dado, en orden
+        :param indice: la posición en la lista
+        :return: el elemento, o None si el índice está fuera de rango
+        """
+        tamx = len(self.__datos)
+        if -tamx <= indice < tamx:
+            return self.__datos[indice]
+        return None
+
+
+    def __contains__(self, elemento: T) -> bool:
+        clave = elemento if self.__clave is None else self.__clave(elemento)
+        inicio = bisect_left(self.__claves, clave)
+        fin = bisect_right(self.__claves, clave, inicio)
+        return elemento in self.__datos[inicio:fin]
+
+
+    def agregar(self, elem: T) -> None:
+        """
+        Agrega un elemento en la posición que le corresponde. Si hay elementos
+        con la misma clave, queda después de ellos.
+        :param elem: el elemento que vamos a agregar
+        :return: None
+        """
+        clave = elem if self.__clave is None else self.__clave(elem)
+        posicion = bisect_right(self.__claves, clave)
+        self.__claves.insert(posicion, clave)
+        self.__datos.insert(posicion, elem)
+
+
+    def agregar_varios(self, elementos: Iterable[T]) -> None:
+        """
+        Agrega todos los elementos del iterable
+        :param elementos: los elementos que vamos a agregar, en cualquier orden
+        :return: None
+        """
+        otra = ListaOrdenada(elementos, clave=self.__clave)
+        fusion = self.fusionar(otra)
+        self.__claves = fusion.__claves
+        self.__datos = fusion.__datos
+
+
+    def eliminar(self, indice: int) -> None:
+        """
+        Elimina el elemento que se encuentra en el índice dado
+        :param indice: la posición del elemento que vamos a eliminar
+        :return: None
+        """
+        tamx = len(self.__datos)
+        if -tamx <= indice < tamx:
+            self.__claves.pop(indice)
+            self.__datos.pop(indice)
+
+
+    def limpiar(self) -> None:
+        """
+        Elimina todos los elementos de la lista, dejándola vacía
+        :return: None
+        """
+        self.__claves.clear()
+        self.__datos.clear()
+
+
+    def posicion(self, valor: Any) -> Optional[int]:
+        """
+        Obtiene la posición del primer elemento cuya clave es igual al valor
+        :param valor: el valor de la clave. Si la clave tiene varios atributos, es una tupla
+        :return: la posición, o None si no hay ningún elemento con esa clave
+        """
+        clave = self.__clave_de_valor(valor)
+        posicion = bisect_left(self.__claves, clave)
+        if posicion < len(self.__claves) and self.__claves[posicion] == clave:
+            return posicion
+        return None
+
+
+    def buscar(self, valor: Any) -> Optional[T]:
+        """
+        Obtiene el primer elemento cuya clave es igual al valor, en O(log n)
+        :param valor: el valor de la clave. Si la clave tiene varios atributos, es una tupla
+        :return: el elemento, o None si no hay ninguno
+        """
+        posicion = self.posicion(valor)
+        return None if posicion is None else self.__datos[posicion]
+
+
+    def __limites(self, desde: Any, hasta: Any) -> tuple[int, int]:
+        inicio = 0 if desde is None else bisect_left(self.__claves, self.__clave_de_valor(desde))
+        fin = len(self.__claves) if hasta is None else bisect_right(self.__claves, self.__clave_de_valor(hasta))
+        return inicio, max(inicio, fin)
+
+
+    def rango(self, desde: Any = None, hasta: Any = None) -> Lista[T]:
+        """
+        Obtiene los elementos cuya clave está entre desde y hasta, ambos incluidos
+        :param desde: el menor valor de la clave. Si es None, no hay límite inferior
+        :param hasta: el mayor valor de la clave. Si es None, no hay límite superior
+        :return: la lista de los elementos, en orden
+        """
+        inicio, fin = self.__limites(desde, hasta)
+        return Lista.desde_iterable(self.__datos[inicio:fin])
+
+
+    def contar_en_rango(self, desde: Any = None, hasta: Any = None) -> int:
+        """
+        Cuenta los elementos cuya clave está entre desde y hasta, ambos incluidos, en O(log n)
+        :param desde: el menor valor de la clave. Si es None, no hay límite inferior
+        :param hasta: el mayor valor de la clave. Si es None, no hay límite superior
+        :return: la cantidad de elementos
+        """
+        inicio, fin = self.__limites(desde, hasta)
+        return fin - inicio
+
+
+    def piso(self, valor: Any) -> Optional[T]:
+        """
+        Obtiene el último elemento cuya clave es menor o igual al valor
+        :param valor: el valor de la clave
+        :return: el elemento, o None si todas las claves son mayores
+        """
+        posicion = bisect_right(self.__claves, self.__clave_de_valor(valor))
+        return self.__datos[posicion - 1] if posicion > 0 else None
+
+
+    def techo(self, valor: Any) -> Optional[T]:
+        """
+        Obtiene el primer elemento cuya clave es mayor o igual al valor
+        :param valor: el valor de la clave
+        :return: el elemento, o None si todas las claves son menores
+        """
+        posicion = bisect_left(self.__claves, self.__clave_de_valor(valor))
+        return self.__datos[posicion] if posicion < len(self.__datos) else None
+
+
+    def fusionar(self, otra: 'ListaOrdenada[T]') -> 'ListaOrdenada[T]':
+        """
+        Une esta lista con otra ordenada por la misma clave, en O(n + m).
+        Si hay claves iguales, primero quedan los elementos de esta lista.
+        :param otra: la otra lista ordenada
+        :return: una nueva lista ordenada con los elementos de las dos
+        """
+        claves1, datos1 = self.__claves, self.__datos
+        claves2, datos2 = otra.__claves, otra.__datos
+        claves, datos = [], []
+        i = j = 0
+        n, m = len(claves1), len(claves2)
+        while i < n and j < m:
+            if claves2[j] < claves1[i]:
+                claves.append(claves2[j])
+                datos.append(datos2[j])
+                j += 1
+            else:
+                claves.append(claves1[i])
+                datos.append(datos1[i])
+                i += 1
+        claves.extend(claves1[i:])
+        datos.extend(datos1[i:])
+        claves.extend(claves2[j:])
+        datos.extend(datos2[j:])
+        return self.__nueva(claves, datos)
+
+
+    def _pares(self) -> Iterator[tuple]:
+        """
+        Recorre las parejas (clave, elemento) en orden
+        """
+        return zip(self.__claves, self.__datos)
+
+
+    def _con_pares(self, pares: Iterable[tuple]) -> 'ListaOrdenada[T]':
+        """
+        Crea una lista ordenada con el mismo criterio a partir de parejas (clave, elemento) ordenadas
+        """
+        claves, datos = [], []
+        for clave, elemento in pares:
+            claves.append(clave)
+            datos.append(elemento)
+        return self.__nueva(claves, datos)
+
+
+    def a_lista(self) -> Lista[T]:
+        """
+        Obtiene una Lista con los elementos, en orden
+        :return: la lista con los elementos
+        """
+        return Lista.desde_iterable(self.__datos)
+
+
+    def __str__(self) -> str:
+        return 'ListaOrdenada[' + ', '.join(map(str, self.__datos)) + ']'
+
+
+def fusionar_ordenadas(*listas: ListaOrdenada[T]) -> ListaOrdenada[T]:
+    """
+    Une varias listas ordenadas por la misma clave (fusión de k vías) en O(n log k).
+    Si hay claves iguales, quedan en el orden de las listas recibidas.
+    :param listas: las listas ordenadas
+    :return: una nueva lista ordenada con los elementos de todas
+    """
+    if not listas:
+        return ListaOrdenada()
+    return listas[0]._con_pares(heapq.merge(*[lista._pares() for lista in listas], key=itemgetter(0)))
+
+
+# ---------------------------------------------------------------------
+# Uniones entre listas
+
+def _funcion_clave(clave: str | Callable[..., Any], lista: Lista) -> Callable[..., Any]:
+    """
+    Obtiene la función que calcula la clave de los elementos de la lista
+    :param clave: un string de atributos, como en es_menor_que, o una función
+    :param lista: la lista cuyos elementos se van a procesar
+    :return: la función clave
+    """
+    if not isinstance(clave, str):
+        return clave
+    if lista.vacia:
+        return compilar_atributos(clave).clave
+    return comparador_para(clave, lista.primero).clave
+
+
+def unir(lista_izq: Lista[T], lista_der: Lista[R], clave_izq: str | Callable[[T], Any],
+         clave_der: str | Callable[[R], Any], tipo: str = "inner",
+         combinar: Callable[[T, Optional[R]], Any] = None, ordenadas: bool = False) -> Lista:
+    """
+    Une dos listas de registros por una clave, como un JOIN de SQL. Por ejemplo:
+    unir(municipios, departamentos, "departamento", "nombre")
+    Usa una tabla hash construida con la lista más pequeña y recorre la más grande,
+    así que toma O(n + m) más el tamaño del resultado.
+    :param lista_izq: la lista de la izquierda
+    :param lista_der: la lista de la derecha
+    :param clave_izq: los atributos de la clave en la lista izquierda, o una función
+    :param clave_der: los atributos de la clave en la lista derecha, o una función
+    :param tipo: "inner" para obtener solo las parejas que coinciden, o "left" para
+                 incluir también los elementos de la izquierda sin pareja (con None)
+    :param combinar: una función que recibe (izq, der) y crea el registro del resultado.
+                     Si no se da, el resultado tiene tuplas (izq, der).
+    :param ordenadas: True si las dos listas ya están ordenadas por sus claves. En ese
+                      caso se usa una unión por mezcla, que no necesita la tabla hash.
+    :return: la lista con las parejas unidas. Las parejas salen en el orden de la lista
+             que se recorre (la más grande, o la izquierda si son ordenadas); en una unión
+             "left" con la izquierda más pequeña, las que no tienen pareja van al final.
+    """
+    if tipo not in ("inner", "left"):
+        raise ValueError(f"Tipo de unión desconocido: '{tipo}'")
+    if combinar is None:
+        combinar = _pareja
+    clave_izq = _funcion_clave(clave_izq, lista_izq)
+    clave_der = _funcion_clave(clave_der, lista_der)
+    if ordenadas:
+        return Lista.desde_iterable(_unir_por_mezcla(lista_izq, lista_der, clave_izq, clave_der, tipo, combinar))
+
+    resultado = Lista()
+    if lista_der.tam <= lista_izq.tam:
+        # Tabla con la derecha; se recorre la izquierda
+        tabla = _tabla_hash(lista_der, clave_der)
+        for izq in lista_izq:
+            parejas = tabla.get(clave_izq(izq))
+            if parejas is not None:
+                resultado.extender(combinar(izq, der) for der in parejas)
+            elif tipo == "left":
+                resultado.agregar(combinar(izq, None))
+    else:
+        # Tabla con la izquierda; se recorre la derecha
+        tabla = _tabla_hash(lista_izq, clave_izq)
+        unidos = set()
+        for der in lista_der:
+            parejas = tabla.get(clave_der(der))
+            if parejas is not None:
+                for izq in parejas:
+                    unidos.add(id(izq))
+                    resultado.agregar(combinar(izq, der))
+        if tipo == "left":
+            resultado.extender(combinar(izq, None) for izq in lista_izq if id(izq) not in unidos)
+    return resultado
+
+
+def _pareja(izq: Any, der: Any) -> tuple:
+    return izq, der
+
+
+def _tabla_hash(lista: Lista, clave: Callable[..., Any]) -> dict:
+    tabla = {}
+    for elemento in lista:
+        k = clave(elemento)
+        if k in tabla:
+            tabla[k].append(elemento)
+        else:
+            tabla[k] = [elemento]
+    return tabla
+
+
+def _unir_por_mezcla(lista_izq: Lista, lista_der: Lista, clave_izq: Callable[..., Any],
+                     clave_der: Callable[..., Any], tipo: str, combinar: Callable[..., Any]) -> Iterator:
+    """
+    Unión por mezcla de dos listas ordenadas por sus claves. Recorre las dos
+    listas una sola vez, emparejando los grupos de claves iguales.
+    """
+    izquierda = [(clave_izq(elemento), elemento) for elemento in lista_izq]
+    derecha = [(clave_der(elemento), elemento) for elemento in lista_der]
+    i = j = 0
+    n, m = len(izquierda), len(derecha)
+    while i < n:
+        k = izquierda[i][0]
+        while j < m and derecha[j][0] < k:
+            j += 1
+        fin_der = j
+        while fin_der < m and derecha[fin_der][0] == k:
+            fin_der += 1
+        while i < n and izquierda[i][0] == k:
+            izq = izquierda[i][1]
+            if fin_der > j:
+                for _, der in derecha[j:fin_der]:
+                    yield combinar(izq, der)
+            elif tipo == "left":
+                yield combinar(izq, None)
+            i += 1
+        j = fin_der
+
+
+# ---------------------------------------------------------------------
+# Ordenamiento externo
+
+def _escribir_bloque(registros: list, directorio: Optional[str]):
+    """
+    Guarda los registros en un archivo temporal, serializados uno por uno con
+    pickle, para poder leerlos luego en lotes del tamaño que haga falta
+    :return: el archivo temporal, listo para leerse desde el principio
+    """
+    archivo = tempfile.TemporaryFile(dir=directorio)
+    for registro in registros:
+        pickle.dump(registro, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+    archivo.seek(0)
+    return archivo
+
+
+def _leer_bloque(archivo, tam_lote: int) -> Iterator:
+    """
+    Lee los registros guardados en un archivo temporal, de a tam_lote registros a la vez
+    """
+    while True:
+        lote = []
+        try:
+            for _ in range(tam_lote):
+                lote.append(pickle.load(archivo))
+        except EOFError:
+            yield from lote
+            return
+        yield from lote
+
+
+def ordenar_externo(registros: Iterable[T], menor_que: Callable[..., bool] = None, atributo: str = None,
+                    descendente: bool = False, max_en_memoria: int = 100_000,
+                    directorio: str = None) -> Iterator[T]:
+    """
+    Ordena registros que no caben en memoria. Lee los registros en bloques de
+    max_en_memoria, ordena cada bloque y lo guarda en un archivo temporal, y
+    luego mezcla todos los bloques. Los registros se entregan uno por uno, así
+    que el resultado también puede procesarse sin cargarlo completo.
+    El ordenamiento es estable, igual que Lista.ordenar.
+    :param registros: cualquier iterable de registros, por ejemplo un generador que lee un archivo.
+                      Los registros deben poder serializarse con pickle.
+    :param menor_que: indica el criterio de comparación de los registros
+    :param atributo: los atributos usados como criterio, por ejemplo "estrato, -edad"
+    :param descendente: True si se quieren los registros de mayor a menor
+    :param max_en_memoria: la cantidad máxima de registros que se tienen en memoria a la vez
+    :param directorio: el directorio donde se crean los archivos temporales
+    :return: un generador con los registros en orden
+    """
+    if max_en_memoria < 1:
+        raise ValueError("max_en_memoria debe ser mayor que cero")
+    iterador = iter(registros)
+    bloque = list(islice(iterador, max_en_memoria))
+    if not bloque:
+        return
+    clave = clave_de_orden(menor_que, atributo, bloque[0])
+    bloque.sort(key=clave, reverse=descendente)
+    # Basta con mirar un registro más para saber si todo cupo en un solo bloque
+    siguiente = next(iterador, _VACIO)
+    if siguiente is _VACIO:
+        yield from bloque
+        return
+
+    iterador = chain((siguiente,), iterador)
+    del siguiente
+    archivos = []
+    try:
+        while bloque:
+            archivos.append(_escribir_bloque(bloque, directorio))
+            # Se sueltan los registros guardados antes de leer el siguiente bloque
+            bloque.clear()
+            bloque = list(islice(iterador, max_en_memoria))
+            bloque.sort(key=clave, reverse=descendente)
+        # La mezcla lee un lote de cada archivo a la vez: entre todos no pueden pasar de max_en_memoria
+        tam_lote = max(1, min(1_000, max_en_memoria // len(archivos)))
+        yield from heapq.merge(*[_leer_bloque(archivo, tam_lote) for archivo in archivos],
+                               key=clave, reverse=descendente)
+    finally:
+        for archivo in archivos:
+            archivo.close()
+
+
+# ---------------------------------------------------------------------
+# Ejecución en paralelo
+
+def _seleccionar_trozo(selector: Callable[..., R], trozo: list) -> list:
+    return list(map(selector, trozo))
+
+
+def _filtrar_trozo(predicado: Callable[..., bool], trozo: list) -> list:
+    return list(filter(predicado, trozo))
+
+
+def _contar_trozo(predicado: Callable[..., bool], trozo: list) -> int:
+    return sum(1 for elemento in trozo if predicado(elemento))
+
+
+def _reducir_trozo(operacion: Callable[..., T], trozo: list) -> T:
+    return reduce(operacion, trozo)
+
+
+class EjecutorParalelo(Generic[T]):
+    """
+    Ejecuta las operaciones de una lista en un grupo de procesos. Los elementos
+    se dividen en trozos; a cada proceso se le envía solo su trozo, y los
+    resultados se unen conservando el orden original. Si hay pocos elementos
+    o un solo trabajador, todo se ejecuta en el proceso actual.
+    Se puede usar con with para reutilizar los mismos procesos en varias
+    operaciones; si no, cada operación crea y cierra sus procesos.
+    """
+
+    def __init__(self, datos: list, trabajadores: int = None, minimo: int = 10_000, tam_trozo: int = None):
+        """
+        Crea el ejecutor
+        :param datos: los elementos sobre los que se trabaja
+        :param trabajadores: la cantidad de procesos. Por defecto, la cantidad de núcleos
+        :param minimo: con menos elementos que este número, todo se ejecuta en este proceso
+        :param tam_trozo: la cantidad de elementos que se envía a cada proceso de una vez.
+                          Por defecto se hacen unos cuatro trozos por trabajador.
+        """
+        self.__datos = datos
+        self.__trabajadores = trabajadores or os.cpu_count() or 1
+        self.__minimo = minimo
+        self.__tam_trozo = tam_trozo
+        self.__ejecutor = None
+
+
+    def __enter__(self) -> 'EjecutorParalelo[T]':
+        if self.__trabajadores > 1:
+            self.__ejecutor = ProcessPoolExecutor(self.__trabajadores)
+        return self
+
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+    def cerrar(self) -> None:
+        """
+        Termina los procesos del ejecutor, si los hay
+        :return: None
+        """
+        if self.__ejecutor is not None:
+            self.__ejecutor.shutdown()
+            self.__ejecutor = None
+
+
+    @property
+    def es_serial(self) -> bool:
+        """
+        True si las operaciones se ejecutan en el proceso actual
+        """
+        return self.__trabajadores <= 1 or len(self.__datos) < max(self.__minimo, 1)
+
+
+    def __ejecutar(self, funcion: Callable[..., Any], operacion: Callable[..., Any]) -> list:
+        """
+        Aplica la función a cada trozo de los datos y retorna los resultados en orden
+        """
+        datos = self.__datos
+        if self.es_serial:
+            return [funcion(operacion, datos)]
+        tam_trozo = self.__tam_trozo or -(-len(datos) // (4 * self.__trabajadores))
+        trozos = (datos[i:i + tam_trozo] for i in range(0, len(datos), tam_trozo))
+        if self.__ejecutor is not None:
+            return list(self.__ejecutor.map(funcion, repeat(operacion), trozos))
+        with ProcessPoolExecutor(self.__trabajadores) as ejecutor:
+            return list(ejecutor.map(funcion, repeat(operacion), trozos))
+
+
+    def seleccionar(self, selector: Callable[..., R]) -> Lista[R]:
+        """
+        Aplica el selector a cada elemento, en paralelo
+        :param selector: la operación a realizar sobre cada elemento
+        :return: la lista con los resultados, en el orden original
+        """
+        return Lista.desde_iterable(chain.from_iterable(self.__ejecutar(_seleccionar_trozo, selector)))
+
+
+    def filtrar(self, predicado: Callable[..., bool]) -> Lista[T]:
+        """
+        Obtiene, en paralelo, los elementos que cumplen con el predicado
+        :param predicado: una función que devuelve True si el elemento cumple con el predicado
+        :return: la lista de los elementos que cumplen, en el orden original
+        """
+        return Lista.desde_iterable(chain.from_iterable(self.__ejecutar(_filtrar_trozo, predicado)))
+
+
+    def contar(self, predicado: Callable[..., bool]) -> int:
+        """
+        Cuenta, en paralelo, los elementos que cumplen con el predicado
+        :param predicado: el predicado a aplicar a cada elemento
+        :return: la cantidad de elementos que cumplen con el predicado
+        """
+        return sum(self.__ejecutar(_contar_trozo, predicado))
+
+
+    def acumular(self, valor_inicial: T, operacion: Callable[[T, T], T]) -> T:
+        """
+        Acumula los elementos en paralelo. Cada proceso acumula su trozo y luego
+        se acumulan los resultados de los trozos, así que la operación debe ser
+        asociativa y recibir y retornar valores del mismo tipo (como la suma).
+        :param valor_inicial: el valor inicial del acumulador
+        :param operacion: la operación asociativa de acumulación
+        :return: el último valor del acumulador
+        """
+        if len(self.__datos) == 0:
+            return valor_inicial
+        return reduce(operacion, self.__ejecutar(_reducir_trozo, operacion), valor_inicial)
+
+
+    def reducir(self, operacion: Callable[[T, T], T]) -> Optional[T]:
+        """
+        Reduce los elementos en paralelo con una operación asociativa
+        :param operacion: la operación asociativa
+        :return: el resultado, o None si no hay elementos
+        """
+        if len(self.__datos) == 0:
+            return None
+        return reduce(operacion, self.__ejecutar(_reducir_trozo, operacion))
+
+
+# ---------------------------------------------------------------------
+
+class Node(Generic[T]):
+    """"
+    Este es un nodo de la lista que se usará para guardar datos en la pila
+    """
+    def __init__(self, value: T):
+        self.info = value
+        self.siguiente = None
+
+
+class Pila(Generic[T]):
+    """
+    Una pila es una estructura de datos que sigue la filosofía de
+    LIFO, el primero que entra es el último en salir.
+    Los elementos se pueden guardar en nodos enlazados ("enlazada", la forma
+    original) o en un arreglo de Python ("arreglo"), que no crea un objeto
+    por cada elemento. En ambos casos tam toma O(1).
+    """
+
+    # Constructor
+    def __init__(self, almacenamiento: str = "enlazada"):
+        if almacenamiento not in ("enlazada", "arreglo"):
+            raise ValueError(f"Almacenamiento desconocido: {almacenamiento}")
+        self.__cabeza = None
+        self.__tam = 0
+        # La lista con los elementos en modo "arreglo", con el tope al final; None en modo "enlazada"
+        self.__arreglo = [] if almacenamiento == "arreglo" else None
+
+    # Forma en la que se guardan los elementos: "enlazada" o "arreglo"
+    @property
+    def almacenamiento(self) -> str:
+        return "enlazada" if self.__arreglo is None else "arreglo"
+
+    # Agregar un elemento
+    def apilar(self, elem: T) -> None:
+        if self.__arreglo is not None:
+            self.__arreglo.append(elem)
+            return
+        nodo = Node(elem)
+        nodo.siguiente = self.__cabeza
+        self.__cabeza = nodo
+        self.__tam += 1
+
+
+    def apilar_varios(self, elementos: Iterable[T]) -> None:
+        """
+        Apila los elementos en orden, así que el último queda en el tope
+        :param elementos: los elementos a apilar
+        :return: None
+        """
+        if self.__arreglo is not None:
+            self.__arreglo.extend(elementos)
+            return
+        for elemento in elementos:
+            self.apilar(elemento)
+
+
+    # Elimina el primer elemento de la pila
+    def desapilar(self) -> None:
+        if self.__arreglo is not None:
+            if not self.__arreglo:
+                raise IndexError
+            self.__arreglo.pop()
+            return
+        if self.__cabeza is None:
+            raise IndexError
+        self.__cabeza = self.__cabeza.siguiente
+        self.__tam -= 1
+
+
+    def desapilar_n(self, k: int) -> Lista[T]:
+        """
+        Desapila los k elementos de encima de la pila
+        :param k: la cantidad de elementos a desapilar
+        :return: una lista con los elementos desapilados, empezando por el que estaba en el tope
+        """
+        if k < 0 or k > self.tam:
+            raise IndexError
+        if self.__arreglo is not None:
+            inicio = len(self.__arreglo) - k
+            resultado = Lista.desde_iterable(reversed(self.__arreglo[inicio:]))
+            del self.__arreglo[inicio:]
+            return resultado
+        resultado = Lista.desde_iterable(islice(self, k))
+        for _ in range(k):
+            self.__cabeza = self.__cabeza.siguiente
+        self.__tam -= k
+        return resultado
+
+
+    # Obtiene el primer elemento de la pila
+    @property
+    def tope(self) -> T:
+        if self.__arreglo is not None:
+            if not self.__arreglo:
+                raise IndexError
+            return self.__arreglo[-1]
+        if self.__cabeza is None:
+            raise IndexError
+        return self.__cabeza.info
+    
+
+    # Permite saber si la pila está vacía
+    @property
+    def vacia(self) -> bool:
+        if self.__arreglo is not None:
+            return not self.__arreglo
+        return self.__cabeza is None
+
+    # Cantidad de elementos de la pila
+    @property
+    def tam(self) -> int:
+        if self.__arreglo is not None:
+            return len(self.__arreglo)
+        return self.__tam
+
+    def __len__(self) -> int:
+        return self.tam
+
+    def __bool__(self) -> bool:
+        """
+        Una pila vacía es falsa en una condición, como if pila:
+        Antes de que existiera __len__ toda pila era verdadera; es más claro usar pila.vacia
+        """
+        return not self.vacia
+
+    # Crea una copia de la pila
+    def copiar(self) -> "Pila[T]":
+        copia = Pila[T](self.almacenamiento)
+        if self.__arreglo is not None:
+            copia.__arreglo = list(self.__arreglo)
+            return copia
+        act = self.__cabeza
+        act_copia = None
+        while act:
+            nodo = Node(act.info)
+            if copia.__cabeza is None:
+                copia.__cabeza = nodo
+                act_copia = nodo
+            else:
+                act_copia.siguiente = nodo
+                act_copia = nodo
+            act = act.siguiente
+        copia.__tam = self.__tam
+        return copia
+    
+
+    # Representación como str de la pila
+    def __iter__(self) -> Iterator[T]:
+        """
+        Recorre los elementos de la pila desde el tope, sin desapilarlos
+        """
+        if self.__arreglo is not None:
+            yield from reversed(self.__arreglo)
+            return
+        act = self.__cabeza
+        while act:
+            yield act.info
+            act = act.siguiente
+
+
+    def __str__(self):
+        return " -> ".join(map(str, self))
+
+
+    def __repr__(self) -> str:
+        """
+        Representación abreviada de la pila, desde el tope, con como máximo LIMITE_REPR elementos
+        """
+        return _repr_limitado('Pila', iter(self), self.tam)
+    
+
+# ---------------------------------------------------------------------
+def crear_pila(*elementos: T, almacenamiento: str = "enlazada") -> Pila[T]:
+    """
+    Permite crear una pila con los elementos recibidos como parámetro
+    :param elementos: los datos a guardar en la pila
+    :param almacenamiento: "enlazada" para usar nodos o "arreglo" para usar un arreglo
+    :return: La nueva pila con los elementos recibidos
+    """
+    resultado = Pila[T](almacenamiento)
+    resultado.apilar_varios(elementos)
+    return resultado
+
+
+# ---------------------------------------------------------------------
+
+class PilaPersistente(Generic[T]):
+    """
+    Una pila inmutable: apilar y desapilar no modifican la pila, sino que
+    retornan una nueva. Las pilas nuevas comparten los nodos de la anterior,
+    así que apilar, desapilar y copiar toman O(1), y guardar una copia de la
+    pila en cada paso (por ejemplo, al hacer backtracking) no cuesta nada.
+    """
+
+    def __init__(self):
+        self.__cabeza = None
+        self.__tam = 0
+
+
+    @staticmethod
+    def __crear(cabeza: Optional[Node], tam: int) -> 'PilaPersistente[T]':
+        """
+        Crea una pila persistente a partir de una cadena de nodos que ya existe
+        """
+        pila = PilaPersistente[T]()
+        pila.__cabeza = cabeza
+        pila.__tam = tam
+        return pila
+
+
+    def apilar(self, elem: T) -> 'PilaPersistente[T]':
+        """
+        Obtiene una nueva pila con el elemento en el tope
+        :param elem: el elemento que vamos a agregar
+        :return: la nueva pila; esta no cambia
+        """
+        nodo = Node(elem)
+        nodo.siguiente = self.__cabeza
+        return PilaPersistente.__crear(nodo, self.__tam + 1)
+
+
+    def apilar_varios(self, elementos: Iterable[T]) -> 'PilaPersistente[T]':
+        """
+        Obtiene una nueva pila con los elementos apilados en orden, así que el último queda en el tope
+        :param elementos: los elementos a apilar
+        :return: la nueva pila; esta no cambia
+        """
+        cabeza = self.__cabeza
+        tam = self.__tam
+        for elemento in elementos:
+            nodo = Node(elemento)
+            nodo.siguiente = cabeza
+            cabeza = nodo
+            tam += 1
+        return PilaPersistente.__crear(cabeza, tam)
+
+
+    def desapilar(self) -> 'PilaPersistente[T]':
+        """
+        Obtiene la pila sin el elemento del tope
+        :return: la nueva pila; esta no cambia
+        """
+        if self.__cabeza is None:
+            raise IndexError
+        return PilaPersistente.__crear(self.__cabeza.siguiente, self.__tam - 1)
+
+
+    @property
+    def tope(self) -> T:
+        if self.__cabeza is None:
+            raise IndexError
+        return self.__cabeza.info
+
+
+    @property
+    def vacia(self) -> bool:
+        return self.__cabeza is None
+
+
+    @property
+    def tam(self) -> int:
+        return self.__tam
+
+
+    def __len__(self) -> int:
+        return self.__tam
+
+
+    def copiar(self) -> 'PilaPersistente[T]':
+        """
+        Como la pila no cambia, la copia es la misma pila
+        :return: la misma pila
+        """
+        return self
+
+
+    def a_pila(self, almacenamiento: str = "enlazada") -> Pila[T]:
+        """
+        Obtiene una Pila normal con los mismos elementos. En modo "enlazada"
+        la Pila usa los mismos nodos, así que toma O(1): la Pila nunca modifica
+        un nodo después de crearlo.
+        :param almacenamiento: el almacenamiento de la nueva Pila, "enlazada" o "arreglo"
+        :return: la nueva pila
+        """
+        pila = Pila[T](almacenamiento)
+        if almacenamiento == "enlazada":
+            pila._Pila__cabeza = self.__cabeza
+            pila._Pila__tam = self.__tam
+        else:
+            pila.apilar_varios(reversed(list(self)))
+        return pila
+
+
+    @staticmethod
+    def desde_pila(pila: Pila[T]) -> 'PilaPersistente[T]':
+        """
+        Crea una pila persistente con los elementos de una Pila. Si la Pila es
+        "enlazada" se usan sus mismos nodos, así que toma O(1).
+        :param pila: la pila con los elementos
+        :return: la pila persistente
+        """
+        if pila.almacenamiento == "enlazada":
+            return PilaPersistente.__crear(pila._Pila__cabeza, pila.tam)
+        return PilaPersistente[T]().apilar_varios(reversed(list(pila)))
+
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Recorre los elementos de la pila desde el tope
+        """
+        act = self.__cabeza
+        while act:
+            yield act.info
+            act = act.siguiente
+
+
+    def __str__(self):
+        return " -> ".join(map(str, self))
+
+
+    def __repr__(self) -> str:
+        return _repr_limitado('PilaPersistente', iter(self), self.__tam)
+
+
+def crear_pila_persistente(*elementos: T) -> PilaPersistente[T]:
+    """
+    Permite crear una pila persistente con los elementos recibidos como parámetro
+    :param elementos: los datos a guardar en la pila, el último queda en el tope
+    :return: La nueva pila con los elementos recibidos
+    """
+    return PilaPersistente[T]().apilar_varios(elementos)
+
+
+# ---------------------------------------------------------------------
+
+class Cola(Generic[T]):
+    """
+    Una cola es una estructura de datos que sigue la filosofía de
+    FIFO, el primero que entra es el primero en salir. Los elementos se
+    guardan en un deque (bloques enlazados), así que encolar y desencolar
+    toman O(1).
+    """
+
+    def __init__(self):
+        self.__datos = deque()
+
+
+    def encolar(self, elem: T) -> None:
+        """
+        Agrega un elemento al final de la cola
+        :param elem: el elemento que vamos a agregar
+        :return: None
+        """
+        self.__datos.append(elem)
+
+
+    def desencolar(self) -> None:
+        """
+        Elimina el elemento que está al frente de la cola
+        :return: None
+        """
+        if not self.__datos:
+            raise IndexError
+        self.__datos.popleft()
+
+
+    @property
+    def frente(self) -> T:
+        """
+        El elemento que está al frente de la cola, el próximo en salir
+        """
+        if not self.__datos:
+            raise IndexError
+        return self.__datos[0]
+
+
+    @property
+    def vacia(self) -> bool:
+        return not self.__datos
+
+
+    @property
+    def tam(self) -> int:
+        return len(self.__datos)
+
+
+    def copiar(self) -> "Cola[T]":
+        """
+        Crea una copia de la cola
+        :return: la nueva cola con los mismos elementos
+        """
+        copia = type(self)()
+        copia.__datos = self.__datos.copy()
+        return copia
+
+
+    def __len__(self) -> int:
+        return len(self.__datos)
+
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Recorre los elementos de la cola desde el frente, sin desencolarlos
+        """
+        return iter(self.__datos)
+
+
+    def __str__(self):
+        return " <- ".join(map(str, self.__datos))
+
+
+    def __repr__(self) -> str:
+        """
+        Representación abreviada de la cola, desde el frente, con como máximo LIMITE_REPR elementos
+        """
+        return _repr_limitado(type(self).__name__, iter(self.__datos), len(self.__datos))
+
+
+class Bicola(Cola[T]):
+    """
+    Una bicola es una cola en la que se pueden agregar y eliminar elementos
+    tanto al frente como al final. Todas estas operaciones toman O(1).
+    """
+
+    def encolar_al_frente(self, elem: T) -> None:
+        """
+        Agrega un elemento al frente de la bicola
+        :param elem: el elemento que vamos a agregar
+        :return: None
+        """
+        self._Cola__datos.appendleft(elem)
+
+
+    def desencolar_al_final(self) -> None:
+        """
+        Elimina el elemento que está al final de la bicola
+        :return: None
+        """
+        if not self._Cola__datos:
+            raise IndexError
+        self._Cola__datos.pop()
+
+
+    @property
+    def final(self) -> T:
+        """
+        El elemento que está al final de la bicola
+        """
+        if not self._Cola__datos:
+            raise IndexError
+        return self._Cola__datos[-1]
+
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._Cola__datos)
+
+
+# ---------------------------------------------------------------------
+def crear_cola(*elementos: T) -> Cola[T]:
+    """
+    Permite crear una cola con los elementos recibidos como parámetro
+    :param elementos: los datos a guardar en la cola, el primero queda al frente
+    :return: La nueva cola con los elementos recibidos
+    """
+    resultado = Cola[T]()
+    for elemento in elementos:
+        resultado.encolar(elemento)
+    return resultado
+
+
+def crear_bicola(*elementos: T) -> Bicola[T]:
+    """
+    Permite crear una bicola con los elementos recibidos como parámetro
+    :param elementos: los datos a guardar en la bicola, el primero queda al frente
+    :return: La nueva bicola con los elementos recibidos
+    """
+    resultado = Bicola[T]()
+    for elemento in elementos:
+        resultado.encolar(elemento)
+    return resultado
+
+
+# ---------------------------------------------------------------------
+# Pilas y colas para varios hilos o tareas
+
+class _EstructuraConcurrente(Generic[T]):
+    """
+    Base de PilaConcurrente y ColaConcurrente: un deque protegido por un
+    candado, con una condición para esperar a que haya elementos y otra para
+    esperar a que haya espacio.
+    """
+
+    def __init__(self, lifo: bool, capacidad: Optional[int]):
+        if capacidad is not None and capacidad <= 0:
+            raise ValueError("La capacidad debe ser positiva")
+        self.__datos = deque()
+        self.__lifo = lifo
+        self.__capacidad = capacidad
+        self.__cerrada = False
+        candado = threading.Lock()
+        self.__no_vacia = threading.Condition(candado)
+        self.__no_llena = threading.Condition(candado)
+
+
+    def _poner(self, elem: T, bloquear: bool, tiempo: Optional[float]) -> None:
+        with self.__no_llena:
+            if self.__capacidad is not None and len(self.__datos) >= self.__capacidad:
+                if not bloquear:
+                    raise OverflowError("La estructura está llena")
+                if not self.__no_llena.wait_for(
+                        lambda: len(self.__datos) < self.__capacidad or self.__cerrada, tiempo):
+                    raise TimeoutError("Se acabó el tiempo de espera")
+            if self.__cerrada:
+                raise ValueError("La estructura está cerrada")
+            self.__datos.append(elem)
+            self.__no_vacia.notify()
+
+
+    def _sacar(self, bloquear: bool, tiempo: Optional[float]) -> T:
+        with self.__no_vacia:
+            if not self.__datos:
+                if not bloquear or self.__cerrada:
+                    raise IndexError
+                if not self.__no_vacia.wait_for(lambda: self.__datos or self.__cerrada, tiempo):
+                    raise TimeoutError("Se acabó el tiempo de espera")
+                if not self.__datos:
+                    raise IndexError
+            elem = self.__datos.pop() if self.__lifo else self.__datos.popleft()
+            self.__no_llena.notify()
+            return elem
+
+
+    def _ver(self) -> T:
+        with self.__no_vacia:
+            if not self.__datos:
+                raise IndexError
+            return self.__datos[-1] if self.__lifo else self.__datos[0]
+
+
+    def cerrar(self) -> None:
+        """
+        Cierra la estructura: ya no se pueden agregar elementos, y quienes
+        esperan para sacar uno reciben IndexError cuando se acaban. Sirve para
+        avisar a los consumidores que ya no llegarán más datos.
+        """
+        with self.__no_vacia:
+            self.__cerrada = True
+            self.__no_vacia.notify_all()
+            self.__no_llena.notify_all()
+
+
+    @property
+    def cerrada(self) -> bool:
+        return self.__cerrada
+
+
+    @property
+    def capacidad(self) -> Optional[int]:
+        return self.__capacidad
+
+
+    @property
+    def tam(self) -> int:
+        return len(self.__datos)
+
+
+    @property
+    def vacia(self) -> bool:
+        return not self.__datos
+
+
+    @property
+    def llena(self) -> bool:
+        return self.__capacidad is not None and len(self.__datos) >= self.__capacidad
+
+
+    def __len__(self) -> int:
+        return len(self.__datos)
+
+
+class PilaConcurrente(_EstructuraConcurrente[T]):
+    """
+    Una pila que se puede usar desde varios hilos a la vez. Puede tener una
+    capacidad máxima; desapilar puede esperar a que haya elementos y apilar
+    puede esperar a que haya espacio.
+    """
+
+    def __init__(self, capacidad: Optional[int] = None):
+        """
+        Crea la pila
+        :param capacidad: la cantidad máxima de elementos, o None si no hay límite
+        """
+        super().__init__(True, capacidad)
+
+
+    def apilar(self, elem: T, bloquear: bool = True, tiempo: Optional[float] = None) -> None:
+        """
+        Agrega un elemento en el tope de la pila
+        :param elem: el elemento que vamos a agregar
+        :param bloquear: si la pila está llena, esperar a que haya espacio (True) o lanzar OverflowError (False)
+        :param tiempo: cuántos segundos esperar como máximo; después se lanza TimeoutError
+        :return: None
+        """
+        self._poner(elem, bloquear, tiempo)
+
+
+    def desapilar(self, bloquear: bool = True, tiempo: Optional[float] = None) -> T:
+        """
+        Saca el elemento del tope de la pila
+        :param bloquear: si la pila está vacía, esperar a que haya un elemento (True) o lanzar IndexError (False)
+        :param tiempo: cuántos segundos esperar como máximo; después se lanza TimeoutError
+        :return: el elemento que estaba en el tope
+        """
+        return self._sacar(bloquear, tiempo)
+
+
+    @property
+    def tope(self) -> T:
+        return self._ver()
+
+
+class ColaConcurrente(_EstructuraConcurrente[T]):
+    """
+    Una cola que se puede usar desde varios hilos a la vez, por ejemplo entre
+    productores y consumidores. Puede tener una capacidad máxima; desencolar
+    puede esperar a que haya elementos y encolar puede esperar a que haya espacio.
+    """
+
+    def __init__(self, capacidad: Optional[int] = None):
+        """
+        Crea la cola
+        :param capacidad: la cantidad máxima de elementos, o None si no hay límite
+        """
+        super().__init__(False, capacidad)
+
+
+    def encolar(self, elem: T, bloquear: bool = True, tiempo: Optional[float] = None) -> None:
+        """
+        Agrega un elemento al final de la cola
+        :param elem: el elemento que vamos a agregar
+        :param bloquear: si la cola está llena, esperar a que haya espacio (True) o lanzar OverflowError (False)
+        :param tiempo: cuántos segundos esperar como máximo; después se lanza TimeoutError
+        :return: None
+        """
+        self._poner(elem, bloquear, tiempo)
+
+
+    def desencolar(self, bloquear: bool = True, tiempo: Optional[float] = None) -> T:
+        """
+        Saca el elemento que está al frente de la cola
+        :param bloquear: si la cola está vacía, esperar a que haya un elemento (True) o lanzar IndexError (False)
+        :param tiempo: cuántos segundos esperar como máximo; después se lanza TimeoutError
+        :return: el elemento que estaba al frente
+        """
+        return self._sacar(bloquear, tiempo)
+
+
+    @property
+    def frente(self) -> T:
+        return self._ver()
+
+
+class _EstructuraAsincrona(Generic[T]):
+    """
+    Base de PilaAsincrona y ColaAsincrona: como _EstructuraConcurrente, pero
+    para tareas de asyncio; las esperas se hacen con await. Como las tareas
+    solo se alternan en los await, no hace falta un candado: cada tarea que
+    espera deja un futuro en una fila, y quien pone o saca un elemento
+    despierta a la primera.
+    """
+
+    def __init__(self, lifo: bool, capacidad: Optional[int]):
+        if capacidad is not None and capacidad <= 0:
+            raise ValueError("La capacidad debe ser positiva")
+        self.__datos = deque()
+        self.__lifo = lifo
+        self.__capacidad = capacidad
+        self.__cerrada = False
+        # Los futuros de las tareas que esperan datos y de las que esperan espacio
+        self.__esperan_datos = deque()
+        self.__esperan_espacio = deque()
+
+
+    @staticmethod
+    def __despertar(esperando: deque) -> None:
+        while esperando:
+            futuro = esperando.popleft()
+            if not futuro.done():
+                futuro.set_result(None)
+                return
+
+
+    @staticmethod
+    async def __esperar(esperando: deque, listo: Callable[[], bool], tiempo: Optional[float]) -> None:
+        """
+        Espera hasta que listo() sea verdadero
+        :param esperando: la fila de futuros donde se espera
+        :param tiempo: cuántos segundos esperar como máximo; después se lanza TimeoutError
+        """
+        ciclo = asyncio.get_running_loop()
+        limite = None if tiempo is None else ciclo.time() + tiempo
+        while not listo():
+            futuro = ciclo.create_future()
+            esperando.append(futuro)
+            try:
+                if limite is None:
+                    await futuro
+                else:
+                    await asyncio.wait_for(futuro, max(0.0, limite - ciclo.time()))
+            except BaseException as error:
+                futuro.cancel()
+                try:
+                    esperando.remove(futuro)
+                except ValueError:
+                    pass
+                if listo() and not futuro.cancelled():
+                    # Nos despertaron pero ya no vamos a sacar o poner: se despierta a otra tarea
+                    _EstructuraAsincrona.__despertar(esperando)
+                if isinstance(error, asyncio.TimeoutError):
+                    raise TimeoutError("Se acabó el tiempo de espera") from None
+                raise
+
+
+    async def _poner(self, elem: T, tiempo: Optional[float]) -> None:
+        if self.__capacidad is not None:
+            await self.__esperar(self.__esperan_espacio,
+                                 lambda: len(self.__datos) < self.__capacidad or self.__cerrada, tiempo)
+        if self.__cerrada:
+            raise ValueError("La estructura está cerrada")
+        self.__datos.append(elem)
+        self.__despertar(self.__esperan_datos)
+
+
+    async def _sacar(self, tiempo: Optional[float]) -> T:
+        await self.__esperar(self.__esperan_datos, lambda: self.__datos or self.__cerrada, tiempo)
+        if not self.__datos:
+            raise IndexError
+        elem = self.__datos.pop() if self.__lifo else self.__datos.popleft()
+        self.__despertar(self.__esperan_espacio)
+        return elem
+
+
+    def _ver(self) -> T:
+        if not self.__datos:
+            raise IndexError
+        return self.__datos[-1] if self.__lifo else self.__datos[0]
+
+
+    def cerrar(self) -> None:
+        """
+        Cierra la estructura: ya no se pueden agregar elementos, y quienes
+        esperan para sacar uno reciben IndexError cuando se acaban
+        """
+        self.__cerrada = True
+        for futuro in chain(self.__esperan_datos, self.__esperan_espacio):
+            if not futuro.done():
+                futuro.set_result(None)
+        self.__esperan_datos.clear()
+        self.__esperan_espacio.clear()
+
+
+    @property
+    def cerrada(self) -> bool:
+        return self.__cerrada
+
+
+    @property
+    def capacidad(self) -> Optional[int]:
+        return self.__capacidad
+
+
+    @property
+    def tam(self) -> int:
+        return len(self.__datos)
+
+
+    @property
+    def vacia(self) -> bool:
+        return not self.__datos
+
+
+    @property
+    def llena(self) -> bool:
+        return self.__capacidad is not None and len(self.__datos) >= self.__capacidad
+
+
+    def __len__(self) -> int:
+        return len(self.__datos)
+
+
+class PilaAsincrona(_EstructuraAsincrona[T]):
+    """
+    Una pila para tareas de asyncio: desapilar espera (con await) a que haya
+    elementos y, si la pila tiene capacidad máxima, apilar espera a que haya espacio.
+    """
+
+    def __init__(self, capacidad: Optional[int] = None):
+        """
+        Crea la pila
+        :param capacidad: la cantidad máxima de elementos, o None si no hay límite
+        """
+        super().__init__(True, capacidad)
+
+
+    async def apilar(self, elem: T, tiempo: Optional[float] = None) -> None:
+        """
+        Agrega un elemento en el tope de la pila
+        :param elem: el elemento que vamos a agregar
+        :param tiempo: cuántos segundos esperar como máximo si está llena; después se lanza TimeoutError
+        :return: None
+        """
+        await self._poner(elem, tiempo)
+
+
+    async def desapilar(self, tiempo: Optional[float] = None) -> T:
+        """
+        Saca el elemento del tope de la pila
+        :param tiempo: cuántos segundos esperar como máximo si está vacía; después se lanza TimeoutError
+        :return: el elemento que estaba en el tope
+        """
+        return await self._sacar(tiempo)
+
+
+    @property
+    def tope(self) -> T:
+        return self._ver()
+
+
+class ColaAsincrona(_EstructuraAsincrona[T]):
+    """
+    Una cola para tareas de asyncio: desencolar espera (con await) a que haya
+    elementos y, si la cola tiene capacidad máxima, encolar espera a que haya espacio.
+    """
+
+    def __init__(self, capacidad: Optional[int] = None):
+        """
+        Crea la cola
+        :param capacidad: la cantidad máxima de elementos, o None si no hay límite
+        """
+        super().__init__(False, capacidad)
+
+
+    async def encolar(self, elem: T, tiempo: Optional[float] = None) -> None:
+        """
+        Agrega un elemento al final de la cola
+        :param elem: el elemento que vamos a agregar
+        :param tiempo: cuántos segundos esperar como máximo si está llena; después se lanza TimeoutError
+        :return: None
+        """
+        await self._poner(elem, tiempo)
+
+
+    async def desencolar(self, tiempo: Optional[float] = None) -> T:
+        """
+        Saca el elemento que está al frente de la cola
+        :param tiempo: cuántos segundos esperar como máximo si está vacía; después se lanza TimeoutError
+        :return: el elemento que estaba al frente
+        """
+        return await self._sacar(tiempo)
+
+
+    @property
+    def frente(self) -> T:
+        return self._ver()
+
+
+# ---------------------------------------------------------------------
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, is_dataclass
+
+@dataclass
+class Persona:
+    """
+    Clase que representa una persona
+    """
+    __cedula: int
+    __nombre: str
+    __edad: int
+    __genero: str
+    __num_hijos: int
+    __nivel_educativo: str
+    __estrato: int
+    __ingresos: int
+    __peso: int
+    __altura: int
+    __fuma: bool
+    __usa_lentes: bool
+    __tiene_casa: bool
+    __tiene_automovil: bool
+
+    @property
+    def nombre(self) -> str:
+        return self.__nombre
+
+    @property
+    def cedula(self) -> int:
+        return self.__cedula
+
+    @property
+    def edad(self) -> int:
+        return self.__edad
+
+    @property
+    def genero(self) -> str:
+        return self.__genero
+
+    @property
+    def num_hijos(self) -> int:
+        return self.__num_hijos
+
+    @property
+    def nivel_educativo(self) -> str:
+        return self.__nivel_educativo
+
+    @property
+    def estrato(self) -> int:
+        return self.__estrato
+
+    @property
+    def ingresos(self) -> int:
+        return self.__ingresos
+
+    @property
+    def peso(self) -> int:
+        return self.__peso
+
+    @property
+    def altura(self) -> int:
+        return self.__altura
+
+    @property
+    def fuma(self) -> bool:
+        return self.__fuma
+
+    @property
+    def usa_lentes(self) -> bool:
+        return self.__usa_lentes
+
+    @property
+    def tiene_casa(self) -> bool:
+        return self.__tiene_casa
+
+    @property
+    def tiene_automovil(self) -> bool:
+        return self.__tiene_automovil
+
+
+# ---------------------------------------------
+def leer_archivo_personas(compactos: bool = False) -> Lista[Persona]:
+    """
+    Permite crear una lista con las personas que están
+    en el archivo
+    :param compactos: si es True, las personas se crean como PersonaCompacta, que ocupa menos memoria
+    :return: la lista con las personas
+    """
+    clase = PersonaCompacta if compactos else Persona
+    archivo = "https://github.com/luiscobo/poo/raw/refs/heads/main/people.csv"
+    df = pd.read_csv(archivo, sep=";", encoding="utf-8")
+    resultado = Lista[Persona]()
+    for index, row in df.iterrows():
+        cedula = row["Cedula"]
+        nombre = row["Nombres"].upper()
+        edad = row["Edad"]
+        genero = row["Genero"]
+        num_hijos = row["No de hijos"]
+        nivel_educativo = row["Nivel Educativo"]
+        estrato = row["Estrato Socio"]
+        ingresos = row["Ingresos"]
+        peso = row["Peso"]
+        altura = row["Talla"]
+        fuma = row["Fuma"] == "SI"
+        usa_lentes = row["Usa Lentes"] == "SI"
+        tiene_casa = row["Tiene Casa"] == "SI"
+        tiene_automovil = row["Tiene Automovil"] == "SI"
+        p = clase(cedula, nombre, edad, genero, num_hijos, nivel_educativo, estrato, ingresos, peso, altura, fuma, usa_lentes, tiene_casa, tiene_automovil)
+        resultado.agregar(p)
+    return resultado
+
+  
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class Departamento:
+    """
+    Clase que representa la información de un departamento de Colombia
+    """
+    nombre: str
+    cant_municipios: int
+    capital: str
+    superficie: float
+    poblacion: int
+    densidad: float
+    indice_desarrollo_humano: float
+    fecha_creacion: int
+    region: str
+
+
+# ---------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class EquipoFutbol:
+    """Atributos"""
+    año: int
+    nombre: str
+    partidos_ganados_local: int
+    partidos_ganados_visitante: int
+    partidos_perdidos_local: int
+    partidos_perdidos_visitante: int
+    partidos_empatados: int
+    goles_local: int
+    goles_visitante: int
+    goles_en_contra: int 
+
+
+# ---------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Municipio:
+    """
+    Esta es la información de un municipio de Colombia
+    """
+    codigo: int
+    nombre: str
+    poblacion_urbana: int
+    poblacion_rural: int
+    departamento: str
+    es_capital: bool 
+
+    def poblacion_total(self) -> int:
+        return self.poblacion_rural + self.poblacion_urbana
+
+
+# ---------------------------------------------------------------------
+
+def leer_archivo_departamentos(compactos: bool = False) -> Lista[Departamento]:
+    """
+    Permite obtener una lista de departamentos a partir del archivo
+    de datos que se encuentra en github
+    :param compactos: si es True, los departamentos se crean como DepartamentoCompacto
+    :return: Una lista con la información de los departamentos
+    """
+    clase = DepartamentoCompacto if compactos else Departamento
+    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/departamentos2.csv"
+    df = pd.read_csv(archivo, encoding="utf-8")
+    resultado = Lista[Departamento]()
+    for index, row in df.iterrows():
+        nombre = row["Departamento"]
+        municipios = row["Municipios"]
+        capital = row["Capital"]
+        superficie = row["Superficie"]
+        poblacion = row["Población"]
+        densidad = row["Densidad"]
+        idh = row["IDH6"]
+        fecha = row["Fecha de creación"]
+        region = row["Región"]
+        depto = clase(nombre, cant_municipios=municipios, capital=capital, superficie=superficie,
+                             poblacion=poblacion, densidad=densidad, indice_desarrollo_humano=idh, fecha_creacion=fecha,
+                             region=region)
+        resultado.agregar(depto)
+    return resultado
+
+
+# ---------------------------------------------------------------------
+
+def leer_archivo_equipos(compactos: bool = False) -> Lista[EquipoFutbol]:
+    """
+    Permite obtener una lista con la información de los equipos de fútbol de la liga
+    :param compactos: si es True, los equipos se crean como EquipoFutbolCompacto
+    :return: la lista de equipos de futbol
+    """
+    clase = EquipoFutbolCompacto if compactos else EquipoFutbol
+    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/LaLiga.csv"
+    df = pd.read_csv(archivo, encoding="utf-8")
+    lista = Lista[EquipoFutbol]()
+    for index, row in df.iterrows():
+        año = int(row["season"][:4])
+        nombre = row["club"]
+        partidos_ganados_local = int(row["home_win"])
+        partidos_ganados_visitante = int(row["away_win"])
+        partidos_perdidos_local = int(row["home_loss"])
+        partidos_perdidos_visitante = int(row["away_loss"])
+        partidos_empatados = int(row["matches_drawn"])
+        goles_local = int(row["home_goals"])
+        goles_visitante = int(row["away_goals"])
+        goles_en_contra = int(row["goals_conceded"])
+        e = clase(año, nombre, partidos_ganados_local, partidos_ganados_visitante,
+                         partidos_perdidos_local, partidos_perdidos_visitante,
+                         partidos_empatados, goles_local, goles_visitante,
+                         goles_en_contra)
+        lista.agregar(e)
+    return lista
+
+# ---------------------------------------------------------------------
+
+def leer_archivo_municipios(compactos: bool = False) -> Lista[Municipio]:
+    """
+    Permite obtener una lista con la información de los municipios de 
+    :param compactos: si es True, los municipios se crean como MunicipioCompacto
+    :return: la lista de equipos de futbol
+    """
+    clase = MunicipioCompacto if compactos else Municipio
+    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/municipios.csv"
+    df = pd.read_csv(archivo, encoding="utf-8")
+    lista = Lista[Municipio]()
+    for index, row in df.iterrows():
+        codigo = int(row["código"])
+        nombre = row["nombre"]
+        poblacion_urbana = int(row["poblaciónUrbana"])
+        poblacion_rural = int(row["poblaciónRural"])
+        departamento = row["departamento"]
+        es_capital = int(row["esCapital"]) == 1
+        m = clase(codigo=codigo, nombre=nombre, poblacion_rural=poblacion_rural,
+                      poblacion_urbana=poblacion_urbana, departamento=departamento,
+                      es_capital=es_capital)
+        lista.agregar(m)
+    return lista
+
+
+# ---------------------------------------------------------------------
+
+def pila_municipios(compactos: bool = False, almacenamiento: str = "enlazada") -> Pila[Municipio]:
+    """
+    Permite obtener una pila con la información de los municipios de 
+    :param compactos: si es True, los municipios se crean como MunicipioCompacto
+    :param almacenamiento: la forma de guardar los elementos de la pila, "enlazada" o "arreglo"
+    :return: la lista de equipos de futbol
+    """
+    clase = MunicipioCompacto if compactos else Municipio
+    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/municipios.csv"
+    df = pd.read_csv(archivo, encoding="utf-8")
+    pila = Pila[Municipio](almacenamiento)
+    for index, row in df.iterrows():
+        codigo = int(row["código"])
+        nombre = row["nombre"]
+        poblacion_urbana = int(row["poblaciónUrbana"])
+        poblacion_rural = int(row["poblaciónRural"])
+        departamento = row["departamento"]
+        es_capital = int(row["esCapital"]) == 1
+        m = clase(codigo=codigo, nombre=nombre, poblacion_rural=poblacion_rural,
+                      poblacion_urbana=poblacion_urbana, departamento=departamento,
+                      es_capital=es_capital)
+        pila.apilar(m)
+    return pila
+
+
+# ---------------------------------------------------------------------
+# Números (con decimales), nombres de variables o cualquier otro símbolo
+_PATRON_TOKEN = re.compile(r"\d+(?:\.\d*)?|\.\d+|[^\W\d]\w*|\S")
+
+
+def tokenizar_expresion(expresion: str) -> List[str]:
+    """
+    Obtiene los tokens de una expresión aritmética: números, nombres de
+    variables, operadores y paréntesis. Los espacios se ignoran.
+    :param expresion: la expresión, por ejemplo "(x + 2.5) * y"
+    :return: la lista de tokens, por ejemplo ['(', 'x', '+', '2.5', ')', '*', 'y']
+    """
+    return _PATRON_TOKEN.findall(expresion)
+
+
+def dividir_expresion(expresion: str) -> Lista[str]:
+    """
+    Esta función toma una expresión y obtiene los
+    diferentes tokens que hacen parte de ella
+    """
+    return Lista.desde_iterable(tokenizar_expresion(expresion))
+
+
+# ---------------------------------------------------------------------
+# Funciones auxiliares
+
+def elevar(x: int, y: int) -> int:
+    return int(int(x) ** int(y))
+
+
+# Los enteros de NumPy tienen 64 bits: un resultado con este valor absoluto o más no cabe
+_LIMITE_ENTERO = 2.0 ** 63
+
+
+def _magnitud(valores: Any) -> float:
+    """
+    El mayor valor absoluto de un arreglo de NumPy o de un número
+    """
+    arreglo = np.asarray(valores)
+    if arreglo.size == 0:
+        return 0.0
+    return max(abs(float(arreglo.max())), abs(float(arreglo.min())))
+
+
+def _sin_desbordar(operacion: Callable[[Any, Any], Any],
+                   cota: Callable[[float, float], float]) -> Callable[[Any, Any], Any]:
+    """
+    Envuelve una operación de NumPy para que, si el resultado es entero y no
+    cabe en 64 bits, lance OverflowError en vez de dar la vuelta en silencio
+    :param operacion: la operación de NumPy
+    :param cota: el mayor valor absoluto que puede tener el resultado, a partir
+                 del de cada operando. Si no llega al límite no hay que revisar
+                 más; si llega, se repite la operación en punto flotante.
+    """
+    def operar(x, y):
+        resultado = operacion(x, y)
+        if np.result_type(resultado).kind in 'iu' and cota(_magnitud(x), _magnitud(y)) >= _LIMITE_ENTERO:
+            aproximado = operacion(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+            if np.any(np.abs(aproximado) >= _LIMITE_ENTERO):
+                raise OverflowError("El resultado no cabe en un entero de 64 bits")
+        return resultado
+    return operar
+
+
+def _elevar_vectorial(x, y):
+    """
+    Versión de elevar para arreglos de NumPy: trunca la base y el exponente a
+    enteros. Lanza OverflowError si el resultado no cabe en 64 bits.
+    """
+    base = np.trunc(x).astype(np.int64)
+    exponente = np.trunc(y).astype(np.int64)
+    if np.any(exponente < 0):
+        return np.trunc(np.power(base.astype(np.float64), exponente)).astype(np.int64)
+    # |base| ^ exponente >= 2 ^ 63, en logaritmos para no desbordar al calcular la cota
+    if _magnitud(exponente) * math.log2(max(_magnitud(base), 1.0)) >= 63 and \
+            np.any(np.abs(np.power(base.astype(np.float64), exponente)) >= _LIMITE_ENTERO):
+        raise OverflowError("El resultado no cabe en un entero de 64 bits")
+    return np.power(base, exponente)
+
+
+# ---------------------------------------------------------------------
+# Expresiones compiladas
+
+# Token interno para el menos unario en la notación postfija
+MENOS_UNARIO = "~"
+
+# Operadores binarios: precedencia, si asocian a la derecha, operación con escalares y con arreglos
+_OPERADORES = {
+    '+': (1, False, operator.add, _sin_desbordar(np.add, operator.add)),
+    '-': (1, False, operator.sub, _sin_desbordar(np.subtract, operator.add)),
+    '*': (2, False, operator.mul, _sin_desbordar(np.multiply, operator.mul)),
+    '/': (2, False, operator.truediv, np.true_divide),
+    '%': (2, False, operator.mod, np.mod),
+    '^': (4, True, elevar, _elevar_vectorial),
+}
+
+# El menos unario va entre la multiplicación y la potencia: -2 ^ 2 = -(2 ^ 2)
+_PRECEDENCIA_MENOS_UNARIO = 3
+
+# Códigos de las instrucciones de una expresión compilada
+_CONSTANTE, _VARIABLE, _NEGAR, _OPERAR = range(4)
+
+
+def _es_operando(token: str) -> bool:
+    return token[0].isdigit() or token[0] == '.' or token[0].isalpha() or token[0] == '_'
+
+
+def _a_numero(token: str) -> int | float:
+    return float(token) if '.' in token else int(token)
+
+
+# Las potencias de constantes con un resultado de más bits que este no se calculan al compilar
+_BITS_MAXIMOS_AL_PLEGAR = 1 << 12
+
+
+def _se_puede_plegar(token: str, izquierdo: int | float, derecho: int | float) -> bool:
+    """
+    Indica si la operación entre dos constantes se puede calcular al compilar.
+    Una potencia como 2 ^ 10 ^ 10 no, porque calcularla puede tardar muchísimo.
+    """
+    if token != '^' or not (math.isfinite(izquierdo) and math.isfinite(derecho)):
+        return True
+    return abs(int(derecho)) * max(abs(int(izquierdo)).bit_length(), 1) <= _BITS_MAXIMOS_AL_PLEGAR
+
+
+def a_postfijo(expresion: str | Iterable[str]) -> Lista[str]:
+    """
+    Convierte una expresión en notación infija a notación postfija usando el
+    algoritmo shunting-yard de Dijkstra, con una Pila para los operadores.
+    El menos unario se escribe como MENOS_UNARIO ("~").
+    :param expresion: la expresión o sus tokens, por ejemplo "(4 + 5) * (7 - 2)"
+    :return: los tokens en notación postfija, por ejemplo 4 5 + 7 2 - *
+    """
+    tokens = tokenizar_expresion(expresion) if isinstance(expresion, str) else list(expresion)
+    salida = Lista[str]()
+    operadores = Pila[str]("arreglo")
+    espera_operando = True
+    for token in tokens:
+        if _es_operando(token):
+            if not espera_operando:
+                raise ValueError(f"Falta un operador antes de {token}")
+            salida.agregar(token)
+            espera_operando = False
+        elif token == '(':
+            if not espera_operando:
+                raise ValueError("Falta un operador antes de (")
+            operadores.apilar(token)
+        elif token == ')':
+            if espera_operando:
+                raise ValueError("Falta un operando antes de )")
+            while not operadores.vacia and operadores.tope != '(':
+                salida.agregar(operadores.tope)
+                operadores.desapilar()
+            if operadores.vacia:
+                raise ValueError("Los paréntesis no están balanceados")
+            operadores.desapilar()
+        elif espera_operando and token in '+-':
+            # Signo: el + se ignora y el - se convierte en el menos unario
+            if token == '-':
+                operadores.apilar(MENOS_UNARIO)
+        elif token in _OPERADORES:
+            if espera_operando:
+                raise ValueError(f"Falta un operando antes de {token}")
+            precedencia, derecha, _, _ = _OPERADORES[token]
+            while not operadores.vacia and operadores.tope != '(':
+                anterior = operadores.tope
+                precedencia_anterior = _PRECEDENCIA_MENOS_UNARIO if anterior == MENOS_UNARIO \
+                    else _OPERADORES[anterior][0]
+                if precedencia_anterior < precedencia or (precedencia_anterior == precedencia and derecha):
+                    break
+                salida.agregar(anterior)
+                operadores.desapilar()
+            operadores.apilar(token)
+            espera_operando = True
+        else:
+            raise ValueError(f"Símbolo desconocido: {token}")
+    if espera_operando:
+        raise ValueError("La expresión está incompleta")
+    while not operadores.vacia:
+        if operadores.tope == '(':
+            raise ValueError("Los paréntesis no están balanceados")
+        salida.agregar(operadores.tope)
+        operadores.desapilar()
+    return salida
+
+
+class ExpresionCompilada:
+    """
+    Una expresión aritmética ya convertida a una lista de instrucciones para
+    una máquina de pila. Se puede evaluar muchas veces con distintos valores
+    de las variables sin volver a analizar el texto. Las partes que no
+    dependen de variables se calculan una sola vez, al compilar.
+    """
+
+    def __init__(self, expresion: str):
+        """
+        Compila la expresión
+        :param expresion: la expresión en notación infija, por ejemplo "a * x ^ 2 + b"
+        """
+        self.__texto = expresion
+        self.__postfijo = tuple(a_postfijo(expresion))
+        codigo = []
+        variables = []
+        for token in self.__postfijo:
+            if token == MENOS_UNARIO:
+                if codigo[-1][0] == _CONSTANTE:
+                    codigo[-1] = (_CONSTANTE, -codigo[-1][1], None)
+                else:
+                    codigo.append((_NEGAR, None, None))
+            elif token in _OPERADORES:
+                _, _, escalar, vectorial = _OPERADORES[token]
+                if codigo[-1][0] == _CONSTANTE and codigo[-2][0] == _CONSTANTE and \
+                        _se_puede_plegar(token, codigo[-2][1], codigo[-1][1]):
+                    try:
+                        codigo[-2:] = [(_CONSTANTE, escalar(codigo[-2][1], codigo[-1][1]), None)]
+                        continue
+                    except (ArithmeticError, ValueError):
+                        # Errores como 1 / 0 deben aparecer al evaluar, no al compilar
+                        pass
+                codigo.append((_OPERAR, escalar, vectorial))
+            elif token[0].isdigit() or token[0] == '.':
+                codigo.append((_CONSTANTE, _a_numero(token), None))
+            else:
+                codigo.append((_VARIABLE, token, None))
+                if token not in variables:
+                    variables.append(token)
+        self.__codigo = tuple(codigo)
+        self.__variables = tuple(variables)
+
+
+    @property
+    def texto(self) -> str:
+        return self.__texto
+
+
+    @property
+    def postfijo(self) -> tuple[str, ...]:
+        """
+        Los tokens de la expresión en notación postfija
+        """
+        return self.__postfijo
+
+
+    @property
+    def variables(self) -> tuple[str, ...]:
+        """
+        Los nombres de las variables, en el orden en que aparecen
+        """
+        return self.__variables
+
+
+    def __ejecutar(self, valores: Any, vectorial: bool) -> Any:
+        """
+        Ejecuta las instrucciones con una pila de valores
+        :param valores: un diccionario (o algo que se pueda indexar) con el valor de cada variable
+        :param vectorial: si es True se usan las operaciones de NumPy
+        """
+        pila = []
+        for codigo, argumento, operacion_vectorial in self.__codigo:
+            if codigo == _CONSTANTE:
+                pila.append(argumento)
+            elif codigo == _VARIABLE:
+                try:
+                    pila.append(valores[argumento])
+                except KeyError:
+                    raise ValueError(f"Falta el valor de la variable {argumento}") from None
+            elif codigo == _NEGAR:
+                pila[-1] = -pila[-1]
+            else:
+                derecho = pila.pop()
+                operacion = operacion_vectorial if vectorial else argumento
+                pila[-1] = operacion(pila[-1], derecho)
+        return pila[0]
+
+
+    def evaluar(self, valores: dict = None, **otros_valores) -> int | float:
+        """
+        Evalúa la expresión
+        :param valores: un diccionario con el valor de cada variable
+        :param otros_valores: los valores de las variables, como parámetros por nombre
+        :return: el resultado de la expresión
+        """
+        if otros_valores:
+            valores = {**(valores or {}), **otros_valores}
+        return self.__ejecutar(valores or {}, False)
+
+
+    def __ejecutar_vectorial(self, columnas: dict) -> Any:
+        """
+        Ejecuta las instrucciones con las operaciones de NumPy
+        :return: los resultados, o None si alguno no sería igual al de evaluar:
+                 un entero que no cabe en 64 bits, una división por cero o un
+                 desbordamiento de punto flotante
+        """
+        try:
+            with np.errstate(divide='raise', over='raise', invalid='raise'):
+                return self.__ejecutar(columnas, True)
+        except (FloatingPointError, OverflowError):
+            return None
+
+
+    def evaluar_lote(self, datos: Lista[dict] | dict) -> 'ListaNumerica | Lista | np.ndarray':
+        """
+        Evalúa la expresión para muchos valores de las variables a la vez
+        :param datos: una Lista de diccionarios, uno por fila, o un diccionario
+                      con un arreglo de NumPy (o una ListaNumerica) por variable.
+                      En el diccionario, los escalares valen para todas las filas.
+        :return: con una Lista, una ListaNumerica con un resultado por fila (o
+                 una Lista si algún valor no es numérico); con un diccionario,
+                 un arreglo de NumPy. Los resultados son los mismos de evaluar:
+                 si con NumPy algún entero no cabe en 64 bits, o hay una división
+                 por cero o un desbordamiento, se evalúa fila por fila como en
+                 evaluar (y la división por cero lanza ZeroDivisionError).
+        """
+        if isinstance(datos, dict):
+            columnas = {nombre: valor.a_numpy() if isinstance(valor, ListaNumerica) else np.asarray(valor)
+                        for nombre, valor in datos.items()}
+            try:
+                # Los valores escalares se repiten en todas las filas; siempre hay al menos una
+                forma = np.broadcast_shapes((1,), *(columna.shape for columna in columnas.values()))
+            except ValueError:
+                tamanos = {nombre: columna.shape for nombre, columna in columnas.items()}
+                raise ValueError(f"Los valores de las variables no tienen tamaños compatibles: {tamanos}") from None
+            resultado = self.__ejecutar_vectorial(columnas)
+            if resultado is not None:
+                return np.broadcast_to(resultado, forma).copy()
+            valores = {nombre: np.broadcast_to(columna, forma).ravel().tolist()
+                       for nombre, columna in columnas.items()}
+            resultados = [self.__ejecutar({nombre: lista[i] for nombre, lista in valores.items()}, False)
+                          for i in range(math.prod(forma))]
+            # Los enteros que no caben en 64 bits quedan como enteros de Python, sin perder precisión
+            enormes = any(type(valor) is int and abs(valor) >= _LIMITE_ENTERO for valor in resultados)
+            return np.array(resultados, dtype=object if enormes else None).reshape(forma)
+        filas = list(datos)
+        columnas = {}
+        for nombre in self.__variables:
+            try:
+                columna = np.array([fila[nombre] for fila in filas])
+            except KeyError:
+                raise ValueError(f"Falta el valor de la variable {nombre}") from None
+            if columna.dtype.kind not in 'iuf':
+                # Hay valores que no son números: se evalúa fila por fila
+                return Lista.desde_iterable(self.__ejecutar(fila, False) for fila in filas)
+            columnas[nombre] = columna
+        resultado = self.__ejecutar_vectorial(columnas)
+        if resultado is None:
+            return Lista.desde_iterable(self.__ejecutar(fila, False) for fila in filas)
+        return ListaNumerica(np.broadcast_to(resultado, (len(filas),)))
+
+
+    def __str__(self) -> str:
+        return self.__texto
+
+
+    def __repr__(self) -> str:
+        return f"ExpresionCompilada({self.__texto!r}, postfijo={' '.join(self.__postfijo)!r})"
+
+
+@lru_cache(maxsize=256)
+def compilar_expresion(expresion: str) -> ExpresionCompilada:
+    """
+    Compila una expresión aritmética. El resultado se guarda en un caché, así
+    que compilar otra vez el mismo texto no cuesta nada.
+    :param expresion: la expresión en notación infija
+    :return: la expresión compilada
+    """
+    return ExpresionCompilada(expresion)
+
+
+def evaluar_expresion(expresion: str, valores: dict = None, **otros_valores) -> int | float:
+    """
+    Evalúa una expresión aritmética con los valores dados para las variables
+    :param expresion: la expresión, por ejemplo "(4 + 5) * (7 - x)"
+    :param valores: un diccionario con el valor de cada variable
+    :param otros_valores: los valores de las variables, como parámetros por nombre
+    :return: el resultado de la expresión
+    """
+    return compilar_expresion(expresion).evaluar(valores, **otros_valores)
+
+
+def evaluar_lote(expresion: str, datos: Lista[dict] | dict) -> 'ListaNumerica | Lista | np.ndarray':
+    """
+    Evalúa una expresión para muchos valores de las variables a la vez. Ver ExpresionCompilada.evaluar_lote
+    :param expresion: la expresión en notación infija
+    :param datos: una Lista de diccionarios o un diccionario con un arreglo de NumPy por variable
+    :return: los resultados de la expresión
+    """
+    return compilar_expresion(expresion).evaluar_lote(datos)
+
+
+# ---------------------------------------------------------------------
+# Validación de delimitadores balanceados
+
+@dataclass(frozen=True)
+class ResultadoBalanceo:
+    """
+    El resultado de validar_delimitadores. Si los delimitadores no están
+    balanceados, linea y columna (desde 1) indican dónde está el primer error.
+    """
+    balanceado: bool
+    mensaje: str
+    linea: Optional[int]
+    columna: Optional[int]
+    profundidad_maxima: int
+    caracteres: int
+    bytes_leidos: Optional[int]
+    segundos: float
+
+    @property
+    def velocidad(self) -> float:
+        """
+        Megabytes (o millones de caracteres, si la fuente era texto) revisados por segundo
+        """
+        cantidad = self.caracteres if self.bytes_leidos is None else self.bytes_leidos
+        return cantidad / self.segundos / 1_000_000 if self.segundos > 0 else float("inf")
+
+    def __bool__(self) -> bool:
+        return self.balanceado
+
+
+def _bloques_de_texto(fuente: Any, tam_bloque: int, codificacion: str, leidos: list) -> Iterator[str]:
+    """
+    Lee la fuente por bloques y los entrega como texto. Los bytes se decodifican
+    de forma incremental, así que un carácter puede quedar partido entre dos bloques.
+    :param leidos: lista de un elemento donde se acumula la cantidad de bytes leídos (None si la fuente es texto)
+    """
+    if isinstance(fuente, (bytes, bytearray, memoryview)):
+        fuente = io.BytesIO(fuente)
+    if isinstance(fuente, (str, os.PathLike)):
+        with open(fuente, "rb") as archivo:
+            yield from _bloques_de_texto(archivo, tam_bloque, codificacion, leidos)
+        return
+    decodificador = codecs.getincrementaldecoder(codificacion)()
+    while bloque := fuente.read(tam_bloque):
+        if isinstance(bloque, str):
+            leidos[0] = None
+            yield bloque
+        else:
+            leidos[0] += len(bloque)
+            yield decodificador.decode(bloque)
+    if leidos[0] is not None:
+        yield decodificador.decode(b"", final=True)
+
+
+def _ubicacion(bloque: str, posicion: int, linea: int, columna: int) -> tuple[int, int]:
+    """
+    Obtiene la línea y la columna (desde 1) de una posición del bloque
+    :param linea: la línea en la que empieza el bloque
+    :param columna: cuántos caracteres de esa línea había antes del bloque
+    """
+    ultimo_salto = bloque.rfind("\n", 0, posicion)
+    if ultimo_salto < 0:
+        return linea, columna + posicion + 1
+    return linea + bloque.count("\n", 0, posicion), posicion - ultimo_salto
+
+
+def _clase_de_caracteres(caracteres: str) -> str:
+    """
+    Expresión regular para cualquiera de los caracteres dados; si no hay ninguno, no encuentra nada
+    """
+    return f"[{re.escape(caracteres)}]" if caracteres else "(?!)"
+
+
+def _contenido_cadena(comilla: str, escape: Optional[str]) -> str:
+    """
+    Expresión regular para el contenido de una cadena: llega hasta la comilla
+    que la cierra (sin incluirla) o hasta un escape al final del texto
+    """
+    q = re.escape(comilla)
+    if not escape:
+        return f"[^{q}]*"
+    e = re.escape(escape)
+    return f"[^{q}{e}]*(?:{e}.[^{q}{e}]*)*"
+
+
+def _escape_pendiente(bloque: str, posicion: int, escape: Optional[str]) -> bool:
+    """
+    Indica si el bloque termina en un escape que se aplica al primer carácter
+    del siguiente bloque: los escapes seguidos se cancelan de a dos
+    """
+    if not escape or not bloque.endswith(escape):
+        return False
+    return (len(bloque) - max(len(bloque.rstrip(escape)), posicion)) % 2 == 1
+
+
+class _ValidadorDelimitadores:
+    """
+    El estado de validar_delimitadores mientras se recorren los bloques: la
+    pila de delimitadores abiertos, la comilla de la cadena abierta (si la hay)
+    y si el primer carácter del siguiente bloque está escapado. Como el estado
+    pasa de un bloque al siguiente, no importa dónde se corten los bloques.
+
+    En cada bloque se borran con una expresión regular los escapes y las
+    cadenas completas. Lo que queda después de una comilla es una cadena que
+    sigue en el siguiente bloque; antes de ella, solo hay que recorrer los
+    delimitadores.
+    """
+
+    def __init__(self, pares: dict, comillas: str, escape: Optional[str]):
+        self.aperturas = {apertura: i for i, apertura in enumerate(pares)}
+        self.cierres = {cierre: i for i, cierre in enumerate(pares.values())}
+        self.lista_aperturas = list(pares)
+        self.lista_cierres = list(pares.values())
+        self.comillas = comillas
+        self.escape = escape
+        ignorados = [f"{re.escape(escape)}."] if escape else []
+        ignorados += [f"{re.escape(q)}{_contenido_cadena(q, escape)}{re.escape(q)}" for q in comillas]
+        ignorados = "|".join(ignorados) or "(?!)"
+        delimitadores = _clase_de_caracteres("".join(pares) + "".join(pares.values()))
+        self.patron_ignorados = re.compile(ignorados, re.DOTALL)
+        self.patron_delimitadores = re.compile(delimitadores)
+        # Para ubicar un error: el grupo 1 son los delimitadores y el 2 las cadenas que no se cierran
+        self.patron_simbolos = re.compile(f"{ignorados}|({delimitadores})|({_clase_de_caracteres(comillas)})",
+                                          re.DOTALL)
+        self.patrones_dentro = {q: re.compile(_contenido_cadena(q, escape), re.DOTALL) for q in comillas}
+        self.pila = bytearray()
+        self.profundidad_maxima = 0
+        self.comilla = None
+        self.saltar = False
+        self.linea, self.columna = 1, 0
+        self.caracteres = 0
+        # El bloque donde empieza la cadena abierta, con la posición, la línea y la columna de ese bloque
+        self.bloque_comilla = None
+        # (mensaje, línea, columna) del primer error
+        self.error = None
+
+
+    def revisar(self, bloque: str) -> bool:
+        """
+        Revisa un bloque
+        :return: False si se encontró un error
+        """
+        posicion = 0
+        if self.saltar and bloque:
+            posicion = 1
+            self.saltar = False
+        if self.comilla is not None:
+            # El bloque empieza dentro de una cadena
+            posicion = self.patrones_dentro[self.comilla].match(bloque, posicion).end()
+            if posicion >= len(bloque) or bloque[posicion] != self.comilla:
+                # La cadena sigue en el siguiente bloque; si no se llegó al final, lo que falta es un escape
+                self.saltar = posicion < len(bloque)
+                self.__avanzar(bloque)
+                return True
+            self.comilla = None
+            self.bloque_comilla = None
+            posicion += 1
+        resto = self.patron_ignorados.sub("", bloque[posicion:] if posicion else bloque)
+        corte = min((lugar for lugar in map(resto.find, self.comillas) if lugar >= 0), default=-1)
+        if corte >= 0:
+            self.comilla = resto[corte]
+            self.bloque_comilla = (bloque, posicion, self.linea, self.columna)
+            resto = resto[:corte]
+        pila = self.pila
+        aperturas, cierres = self.aperturas, self.cierres
+        for k, simbolo in enumerate(self.patron_delimitadores.findall(resto)):
+            indice = aperturas.get(simbolo)
+            if indice is not None:
+                pila.append(indice)
+                if len(pila) > self.profundidad_maxima:
+                    self.profundidad_maxima = len(pila)
+            elif pila and pila[-1] == cierres[simbolo]:
+                pila.pop()
+            else:
+                if pila:
+                    mensaje = f"Se esperaba '{self.lista_cierres[pila[-1]]}' pero se encontró '{simbolo}'"
+                else:
+                    mensaje = f"Se encontró '{simbolo}' sin su apertura"
+                lugar = self.__lugar(bloque, posicion, 1, k)
+                self.caracteres += lugar
+                self.error = (mensaje,) + _ubicacion(bloque, lugar, self.linea, self.columna)
+                return False
+        self.saltar = _escape_pendiente(bloque, posicion, self.escape)
+        self.__avanzar(bloque)
+        return True
+
+
+    def __lugar(self, bloque: str, posicion: int, grupo: int, k: int = 0) -> int:
+        """
+        Obtiene la posición en el bloque del símbolo número k (desde 0) del grupo dado de patron_simbolos
+        """
+        encontrados = (m for m in self.patron_simbolos.finditer(bloque, posicion) if m.lastindex == grupo)
+        return next(islice(encontrados, k, None)).start()
+
+
+    def __avanzar(self, bloque: str) -> None:
+        """
+        Actualiza la línea y la columna al final del bloque
+        """
+        n = len(bloque)
+        self.caracteres += n
+        saltos = bloque.count("\n")
+        if saltos:
+            self.linea += saltos
+            self.columna = n - bloque.rfind("\n") - 1
+        else:
+            self.columna += n
+
+
+    def terminar(self) -> None:
+        """
+        Revisa lo que quedó abierto al final de la fuente
+        """
+        if self.error is not None:
+            return
+        if self.comilla is not None:
+            bloque, posicion, linea, columna = self.bloque_comilla
+            self.error = ((f"La comilla {self.comilla} no se cerró",)
+                          + _ubicacion(bloque, self.__lugar(bloque, posicion, 2), linea, columna))
+        elif self.pila:
+            self.error = (f"Falta cerrar '{self.lista_aperturas[self.pila[-1]]}' "
+                          f"({len(self.pila)} delimitadores sin cerrar)", self.linea, self.columna + 1)
+
+
+def validar_delimitadores(fuente: Any, pares: str | dict = "()[]{}", comillas: str = "\"'",
+                          escape: Optional[str] = "\\", tam_bloque: int = 1 << 20,
+                          codificacion: str = "utf-8") -> ResultadoBalanceo:
+    """
+    Revisa que los delimitadores (paréntesis, corchetes, llaves...) estén
+    balanceados, igual que el algoritmo con una Pila, pero leyendo la fuente
+    por bloques: la memoria usada no depende del tamaño de la fuente. Lo que
+    está entre comillas se ignora. La pila de delimitadores abiertos es un
+    bytearray, un byte por nivel.
+    :param fuente: la ruta de un archivo, un archivo abierto (de texto o binario) o bytes. Un str
+                   se toma como ruta; para revisar un texto en memoria use io.StringIO(texto)
+    :param pares: las parejas de apertura y cierre, como texto ("()[]{}") o como diccionario
+                  ({"(": ")", "<": ">"}). Cada delimitador es un solo carácter
+    :param comillas: los caracteres que abren y cierran texto entre comillas; "" para no tenerlas en cuenta
+    :param escape: el carácter que hace que se ignore el siguiente, dentro o fuera de las comillas
+                   (una comilla o un delimitador precedido por el escape no cuenta); None si no hay
+    :param tam_bloque: cuánto se lee de la fuente cada vez
+    :param codificacion: la codificación de las fuentes binarias
+    :return: el resultado, con la ubicación del primer error, la profundidad máxima y la velocidad
+    """
+    if isinstance(pares, str):
+        if len(pares) % 2 != 0:
+            raise ValueError("Los pares deben tener una apertura y un cierre")
+        pares = dict(zip(pares[::2], pares[1::2]))
+    if len(pares) > 256:
+        raise ValueError("Se admiten como máximo 256 pares de delimitadores")
+    if any(len(a) != 1 or len(c) != 1 or a == c for a, c in pares.items()):
+        raise ValueError("Cada delimitador debe ser un carácter y la apertura debe ser distinta del cierre")
+    if set(comillas) & (set(pares) | set(pares.values()) | {escape}):
+        raise ValueError("Las comillas no pueden ser delimitadores ni el carácter de escape")
+    validador = _ValidadorDelimitadores(pares, comillas, escape)
+    leidos = [0]
+    inicio = time.perf_counter()
+    bloques = _bloques_de_texto(fuente, tam_bloque, codificacion, leidos)
+    try:
+        for bloque in bloques:
+            if not validador.revisar(bloque):
+                break
+    finally:
+        bloques.close()
+    validador.terminar()
+    segundos = time.perf_counter() - inicio
+    if validador.error is None:
+        return ResultadoBalanceo(True, "Los delimitadores están balanceados", None, None,
+                                 validador.profundidad_maxima, validador.caracteres, leidos[0], segundos)
+    mensaje, linea, columna = validador.error
+    return ResultadoBalanceo(False, mensaje, linea, columna, validador.profundidad_maxima,
+                             validador.caracteres, leidos[0], segundos)
+
+
+# ---------------------------------------------------------------------
+
+class NodoArbin(Generic[T]):
+    """"
+    Este es un nodo de un árbol binario genérico
+    """
+    def __init__(self, info: T, izq: Optional["NodoArbin"] = None, der: Optional["NodoArbin"] = None):
+        self.info = info
+        self.izq = izq
+        self.der = der
+
+
+    def es_hoja(self) -> bool:
+        """
+        Permite saber si este árbol es una hoja o no
+        :return: true si el nodo no tiene hijos, y false en caso contrario
+        """
+        return self.izq is None and self.der is None
+
+
+def inorden(arbol: Optional[NodoArbin[T]]) -> Iterator[T]:
+    """
+    Recorre el árbol en inorden (izquierdo, raíz, derecho) sin usar recursión
+    :param arbol: la raíz del árbol
+    :return: un generador con la información de cada nodo
+    """
+    pendientes = []
+    act = arbol
+    while act is not None or pendientes:
+        while act is not None:
+            pendientes.append(act)
+            act = act.izq
+        act = pendientes.pop()
+        yield act.info
+        act = act.der
+
+
+def preorden(arbol: Optional[NodoArbin[T]]) -> Iterator[T]:
+    """
+    Recorre el árbol en preorden (raíz, izquierdo, derecho) sin usar recursión
+    :param arbol: la raíz del árbol
+    :return: un generador con la información de cada nodo
+    """
+    pendientes = [arbol] if arbol is not None else []
+    while pendientes:
+        act = pendientes.pop()
+        yield act.info
+        # El derecho entra primero a la pila para que el izquierdo salga antes
+        if act.der is not None:
+            pendientes.append(act.der)
+        if act.izq is not None:
+            pendientes.append(act.izq)
+
+
+def postorden(arbol: Optional[NodoArbin[T]]) -> Iterator[T]:
+    """
+    Recorre el árbol en postorden (izquierdo, derecho, raíz) sin usar recursión
+    :param arbol: la raíz del árbol
+    :return: un generador con la información de cada nodo
+    """
+    pendientes = []
+    act = arbol
+    visitado = None
+    while act is not None or pendientes:
+        while act is not None:
+            pendientes.append(act)
+            act = act.izq
+        tope = pendientes[-1]
+        if tope.der is not None and tope.der is not visitado:
+            # Falta recorrer el subárbol derecho antes de visitar la raíz
+            act = tope.der
+        else:
+            visitado = pendientes.pop()
+            yield visitado.info
+
+
+def por_niveles(arbol: Optional[NodoArbin[T]]) -> Iterator[T]:
+    """
+    Recorre el árbol por niveles, de arriba hacia abajo y de izquierda a derecha
+    :param arbol: la raíz del árbol
+    :return: un generador con la información de cada nodo
+    """
+    pendientes = deque([arbol] if arbol is not None else [])
+    while pendientes:
+        act = pendientes.popleft()
+        yield act.info
+        if act.izq is not None:
+            pendientes.append(act.izq)
+        if act.der is not None:
+            pendientes.append(act.der)
+
+
+def altura_arbol(arbol: Optional[NodoArbin[T]]) -> int:
+    """
+    Calcula la altura del árbol recorriéndolo una sola vez por niveles
+    :param arbol: la raíz del árbol
+    :return: el número de niveles del árbol (0 si está vacío)
+    """
+    altura = 0
+    nivel = [arbol] if arbol is not None else []
+    while nivel:
+        altura += 1
+        nivel = [hijo for nodo in nivel for hijo in (nodo.izq, nodo.der) if hijo is not None]
+    return altura
+
+
+def tam_arbol(arbol: Optional[NodoArbin[T]]) -> int:
+    """
+    Cuenta los nodos del árbol sin usar recursión
+    :param arbol: la raíz del árbol
+    :return: el número de nodos del árbol
+    """
+    tam = 0
+    pendientes = [arbol] if arbol is not None else []
+    while pendientes:
+        act = pendientes.pop()
+        tam += 1
+        if act.izq is not None:
+            pendientes.append(act.izq)
+        if act.der is not None:
+            pendientes.append(act.der)
+    return tam
+
+
+def hojas_arbol(arbol: Optional[NodoArbin[T]]) -> int:
+    """
+    Cuenta las hojas del árbol sin usar recursión
+    :param arbol: la raíz del árbol
+    :return: el número de nodos que no tienen hijos
+    """
+    hojas = 0
+    pendientes = [arbol] if arbol is not None else []
+    while pendientes:
+        act = pendientes.pop()
+        if act.izq is None and act.der is None:
+            hojas += 1
+            continue
+        if act.izq is not None:
+            pendientes.append(act.izq)
+        if act.der is not None:
+            pendientes.append(act.der)
+    return hojas
+
+
+def arbol_de_letras() -> NodoArbin[str]:
+    """
     Permite crear un árbol de letras mayúsculas
     :return:
     """
-    return NodoArbin(
-        "A",
-        NodoArbin(
-            "B",
-            NodoArbin(
-                "D",
-                NodoArbin("G")
-            ),
-            NodoArbin(
-                "E",
-                NodoArbin("H"),
-                NodoArbin("I")
-            )
-        ),
-        NodoArbin(
-            "C",
-            None,
-            NodoArbin(
-                "F",
-                NodoArbin(
-                    "J",
-                    None,
-                    NodoArbin("K")
-                )
-            )
-        )
-    )
+    return NodoArbin(
+        "A",
+        NodoArbin(
+            "B",
+            NodoArbin(
+                "D",
+                NodoArbin("G")
+            ),
+            NodoArbin(
+                "E",
+                NodoArbin("H"),
+                NodoArbin("I")
+            )
+        ),
+        NodoArbin(
+            "C",
+            None,
+            NodoArbin(
+                "F",
+                NodoArbin(
+                    "J",
+                    None,
+                    NodoArbin("K")
+                )
+            )
+        )
+    )
+
+
+def arbol_de_numeros() -> NodoArbin[int]:
+    return NodoArbin(
+        60,
+        NodoArbin(
+            41,
+            NodoArbin(
+                16,
+                None,
+                NodoArbin(25)
+            ),
+            NodoArbin(
+                53,
+                NodoArbin(
+                    46,
+                    NodoArbin(42)
+                ),
+                NodoArbin(55)
+            )
+        ),
+        NodoArbin(
+            74,
+            NodoArbin(
+                65,
+                NodoArbin(
+                    63,
+                    NodoArbin(62),
+                    NodoArbin(64)
+                ),
+                NodoArbin(70)
+            )
+        )
+    )
+
+
+def crear_arbol_de_lista(lista: Lista[T]) -> Optional[NodoArbin[T]]:
+    """
+    Crea un árbol binario a partir de una lista, llenándolo por niveles: los
+    hijos del elemento en la posición i son los de las posiciones 2i+1 y 2i+2.
+    La lista se recorre una sola vez y no se usa recursión
+    :param lista: la lista con los objetos
+    :return: el arbol binario, o None si la lista está vacía
+    """
+    nodos = [NodoArbin(elem) for elem in lista]
+    tam = len(nodos)
+    for posicion in range(tam // 2):
+        act = nodos[posicion]
+        act.izq = nodos[2 * posicion + 1]
+        if 2 * posicion + 2 < tam:
+            act.der = nodos[2 * posicion + 2]
+    return nodos[0] if nodos else None
+
+
+def arbol_verbos() -> NodoArbin[str]:
+    """
+    Crea un árbol binario con verbos a partir de una lista
+    :return: el árbol binario con verbos
+    """
+    verbos = crear_lista("comer",
+        "cenar", "partir", "tener", "sufrir",
+        "internacionalizar", "exponer", "pedir",
+        "sanar", "mecer", "adolecer")
+    return crear_arbol_de_lista(verbos)
+
+
+def arbol_personas() -> NodoArbin[Persona]:
+    return  crear_arbol_de_lista(leer_archivo_personas())
+
+
+# ---------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Punto:
+    """
+    Esta clase representa un punto en el plano cartesiano
+    """
+    x: float
+    y: float
+
+    @property
+    def radio(self) -> float:
+        """
+        Obtiene la distancia al origen del punto
+        :return: la distancia al origen del punto
+        """
+        return sqrt(self.x ** 2 + self.y ** 2)
+
+
+    def distancia_al_origen(self) -> float:
+        return self.radio
+
+
+    @property
+    def angulo(self) -> float:
+        """
+        Retorna el angulo con el eje x del punto
+        :return: el ángulo
+        """
+        return math.atan2(self.y, self.x)
+
+
+    def cuadrante(self) -> int:
+        """
+        Obtener el cuadrante al que pertenece el punto
+        :return: 1, 2, 3 o 4 dependiendo del cuadrante al que pertenece el punto
+        """
+        if self.x >= 0:
+            if self.y >= 0:
+                return 1
+            else:
+                return 4
+        else:
+            if self.y >= 0:
+                return 2
+            else:
+                return 3
+
+
+def lista_de_puntos() -> Lista[Punto]:
+    return crear_lista(
+        Punto(15.0, -10.0),
+        Punto(5.0, 4.0),
+        Punto(-3.0, 15.0),
+        Punto(-8.0, -30.0),
+        Punto(-7.0, 25.0),
+        Punto(6.0, -70.0),
+        Punto(9.0, 10.0),
+        Punto(-8.0, -61.0),
+        Punto(90.0, -80.0),
+        Punto(-75.0, -80.0),
+        Punto(45.0, -77.0),
+        Punto(3.0, 4.0)
+    )
+
+
+def arbol_de_puntos() -> NodoArbin[Punto]:
+    return crear_arbol_de_lista(lista_de_puntos())
+
+
+# ---------------------------------------------------------------------
+
+# Otros árboles
+def arbol_de_departamentos() -> NodoArbin[Departamento]:
+    return crear_arbol_de_lista(leer_archivo_departamentos())
+
+def arbol_de_equipos() -> NodoArbin[EquipoFutbol]:
+    return crear_arbol_de_lista(leer_archivo_equipos())
+
+def arbol_de_municipios() -> NodoArbin[Municipio]:
+    return crear_arbol_de_lista(leer_archivo_municipios())
+
+# ---------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Producto:
+    codigo: int
+    categoria: int
+    nombre: str
+    modelo: str
+    descripcion: str
+    color: str
+    costo: float
+    precio: float
+
+
+    def ganancia(self) -> float:
+        """
+        Obtiene la ganancia de un producto
+        :return: la diferencia entre el precio y el costo
+        """
+        return self.precio - self.costo
+
+
+def lista_de_productos(compactos: bool = False) -> Lista[Producto]:
+    """
+    Permite obtener una lista con la información de los productos
+    :param compactos: si es True, los productos se crean como ProductoCompacto
+    :return: la lista de productos del archivo
+    """
+    clase = ProductoCompacto if compactos else Producto
+    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/Product.csv"
+    df = pd.read_csv(archivo, encoding="utf-8")
+    lista = Lista[Producto]()
+    for index, row in df.iterrows():
+        codigo = int(row["ProductKey"])
+        categoria = int(row["ProductSubcategoryKey"])
+        nombre = row["ProductName"]
+        modelo = row["ModelName"]
+        descripcion = row["ProductDescription"]
+        color = row["ProductColor"]
+        costo = float(row["ProductCost"])
+        precio = float(row["ProductPrice"])
+        prod = clase(codigo, categoria, nombre, modelo, descripcion, color, costo, precio)
+        lista.agregar(prod)
+    return lista
+
+
+def arbol_de_productos() -> NodoArbin[Producto]:
+    return crear_arbol_de_lista(lista_de_productos())
+
+# ----------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Carro:
+    codigo: int
+    modelo: str
+    año: int
+    precio: int
+    transmision: str
+    kilometraje: int
+    tipo_combustible: str
+    cilindraje: float
+    fabricante: str
+
+    def edad(self) -> int:
+        """"
+        Determina el número de años que ha sido fabricado el carro
+        """
+        hoy = datetime.now()
+        anio = hoy.year
+        return anio - self.año
+
+
+def lista_de_carros_usados(n: int = 10, compactos: bool = False) -> Lista[Carro]:
+    """
+    Permite obtener una lista con la información de los carros
+    :param n: la cantidad de carros a leer
+    :param compactos: si es True, los carros se crean como CarroCompacto
+    :return: la lista de carros del archivo
+    """
+    clase = CarroCompacto if compactos else Carro
+    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/cars_dataset.csv"
+    df = pd.read_csv(archivo, encoding="utf-8")
+    lista = Lista[Carro]()
+    i = 1
+    for index, row in df.iterrows():
+        modelo = row["model"].upper().strip()
+        año = int(row["year"])
+        precio = int(row["price"])
+        transmision = "MANUAL" if row["transmission"] == "Manual" else "AUTOMATICA" if row["transmission"] == "Automatic" else "SEMIAUTOMATICA"
+        kilometraje = int(row["mileage"])
+        tipo_combustible = "GASOLINA" if row["fuelType"] == "Petrol" else "ACPM" if row["fuelType"] == "Diesel" else "ELECTRICO"
+        cilindraje = float(row["engineSize"])
+        fabricante = row["Make"].upper()
+        carro = clase(i, modelo, año, precio, transmision, kilometraje, tipo_combustible, cilindraje, fabricante)
+        lista.agregar(carro)
+        i += 1
+        if i > n:
+            break
+    return lista
 
+# ---------------------------------------------------------------------
+# Versiones compactas de los registros
+
+def _version_compacta(clase: type, nombre: str) -> type:
+    """
+    Crea una versión con __slots__ de una dataclass. Tiene los mismos campos,
+    propiedades y métodos, pero sus objetos no tienen __dict__, así que
+    ocupan bastante menos memoria.
+    :param clase: la dataclass original
+    :param nombre: el nombre de la nueva clase, que debe ser el de la variable del módulo donde se guarda
+    :return: la nueva dataclass
+    """
+    generadas = {'__dict__', '__weakref__', '__init__', '__repr__', '__eq__', '__hash__',
+                 '__setattr__', '__delattr__', '__match_args__', '__dataclass_fields__',
+                 '__dataclass_params__'}
+    espacio = {clave: valor for clave, valor in vars(clase).items() if clave not in generadas}
+    espacio['__module__'] = __name__
+    espacio['__qualname__'] = nombre
+    espacio['__doc__'] = f"Versión compacta (con __slots__) de {clase.__name__}"
+    parametros = clase.__dataclass_params__
+    return dataclass(slots=True, frozen=parametros.frozen, eq=parametros.eq)(type(nombre, (), espacio))
+
+
+PersonaCompacta = _version_compacta(Persona, "PersonaCompacta")
+DepartamentoCompacto = _version_compacta(Departamento, "DepartamentoCompacto")
+EquipoFutbolCompacto = _version_compacta(EquipoFutbol, "EquipoFutbolCompacto")
+MunicipioCompacto = _version_compacta(Municipio, "MunicipioCompacto")
+PuntoCompacto = _version_compacta(Punto, "PuntoCompacto")
+ProductoCompacto = _version_compacta(Producto, "ProductoCompacto")
+CarroCompacto = _version_compacta(Carro, "CarroCompacto")
+
+
+# ---------------------------------------------------------------------
+# Escritura de archivos
+
+def _registros_de(estructura: Any) -> Iterable:
+    """
+    Obtiene los registros de una Lista, una Pila (desde el tope), un árbol
+    (en inorden) o cualquier iterable
+    """
+    if isinstance(estructura, NodoArbin):
+        return inorden(estructura)
+    return estructura
+
+
+def _columnas_de(registro: Any) -> Optional[List[tuple[str, Callable[[Any], Any]]]]:
+    """
+    Obtiene los nombres de las columnas de un registro y las funciones que leen sus valores.
+    Retorna None si el registro no es una dataclass ni un diccionario.
+    """
+    if is_dataclass(registro):
+        clase = type(registro)
+        nombres = TablaColumnar.nombres_de_campos(clase)
+        return [(nombre, attrgetter(campo.name)) for nombre, campo in zip(nombres, fields(clase))]
+    if isinstance(registro, dict):
+        return [(nombre, itemgetter(nombre)) for nombre in registro]
+    return None
+
+
+@contextmanager
+def _abrir_destino(destino: Any, **opciones):
+    """
+    Si el destino es una ruta, abre el archivo y lo cierra al terminar; si ya es
+    un archivo abierto, lo usa tal como está
+    """
+    if isinstance(destino, (str, os.PathLike)):
+        with open(destino, "w", encoding="utf-8", **opciones) as archivo:
+            yield archivo
+    else:
+        yield destino
+
+
+def escribir_csv(estructura: Any, destino: Any, campos: List[str] = None, separador: str = ",",
+                 encabezado: bool = True, tam_lote: int = 1_000) -> int:
+    """
+    Escribe los registros de una estructura en formato CSV. Los registros se
+    escriben por lotes, así que la memoria usada no depende de la cantidad.
+    Si los registros son dataclasses, cada campo es una columna; si son
+    diccionarios, cada llave; si no, hay una sola columna llamada "valor".
+    :param estructura: una Lista, una Pila, un árbol (NodoArbin) o cualquier iterable
+    :param destino: la ruta del archivo o un archivo abierto para escritura
+    :param campos: los nombres de las columnas a escribir. Por defecto, todas
+    :param separador: el separador de las columnas
+    :param encabezado: True si la primera línea lleva los nombres de las columnas
+    :param tam_lote: la cantidad de registros que se escriben de una vez
+    :return: la cantidad de registros escritos. Si no hay registros, el archivo
+             se crea igual, con el encabezado si se dieron los campos
+    """
+    registros = iter(_registros_de(estructura))
+    primero = next(registros, _VACIO)
+    if primero is _VACIO:
+        columnas = [(nombre, None) for nombre in campos or ()]
+    else:
+        columnas = _columnas_de(primero) or [("valor", lambda valor: valor)]
+        registros = chain((primero,), registros)
+        if campos is not None:
+            por_nombre = dict(columnas)
+            columnas = [(nombre, por_nombre[nombre]) for nombre in campos]
+    obtener = [funcion for _, funcion in columnas]
+    cantidad = 0
+    with _abrir_destino(destino, newline="") as archivo:
+        escritor = csv.writer(archivo, delimiter=separador)
+        if encabezado and columnas:
+            escritor.writerow([nombre for nombre, _ in columnas])
+        for lote in _lotes(registros, tam_lote):
+            escritor.writerows([[funcion(registro) for funcion in obtener] for registro in lote])
+            cantidad += len(lote)
+    return cantidad
+
+
+def escribir_jsonl(estructura: Any, destino: Any, tam_lote: int = 1_000) -> int:
+    """
+    Escribe los registros de una estructura en formato JSON Lines: un objeto
+    JSON por línea. Los registros se escriben por lotes, así que la memoria
+    usada no depende de la cantidad. Las dataclasses se escriben como objetos
+    con sus campos; los números y booleanos de NumPy (como los que producen
+    los lectores de archivos con pandas) se escriben como números y booleanos,
+    y los demás valores que JSON no conoce se escriben como texto.
+    :param estructura: una Lista, una Pila, un árbol (NodoArbin) o cualquier iterable
+    :param destino: la ruta del archivo o un archivo abierto para escritura
+    :param tam_lote: la cantidad de registros que se escriben de una vez
+    :return: la cantidad de registros escritos
+    """
+    columnas = None
+    cantidad = 0
+    codificador = json.JSONEncoder(ensure_ascii=False, default=_valor_json)
+    with _abrir_destino(destino) as archivo:
+        for lote in _lotes(_registros_de(estructura), tam_lote):
+            lineas = []
+            for registro in lote:
+                if is_dataclass(registro):
+                    if columnas is None or columnas[0] is not type(registro):
+                        columnas = (type(registro), _columnas_de(registro))
+                    registro = {nombre: funcion(registro) for nombre, funcion in columnas[1]}
+                lineas.append(codificador.encode(registro))
+            archivo.write("\n".join(lineas) + "\n")
+            cantidad += len(lote)
+    return cantidad
+
+
+def _valor_json(valor: Any) -> Any:
+    """
+    Convierte los valores que JSON no conoce: los escalares y arreglos de NumPy
+    en valores de Python, y todo lo demás en texto
+    """
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    return str(valor)
+
+
+def _lotes(elementos: Iterable, tam_lote: int) -> Iterator[list]:
+    iterador = iter(elementos)
+    while True:
+        lote = list(islice(iterador, tam_lote))
+        if not lote:
+            return
+        yield lote
 
-def arbol_de_numeros() -> NodoArbin[int]:
-    return NodoArbin(
-        60,
-        NodoArbin(
-            41,
-            NodoArbin(
-                16,
-                None,
-                NodoArbin(25)
-            ),
-            NodoArbin(
-                53,
-                NodoArbin(
-                    46,
-                    NodoArbin(42)
-                ),
-                NodoArbin(55)
-            )
-        ),
-        NodoArbin(
-            74,
-            NodoArbin(
-                65,
-                NodoArbin(
-                    63,
-                    NodoArbin(62),
-                    NodoArbin(64)
-                ),
-                NodoArbin(70)
-            )
-        )
-    )
 
+# ---------------------------------------------------------------------
+# Tablas columnares
+from dataclasses import fields
+
+
+def _sin_prefijo_privado(nombre: str) -> str:
+    """
+    Quita el prefijo de un atributo privado, por ejemplo _Persona__cedula -> cedula.
+    Las versiones compactas conservan el prefijo de la clase original.
+    """
+    if nombre.startswith('_') and not nombre.startswith('__'):
+        _, separador, campo = nombre[1:].partition('__')
+        if separador and campo:
+            return campo
+    return nombre
+
+
+def _crear_columna(valores: list) -> np.ndarray:
+    """
+    Convierte los valores de un campo en un arreglo de NumPy del tipo adecuado.
+    Los valores que no son todos numéricos o booleanos se guardan como objetos,
+    para no perder información al reconstruir los registros.
+    """
+    tipos = set(map(type, valores))
+    if tipos <= {bool, np.bool_}:
+        return np.array(valores, dtype=bool)
+    if tipos <= {int, np.int64}:
+        try:
+            return np.array(valores, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif tipos <= {int, float, np.int64, np.float64}:
+        return np.array(valores, dtype=np.float64)
+    columna = np.empty(len(valores), dtype=object)
+    columna[:] = valores
+    return columna
+
+
+class TablaColumnar(Generic[T]):
+    """
+    Tabla que guarda una lista de registros (objetos de una dataclass) por
+    columnas: cada campo es un arreglo de NumPy. Las sumas, promedios, conteos,
+    filtros y ordenamientos se hacen con operaciones vectorizadas, y los
+    registros se reconstruyen solo cuando se piden.
+    Las columnas se nombran como las propiedades de la clase, así que en
+    Persona la columna del campo __edad se llama "edad".
+    """
+
+    def __init__(self, clase: type, columnas: dict[str, np.ndarray]):
+        """
+        Crea la tabla a partir de sus columnas
+        :param clase: la dataclass de los registros
+        :param columnas: diccionario con el nombre de cada campo y su arreglo de valores
+        """
+        self.__clase = clase
+        self.__columnas = columnas
+        self.__tam = len(next(iter(columnas.values()))) if columnas else 0
+
+
+    @staticmethod
+    def nombres_de_campos(clase: type) -> List[str]:
+        """
+        Obtiene los nombres de las columnas para una dataclass
+        :param clase: la dataclass de los registros
+        :return: los nombres de los campos, sin el prefijo de los atributos privados
+        """
+        if not is_dataclass(clase):
+            raise TypeError(f"{clase.__name__} no es una dataclass")
+        return [_sin_prefijo_privado(campo.name) for campo in fields(clase)]
+
+
+    @staticmethod
+    def desde_lista(lista: Lista[T], clase: type = None) -> 'TablaColumnar[T]':
+        """
+        Crea una tabla columnar con los registros de la lista
+        :param lista: la lista de registros
+        :param clase: la dataclass de los registros. Si no se da, se toma la del primer elemento
+        :return: la tabla columnar
+        """
+        if clase is None:
+            if lista.vacia:
+                raise ValueError("No se puede deducir la clase de una lista vacía")
+            clase = type(lista.primero)
+        nombres = TablaColumnar.nombres_de_campos(clase)
+        obtener = attrgetter(*[campo.name for campo in fields(clase)])
+        registros = [obtener(lista[i]) for i in lista.indices]
+        if len(nombres) == 1:
+            registros = [(valor,) for valor in registros]
+        valores = list(zip(*registros)) if registros else [()] * len(nombres)
+        columnas = {nombre: _crear_columna(list(columna)) for nombre, columna in zip(nombres, valores)}
+        return TablaColumnar(clase, columnas)
+
+
+    @property
+    def tam(self) -> int:
+        return self.__tam
+
+
+    @property
+    def vacia(self) -> bool:
+        return self.__tam == 0
+
+
+    @property
+    def clase(self) -> type:
+        return self.__clase
+
+
+    @property
+    def nombres_columnas(self) -> List[str]:
+        return list(self.__columnas)
+
+
+    def columna(self, nombre: str) -> np.ndarray:
+        """
+        Obtiene el arreglo con los valores de un campo
+        :param nombre: el nombre del campo
+        :return: el arreglo de NumPy con la columna
+        """
+        if nombre not in self.__columnas:
+            raise AttributeError(f"El objeto no tiene el atributo {nombre}")
+        return self.__columnas[nombre]
+
+
+    def __getitem__(self, indice: int | str) -> T | np.ndarray:
+        """
+        Con un número, reconstruye el registro que se encuentra en el índice dado.
+        Con un string, retorna la columna de ese nombre.
+        :param indice: la posición del registro o el nombre de la columna
+        :return: el registro, la columna, o None si el índice está fuera de rango
+        """
+        if isinstance(indice, str):
+            return self.columna(indice)
+        if -self.__tam <= indice < self.__tam:
+            return self.__clase(*[columna[indice].item() if isinstance(columna[indice], np.generic) else columna[indice]
+                                  for columna in self.__columnas.values()])
+        return None
+
+
+    def registros(self):
+        """
+        Reconstruye los registros de la tabla uno por uno, en orden
+        :return: un generador con los registros
+        """
+        clase = self.__clase
+        for valores in zip(*[columna.tolist() for columna in self.__columnas.values()]):
+            yield clase(*valores)
+
+
+    def a_lista(self) -> Lista[T]:
+        """
+        Reconstruye todos los registros y los guarda en una lista
+        :return: la lista de registros
+        """
+        return Lista.desde_iterable(self.registros())
+
+
+    def __valores(self, selector: str | Callable[..., np.ndarray]) -> np.ndarray:
+        if isinstance(selector, str):
+            return self.columna(selector)
+        return np.asarray(selector(self))
+
+
+    def __mascara(self, predicado) -> np.ndarray:
+        mascara = self.__valores(predicado)
+        if mascara.dtype != bool or mascara.shape != (self.__tam,):
+            raise ValueError("El predicado debe producir un arreglo de booleanos del tamaño de la tabla")
+        return mascara
+
+
+    def sumar(self, selector: str | Callable[..., np.ndarray]) -> float:
+        """
+        Halla la suma de una columna o de una expresión sobre las columnas
+        :param selector: el nombre de la columna o una función que recibe la tabla y
+                         retorna un arreglo, por ejemplo lambda t: t["precio"] - t["costo"]
+        :return: la suma de los valores
+        """
+        if self.__tam == 0:
+            return 0.0
+        return float(np.sum(self.__valores(selector)))
+
+
+    def promedio(self, selector: str | Callable[..., np.ndarray]) -> float:
+        """
+        Halla el promedio de una columna o de una expresión sobre las columnas
+        :param selector: el nombre de la columna o una función que recibe la tabla y retorna un arreglo
+        :return: el promedio de los valores
+        """
+        if self.__tam == 0:
+            return 0.0
+        return float(np.mean(self.__valores(selector)))
+
+
+    def mayor(self, selector: str | Callable[..., np.ndarray]) -> Optional[T]:
+        """
+        Obtiene el registro con el mayor valor de la columna o expresión
+        :param selector: el nombre de la columna o una función que recibe la tabla y retorna un arreglo
+        :return: el registro, o None si la tabla está vacía
+        """
+        if self.__tam == 0:
+            return None
+        return self[int(np.argmax(self.__valores(selector)))]
+
+
+    def menor(self, selector: str | Callable[..., np.ndarray]) -> Optional[T]:
+        """
+        Obtiene el registro con el menor valor de la columna o expresión
+        :param selector: el nombre de la columna o una función que recibe la tabla y retorna un arreglo
+        :return: el registro, o None si la tabla está vacía
+        """
+        if self.__tam == 0:
+            return None
+        return self[int(np.argmin(self.__valores(selector)))]
+
+
+    def contar(self, predicado: Callable[..., np.ndarray] = None) -> int:
+        """
+        Cuenta los registros que cumplen con el predicado
+        :param predicado: una función que recibe la tabla y retorna un arreglo de booleanos,
+                          por ejemplo lambda t: t["estrato"] >= 4
+        :return: la cantidad de registros que cumplen con el predicado
+        """
+        if predicado is None:
+            return self.__tam
+        return int(np.count_nonzero(self.__mascara(predicado)))
+
+
+    def porcentaje(self, predicado: Callable[..., np.ndarray] = None) -> float:
+        """
+        Retorna el porcentaje de registros que cumplen con el predicado
+        :param predicado: una función que recibe la tabla y retorna un arreglo de booleanos
+        :return: el porcentaje de registros que cumplen con el predicado
+        """
+        if predicado is None:
+            return 100.0
+        cont = self.contar(predicado)
+        return 0.0 if cont == 0 else 100.0 * cont / self.__tam
+
+
+    def __seleccionar_filas(self, posiciones: np.ndarray) -> 'TablaColumnar[T]':
+        return TablaColumnar(self.__clase, {nombre: columna[posiciones] for nombre, columna in self.__columnas.items()})
+
+
+    def filtrar(self, predicado: Callable[..., np.ndarray]) -> 'TablaColumnar[T]':
+        """
+        Obtiene una tabla con los registros que cumplen con el predicado
+        :param predicado: una función que recibe la tabla y retorna un arreglo de booleanos
+        :return: la tabla con los registros que cumplen con el predicado
+        """
+        return self.__seleccionar_filas(self.__mascara(predicado))
+
+
+    def ordenar(self, atributo: str, descendente: bool = False) -> 'TablaColumnar[T]':
+        """
+        Ordena la tabla por una o varias columnas. El ordenamiento es estable.
+        :param atributo: los nombres de las columnas, por ejemplo "estrato, -edad".
+                         Un '-' antes del nombre ordena esa columna de mayor a menor.
+        :param descendente: True si se quiere la tabla ordenada de mayor a menor
+        :return: la nueva tabla ordenada
+        """
+        claves = []
+        for nombre in atributo.split(","):
+            nombre = nombre.strip()
+            desc = nombre.startswith("-")
+            if desc:
+                nombre = nombre[1:].strip()
+            columna = self.columna(nombre)
+            if columna.dtype == object or desc != descendente:
+                # Se reemplaza cada valor por su posición entre los valores distintos.
+                # Para ordenar de mayor a menor se invierten esas posiciones: negar los
+                # valores desborda con el menor entero y no sirve con enteros sin signo.
+                columna = np.unique(columna, return_inverse=True)[1].reshape(-1)
+                if desc != descendente and self.__tam > 0:
+                    columna = columna.max() - columna
+            elif columna.dtype == bool:
+                columna = columna.astype(np.int8)
+            claves.append(columna)
+        posiciones = np.lexsort(claves[::-1]) if self.__tam > 0 else np.arange(0)
+        return self.__seleccionar_filas(posiciones)
+
+
+    def __str__(self) -> str:
+        return f"TablaColumnar[{self.__clase.__name__}]({self.__tam} registros, columnas={self.nombres_columnas})"
+
+
+# ---------------------------------------------------------------------
+# Listas numéricas
+
+from array import array
+
+
+class ListaNumerica:
+    """
+    Lista de números guardados en un arreglo contiguo (array.array), sin un
+    objeto de Python por cada elemento. Las sumas, promedios, máximos, mínimos
+    y operaciones elemento a elemento se hacen con NumPy sobre el mismo arreglo,
+    sin copiarlo. Los enteros se guardan con 64 bits ('q') y los reales como
+    double ('d').
+    """
+
+    def __init__(self, elementos: Iterable[int | float] = (), tipo: str = None):
+        """
+        Crea la lista numérica
+        :param elementos: los números iniciales. Puede ser una lista, un arreglo de NumPy o array.array
+        :param tipo: 'q' para enteros o 'd' para reales. Si no se da, se escoge 'q' cuando todos son
+                     enteros y caben en 64 bits
+        """
+        if isinstance(elementos, np.ndarray):
+            if tipo is None:
+                tipo = 'q' if elementos.dtype.kind in 'iu' else 'd'
+            self.__datos = array(tipo, np.ascontiguousarray(elementos, dtype=_TIPOS_NUMPY[tipo]).tobytes())
+            return
+        if isinstance(elementos, array) and elementos.typecode == tipo:
+            self.__datos = array(tipo, elementos)
+            return
+        valores = elementos if isinstance(elementos, (list, tuple, array)) else list(elementos)
+        if tipo is None:
+            # array.array revisa los tipos en C: si algún valor no es entero (o no cabe), se usan reales
+            try:
+                self.__datos = array('q', valores)
+                return
+            except (TypeError, OverflowError):
+                tipo = 'd'
+        try:
+            self.__datos = array(tipo, valores)
+        except TypeError:
+            raise TypeError("Solo podemos trabajar con valores numéricos") from None
+
+
+    @staticmethod
+    def __desde_numpy(arreglo: np.ndarray) -> 'ListaNumerica':
+        """
+        Crea una lista numérica con el resultado de una operación de NumPy
+        """
+        return ListaNumerica(arreglo, 'q' if arreglo.dtype.kind in 'iub' else 'd')
+
+
+    @property
+    def tipo(self) -> str:
+        """
+        El código de tipo del arreglo: 'q' para enteros y 'd' para reales
+        """
+        return self.__datos.typecode
+
+
+    @property
+    def tam(self) -> int:
+        return len(self.__datos)
+
+
+    @property
+    def vacia(self) -> bool:
+        return len(self.__datos) == 0
 
-def crear_arbol_de_lista(lista: Lista[T]) -> NodoArbin[T]:
-    """
-    Crea un árbol binario a partir de una lista
-    :param lista: la lista con los objetos
-    :return: el arbol binario
-    """
-    def crear_arbol_aux(lista: Lista[T], posicion: int) -> Optional[NodoArbin[T]]:
-        tam = lista.tam
-        if posicion >= tam:
-            return None
-        act = NodoArbin(lista[posicion])
-        pos_izq = 2 * posicion + 1
-        pos_der = 2 * posicion + 2
-        if pos_izq < tam:
-            act.izq = crear_arbol_aux(lista, pos_izq)
-        if pos_der < tam:
-            act.der = crear_arbol_aux(lista, pos_der)
-        return act
 
-    # ------------------------------------------------------------------------------
-    return crear_arbol_aux(lista, 0)
+    def __len__(self) -> int:
+        return len(self.__datos)
 
 
-def arbol_verbos() -> NodoArbin[str]:
-    """
-    Crea un árbol binario con verbos a partir de una lista
-    :return: el árbol binario con verbos
-    """
-    verbos = crear_lista("comer",
-        "cenar", "partir", "tener", "sufrir",
-        "internacionalizar", "exponer", "pedir",
-        "sanar", "mecer", "adolecer")
-    return crear_arbol_de_lista(verbos)
+    def __iter__(self) -> Iterator[int | float]:
+        return iter(self.__datos)
 
 
-def arbol_personas() -> NodoArbin[Persona]:
-    return  crear_arbol_de_lista(leer_archivo_personas())
+    def __getitem__(self, indice: int | slice) -> Optional[int | float] | 'ListaNumerica':
+        """
+        Obtiene el número en la posición dada, o None si no existe. Con una
+        porción (por ejemplo numeros[10:20]) retorna una nueva lista numérica.
+        """
+        if isinstance(indice, slice):
+            return ListaNumerica(self.__datos[indice], self.tipo)
+        if -len(self.__datos) <= indice < len(self.__datos):
+            return self.__datos[indice]
+        return None
 
 
-# ---------------------------------------------------------------------
+    def __setitem__(self, indice: int, valor: int | float) -> None:
+        self.__datos[indice] = valor
 
-@dataclass(frozen=True)
-class Punto:
-    """
-    Esta clase representa un punto en el plano cartesiano
-    """
-    x: float
-    y: float
 
-    @property
-    def radio(self) -> float:
+    def agregar(self, valor: int | float) -> None:
         """
-        Obtiene la distancia al origen del punto
-        :return: la distancia al origen del punto
+        Agrega un número al final de la lista
+        :param valor: el número a agregar
+        :return: None
         """
-        return sqrt(self.x ** 2 + self.y ** 2)
+        if not _es_numero(valor):
+            raise TypeError("Solo podemos trabajar con valores numéricos")
+        self.__datos.append(valor)
 
 
-    def distancia_al_origen(self) -> float:
-        return self.radio
+    def extender(self, valores: Iterable[int | float]) -> None:
+        """
+        Agrega varios números al final de la lista
+        :param valores: los números a agregar
+        :return: None
+        """
+        self.__datos.extend(ListaNumerica(valores, self.tipo).__datos)
 
 
-    @property
-    def angulo(self) -> float:
+    def memoria(self) -> memoryview:
         """
-        Retorna el angulo con el eje x del punto
-        :return: el ángulo
+        Obtiene una vista de la memoria del arreglo, sin copiarlo. Mientras la
+        vista exista, la lista no puede crecer.
+        :return: la vista de memoria
         """
-        return math.atan2(self.y, self.x)
+        return memoryview(self.__datos)
 
 
-    def cuadrante(self) -> int:
+    def a_numpy(self) -> np.ndarray:
         """
-        Obtener el cuadrante al que pertenece el punto
-        :return: 1, 2, 3 o 4 dependiendo del cuadrante al que pertenece el punto
+        Obtiene un arreglo de NumPy que usa la misma memoria que la lista.
+        Mientras el arreglo exista, la lista no puede crecer.
+        :return: el arreglo de NumPy, sin copiar los datos
         """
-        if self.x >= 0:
-            if self.y >= 0:
-                return 1
-            else:
-                return 4
-        else:
-            if self.y >= 0:
-                return 2
-            else:
-                return 3
+        return np.frombuffer(self.__datos, dtype=_TIPOS_NUMPY[self.tipo])
 
 
-def lista_de_puntos() -> Lista[Punto]:
-    return crear_lista(
-        Punto(15.0, -10.0),
-        Punto(5.0, 4.0),
-        Punto(-3.0, 15.0),
-        Punto(-8.0, -30.0),
-        Punto(-7.0, 25.0),
-        Punto(6.0, -70.0),
-        Punto(9.0, 10.0),
-        Punto(-8.0, -61.0),
-        Punto(90.0, -80.0),
-        Punto(-75.0, -80.0),
-        Punto(45.0, -77.0),
-        Punto(3.0, 4.0)
-    )
+    def a_lista(self) -> Lista[int | float]:
+        """
+        Obtiene una Lista normal con los números
+        :return: la lista con los números
+        """
+        return Lista.desde_iterable(self.__datos.tolist())
 
 
-def arbol_de_puntos() -> NodoArbin[Punto]:
-    return crear_arbol_de_lista(lista_de_puntos())
+    def sumar(self) -> int | float:
+        """
+        Halla la suma de todos los números
+        :return: la suma de los números
+        """
+        if len(self.__datos) == 0:
+            return 0.0
+        return self.a_numpy().sum().item()
 
 
-# ---------------------------------------------------------------------
+    def promedio(self) -> float:
+        """
+        Halla el promedio de los números
+        :return: el promedio, o 0.0 si la lista está vacía
+        """
+        if len(self.__datos) == 0:
+            return 0.0
+        return self.a_numpy().mean(dtype=np.float64).item()
 
-# Otros árboles
-def arbol_de_departamentos() -> NodoArbin[Departamento]:
-    return crear_arbol_de_lista(leer_archivo_departamentos())
 
-def arbol_de_equipos() -> NodoArbin[EquipoFutbol]:
-    return crear_arbol_de_lista(leer_archivo_equipos())
+    def mayor(self) -> Optional[int | float]:
+        """
+        Obtiene el número más grande de la lista
+        :return: el mayor número, o None si la lista está vacía
+        """
+        if len(self.__datos) == 0:
+            return None
+        return self.a_numpy().max().item()
 
-def arbol_de_municipios() -> NodoArbin[Municipio]:
-    return crear_arbol_de_lista(leer_archivo_municipios())
 
-# ---------------------------------------------------------------------
+    def menor(self) -> Optional[int | float]:
+        """
+        Obtiene el número más pequeño de la lista
+        :return: el menor número, o None si la lista está vacía
+        """
+        if len(self.__datos) == 0:
+            return None
+        return self.a_numpy().min().item()
 
-@dataclass(frozen=True)
-class Producto:
-    codigo: int
-    categoria: int
-    nombre: str
-    modelo: str
-    descripcion: str
-    color: str
-    costo: float
-    precio: float
 
+    def sumas_acumuladas(self) -> 'ListaNumerica':
+        """
+        Obtiene las sumas de prefijos: la posición i tiene la suma de los
+        números desde la posición 0 hasta la i
+        :return: la lista con las sumas acumuladas
+        """
+        return ListaNumerica.__desde_numpy(np.cumsum(self.a_numpy()))
 
-    def ganancia(self) -> float:
+
+    def __operar(self, otro: Any, operacion: Callable, reflejada: bool = False) -> 'ListaNumerica':
         """
-        Obtiene la ganancia de un producto
-        :return: la diferencia entre el precio y el costo
+        Aplica una operación de NumPy elemento a elemento con un número u otra lista del mismo tamaño
         """
-        return self.precio - self.costo
+        if isinstance(otro, ListaNumerica):
+            otro = otro.a_numpy()
+        elif not _es_numero(otro):
+            otro = np.asarray(otro if isinstance(otro, (list, tuple, np.ndarray)) else list(otro))
+        if isinstance(otro, np.ndarray) and len(otro) != len(self.__datos):
+            raise ValueError("Las listas deben tener el mismo tamaño")
+        propio = self.a_numpy()
+        resultado = operacion(otro, propio) if reflejada else operacion(propio, otro)
+        return ListaNumerica.__desde_numpy(resultado)
+
+
+    def __add__(self, otro) -> 'ListaNumerica':
+        return self.__operar(otro, np.add)
+
+
+    def __radd__(self, otro) -> 'ListaNumerica':
+        return self.__operar(otro, np.add, True)
+
+
+    def __sub__(self, otro) -> 'ListaNumerica':
+        return self.__operar(otro, np.subtract)
+
+
+    def __rsub__(self, otro) -> 'ListaNumerica':
+        return self.__operar(otro, np.subtract, True)
 
 
-def lista_de_productos() -> Lista[Producto]:
+    def __mul__(self, otro) -> 'ListaNumerica':
+        return self.__operar(otro, np.multiply)
+
+
+    def __rmul__(self, otro) -> 'ListaNumerica':
+        return self.__operar(otro, np.multiply, True)
+
+
+    def __truediv__(self, otro) -> 'ListaNumerica':
+        return self.__operar(otro, np.true_divide)
+
+
+    def __rtruediv__(self, otro) -> 'ListaNumerica':
+        return self.__operar(otro, np.true_divide, True)
+
+
+    def __neg__(self) -> 'ListaNumerica':
+        return ListaNumerica.__desde_numpy(np.negative(self.a_numpy()))
+
+
+    def __eq__(self, otro) -> bool:
+        if isinstance(otro, ListaNumerica):
+            return self.__datos == otro.__datos
+        return NotImplemented
+
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(map(str, self.__datos)) + ']'
+
+
+    def __repr__(self) -> str:
+        return _repr_limitado('ListaNumerica', iter(self.__datos), len(self.__datos))
+
+
+# Tipos de NumPy que corresponden a los códigos de array.array de ListaNumerica
+_TIPOS_NUMPY = {'q': np.int64, 'd': np.float64}
+
+
+# ---------------------------------------------------------------------
+# Funciones de comparación
+
+class _Descendente:
     """
-    Permite obtener una lista con la información de los productos
-    :return: la lista de productos del archivo
+    Envuelve un valor para que se compare en orden inverso.
+    Se usa en las claves de ordenamiento de los atributos marcados con '-'
     """
-    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/Product.csv"
-    df = pd.read_csv(archivo, encoding="utf-8")
-    lista = Lista[Producto]()
-    for index, row in df.iterrows():
-        codigo = int(row["ProductKey"])
-        categoria = int(row["ProductSubcategoryKey"])
-        nombre = row["ProductName"]
-        modelo = row["ModelName"]
-        descripcion = row["ProductDescription"]
-        color = row["ProductColor"]
-        costo = float(row["ProductCost"])
-        precio = float(row["ProductPrice"])
-        prod = Producto(codigo, categoria, nombre, modelo, descripcion, color, costo, precio)
-        lista.agregar(prod)
-    return lista
+    __slots__ = ('valor',)
 
+    def __init__(self, valor):
+        self.valor = valor
 
-def arbol_de_productos() -> NodoArbin[Producto]:
-    return crear_arbol_de_lista(lista_de_productos())
+    def __lt__(self, otro: '_Descendente') -> bool:
+        return otro.valor < self.valor
 
-# ----------------------------------------------------------------------
+    def __gt__(self, otro: '_Descendente') -> bool:
+        return self.valor < otro.valor
 
-@dataclass(frozen=True)
-class Carro:
-    codigo: int
-    modelo: str
-    año: int
-    precio: int
-    transmision: str
-    kilometraje: int
-    tipo_combustible: str
-    cilindraje: float
-    fabricante: str
+    def __eq__(self, otro) -> bool:
+        return isinstance(otro, _Descendente) and self.valor == otro.valor
 
-    def edad(self) -> int:
-        """"
-        Determina el número de años que ha sido fabricado el carro
+    def __hash__(self) -> int:
+        return hash(self.valor)
+
+
+def _atributo_declarado(clase: type, nombre: str) -> bool:
+    """
+    Permite saber si la clase declara el atributo, ya sea como atributo de
+    clase, propiedad, método, campo de dataclass o anotación
+    """
+    if hasattr(clase, nombre):
+        return True
+    for base in clase.__mro__:
+        if nombre in getattr(base, '__annotations__', {}) or nombre in getattr(base, '__slots__', ()):
+            return True
+    return False
+
+
+class Comparador:
+    """
+    Criterio de comparación compilado a partir de un string de atributos como
+    "estrato, edad, poblacion_total()". Los nombres se analizan una sola vez y
+    los valores se obtienen con attrgetter y methodcaller. Un '-' antes del
+    nombre indica que ese atributo se compara de mayor a menor.
+    """
+
+    def __init__(self, atributos: str, clase: type = None):
         """
-        hoy = datetime.now()
-        anio = hoy.year
-        return anio - self.año
+        Analiza los atributos y construye la función clave
+        :param atributos: un string con los nombres de los atributos de la clase
+        :param clase: la clase de los objetos que se van a comparar. Si se conoce,
+                      los atributos inexistentes se detectan de inmediato.
+        """
+        self.atributos = atributos
+        self.clase = clase
+        self.__pendientes = []
+        campos = []
+        for nombre_attr in atributos.split(","):
+            nombre_attr = nombre_attr.strip()
+            descendente = nombre_attr.startswith("-")
+            if descendente:
+                nombre_attr = nombre_attr[1:].strip()
+            es_metodo = nombre_attr.endswith(")")
+            nomatrib = nombre_attr.split("(")[0].strip() if es_metodo else nombre_attr
+            if not nomatrib.isidentifier():
+                raise ValueError(f"Atributo inválido '{nombre_attr}' en '{atributos}'")
+            if clase is not None and not _atributo_declarado(clase, nomatrib):
+                if is_dataclass(clase):
+                    raise AttributeError(f"El objeto no tiene el atributo {nomatrib}")
+                # Atributos de instancia: se verifican con el primer objeto
+                self.__pendientes.append(nomatrib)
+            obtener = methodcaller(nomatrib) if es_metodo else attrgetter(nomatrib)
+            campos.append((nomatrib, es_metodo, obtener, descendente))
+        self.campos = tuple(campos)
+        self.clave = self.__crear_clave()
+
+
+    def __crear_clave(self) -> Callable[[Any], Any]:
+        if not any(desc for _, _, _, desc in self.campos):
+            if len(self.campos) == 1:
+                return self.campos[0][2]
+            if not any(es_metodo for _, es_metodo, _, _ in self.campos):
+                return attrgetter(*[nombre for nombre, _, _, _ in self.campos])
+        obtenedores = [(obtener, desc) for _, _, obtener, desc in self.campos]
+
+        def clave(objeto):
+            return tuple(_Descendente(obtener(objeto)) if desc else obtener(objeto) for obtener, desc in obtenedores)
+        return clave
+
+
+    def validar(self, objeto) -> None:
+        """
+        Verifica, con un objeto de ejemplo, los atributos que no se pudieron
+        verificar con la clase. Solo se hace la primera vez.
+        :param objeto: un objeto de la clase
+        :return: None
+        """
+        if self.__pendientes:
+            for nomatrib in self.__pendientes:
+                if not hasattr(objeto, nomatrib):
+                    raise AttributeError(f"El objeto no tiene el atributo {nomatrib}")
+            self.__pendientes = []
+
+
+    def es_menor(self, objeto1, objeto2) -> bool:
+        """
+        Permite saber si el objeto1 es más pequeño que el objeto2 de acuerdo a los atributos.
+        Se comparan atributo por atributo: si dos valores no son ni menor ni
+        mayor el uno del otro (por ejemplo, si alguno es NaN) se pasa al siguiente.
+        """
+        for _, _, obtener, descendente in self.campos:
+            valor1, valor2 = obtener(objeto1), obtener(objeto2)
+            if descendente:
+                valor1, valor2 = valor2, valor1
+            if valor1 < valor2:
+                return True
+            if valor1 > valor2:
+                return False
+        return False  # Son iguales
+
 
+    def son_iguales(self, objeto1, objeto2) -> bool:
+        """
+        Permite saber si el objeto1 es igual al objeto2 de acuerdo a los atributos
+        """
+        return all(obtener(objeto1) == obtener(objeto2) for _, _, obtener, _ in self.campos)
+
+
+    def __repr__(self) -> str:
+        clase = 'None' if self.clase is None else self.clase.__name__
+        return f"Comparador({self.atributos!r}, {clase})"
 
-def lista_de_carros_usados(n: int = 10) -> Lista[Carro]:
+
+@lru_cache(maxsize=256)
+def compilar_atributos(atributos: str, clase: type = None) -> Comparador:
     """
-    Permite obtener una lista con la información de los carros
-    :return: la lista de carros del archivo
+    Obtiene el comparador de los atributos para la clase dada. Los comparadores
+    se guardan en un caché, así que cada especificación se analiza una sola vez.
+    :param atributos: un string con los nombres de los atributos, por ejemplo "estrato, edad"
+    :param clase: la clase de los objetos que se van a comparar
+    :return: el comparador compilado
     """
-    archivo = "https://raw.githubusercontent.com/luiscobo/poo/refs/heads/main/cars_dataset.csv"
-    df = pd.read_csv(archivo, encoding="utf-8")
-    lista = Lista[Carro]()
-    i = 1
-    for index, row in df.iterrows():
-        modelo = row["model"].upper().strip()
-        año = int(row["year"])
-        precio = int(row["price"])
-        transmision = "MANUAL" if row["transmission"] == "Manual" else "AUTOMATICA" if row["transmission"] == "Automatic" else "SEMIAUTOMATICA"
-        kilometraje = int(row["mileage"])
-        tipo_combustible = "GASOLINA" if row["fuelType"] == "Petrol" else "ACPM" if row["fuelType"] == "Diesel" else "ELECTRICO"
-        cilindraje = float(row["engineSize"])
-        fabricante = row["Make"].upper()
-        carro = Carro(i, modelo, año, precio, transmision, kilometraje, tipo_combustible, cilindraje, fabricante)
-        lista.agregar(carro)
-        i += 1
-        if i > n:
-            break
-    return lista
+    return Comparador(atributos, clase)
+
+
+def comparador_para(atributos: str, objeto) -> Comparador:
+    """
+    Obtiene el comparador compilado para la clase del objeto, verificando
+    que el objeto tenga los atributos indicados
+    :param atributos: un string con los nombres de los atributos
+    :param objeto: un objeto de ejemplo de los que se van a comparar
+    :return: el comparador compilado
+    """
+    comparador = compilar_atributos(atributos, type(objeto))
+    comparador.validar(objeto)
+    return comparador
+
+
+def clave_de_orden(menor_que: Callable[..., bool] = None, atributo: str = None,
+                   muestra: Any = None) -> Optional[Callable[[Any], Any]]:
+    """
+    Obtiene la función clave que usan sorted, min, max y heapq a partir de los
+    criterios de comparación que reciben los métodos de Lista
+    :param menor_que: función que indica si el primer objeto es menor que el segundo
+    :param atributo: un string con los nombres de los atributos usados como criterio
+    :param muestra: un objeto de ejemplo, usado para compilar los atributos
+    :return: la función clave, o None si los elementos se comparan directamente
+    """
+    if menor_que is not None:
+        def comparar(objeto1, objeto2) -> int:
+            if menor_que(objeto1, objeto2):
+                return -1
+            if menor_que(objeto2, objeto1):
+                return 1
+            return 0
+        return cmp_to_key(comparar)
+    if atributo is not None:
+        if muestra is None:
+            return compilar_atributos(atributo).clave
+        return comparador_para(atributo, muestra).clave
+    return None
 
-# ---------------------------------------------------------------------
 
 def es_menor_que(objeto1, objeto2, atributos: str = None) -> bool:
     """
@@ -1231,28 +5658,7 @@ def es_menor_que(objeto1, objeto2, atributos: str = None) -> bool:
         return False
     if atributos is None:
         return objeto1 < objeto2
-    else:
-        nombre_attrs = [atrib.strip() for atrib in atributos.split(",")]
-        for nombre_attr in nombre_attrs:
-            if nombre_attr.endswith(")"):
-                nomatrib = nombre_attr.split("(")[0].strip()
-            else:
-                nomatrib = nombre_attr
-            if not hasattr(objeto1, nomatrib):
-                raise f"El objeto no tiene el atributo {nomatrib}"
-            if not hasattr(objeto2, nomatrib):
-                raise f"El objeto no tiene el atributo {nomatrib}"
-            if nombre_attr.endswith(")"):
-                valor1 = getattr(objeto1, nomatrib)()
-                valor2 = getattr(objeto2, nomatrib)()
-            else:
-                valor1 = getattr(objeto1, nomatrib)
-                valor2 = getattr(objeto2, nomatrib)
-            if valor1 < valor2:
-                return True
-            if valor1 > valor2:
-                return False
-        return False  # Son iguales
+    return comparador_para(atributos, objeto1).es_menor(objeto1, objeto2)
 
 
 def son_iguales(objeto1, objeto2, atributos: str = None) -> bool:
@@ -1267,27 +5673,7 @@ def son_iguales(objeto1, objeto2, atributos: str = None) -> bool:
         return False
     if atributos is None:
         return objeto1 == objeto2
-    else:
-        nombre_attrs = [atrib.strip() for atrib in atributos.split(",")]
-        for nombre_attr in nombre_attrs:
-            if nombre_attr.endswith(")"):
-                nomatrib = nombre_attr.split("(")[0].strip()
-            else:
-                nomatrib = nombre_attr
-            if not hasattr(objeto1, nomatrib):
-                raise f"El objeto no tiene el atributo {nomatrib}"
-            if not hasattr(objeto2, nomatrib):
-                raise f"El objeto no tiene el atributo {nomatrib}"
-            if nombre_attr.endswith(")"):
-                valor1 = getattr(objeto1, nomatrib)()
-                valor2 = getattr(objeto2, nomatrib)()
-            else:
-                valor1 = getattr(objeto1, nomatrib)
-                valor2 = getattr(objeto2, nomatrib)
-            if valor1 != valor2:
-                return False
-
-        return True  # Son iguales
+    return comparador_para(atributos, objeto1).son_iguales(objeto1, objeto2)
 
 
 if __name__ == '__main__':
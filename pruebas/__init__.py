@@ -0,0 +1,2 @@
+# Pruebas de la librería ean_estructuras_datos.
+# Se ejecutan desde la raíz del proyecto con: python -m unittest discover pruebas
@@ -0,0 +1,29 @@
+# Datos de prueba que no dependen de los archivos en línea
+from ean_estructuras_datos import Lista, Municipio, Departamento, Persona
+
+
+def municipios() -> Lista[Municipio]:
+    return Lista.desde_iterable([
+        Municipio(5001, "MEDELLIN", 2_400_000, 30_000, "ANTIOQUIA", True),
+        Municipio(5088, "BELLO", 500_000, 20_000, "ANTIOQUIA", False),
+        Municipio(11001, "BOGOTA", 7_700_000, 15_000, "BOGOTA", True),
+        Municipio(25754, "SOACHA", 650_000, 10_000, "CUNDINAMARCA", False),
+        Municipio(25175, "CHIA", 130_000, 20_000, "CUNDINAMARCA", False),
+        Municipio(76001, "CALI", 2_200_000, 30_000, "VALLE", True),
+        Municipio(76520, "PALMIRA", 250_000, 60_000, "VALLE", False),
+        Municipio(5360, "ITAGUI", 280_000, 5_000, "ANTIOQUIA", False),
+    ])
+
+
+def departamentos() -> Lista[Departamento]:
+    return Lista.desde_iterable([
+        Departamento("ANTIOQUIA", 125, "MEDELLIN", 63_612.0, 6_600_000, 104.0, 0.78, 1826, "ANDINA"),
+        Departamento("CUNDINAMARCA", 116, "BOGOTA", 24_210.0, 3_200_000, 132.0, 0.77, 1857, "ANDINA"),
+        Departamento("VALLE", 42, "CALI", 22_140.0, 4_500_000, 203.0, 0.78, 1910, "PACIFICA"),
+        Departamento("AMAZONAS", 2, "LETICIA", 109_665.0, 80_000, 0.7, 0.69, 1991, "AMAZONIA"),
+    ])
+
+
+def persona(cedula: int, edad: int, estrato: int, fuma: bool = False, clase: type = Persona) -> Persona:
+    return clase(cedula, f"PERSONA {cedula}", edad, "F" if cedula % 2 else "M", cedula % 3, "PROFESIONAL",
+                 estrato, 1_000_000 * estrato, 60, 170, fuma, False, estrato > 3, False)
@@ -0,0 +1,66 @@
+# Pruebas de la agrupación de listas
+import unittest
+
+from ean_estructuras_datos import Estadisticas, Lista, crear_lista
+from pruebas.datos import municipios
+
+
+class TestAgrupar(unittest.TestCase):
+    def setUp(self):
+        self.municipios = municipios()
+
+
+    def test_agrupar_sin_agregados(self):
+        grupos = self.municipios.agrupar("departamento")
+        self.assertEqual(["ANTIOQUIA", "BOGOTA", "CUNDINAMARCA", "VALLE"], list(grupos))
+        self.assertEqual(3, grupos["ANTIOQUIA"]["cantidad"])
+        self.assertIsInstance(grupos["VALLE"]["elementos"], Lista)
+        self.assertEqual(["CALI", "PALMIRA"], [m.nombre for m in grupos["VALLE"]["elementos"]])
+
+
+    def test_agregados(self):
+        grupos = self.municipios.agrupar("departamento",
+                                         poblacion=("sumar", "poblacion_total()"),
+                                         rural=("promedio", lambda m: m.poblacion_rural),
+                                         mayor=("mayor", "poblacion_urbana"),
+                                         menor=("menor", "codigo"),
+                                         capitales=("contar", "es_capital"),
+                                         codigos=("estadisticas", "codigo"))
+        antioquia = grupos["ANTIOQUIA"]
+        self.assertEqual(3_235_000, antioquia["poblacion"])
+        self.assertAlmostEqual(55_000 / 3, antioquia["rural"])
+        self.assertEqual(2_400_000, antioquia["mayor"])
+        self.assertEqual(5001, antioquia["menor"])
+        self.assertEqual(1, antioquia["capitales"])
+        self.assertEqual(0, grupos["CUNDINAMARCA"]["capitales"])
+        self.assertIsInstance(antioquia["codigos"], Estadisticas)
+        self.assertEqual(5360, antioquia["codigos"].maximo)
+
+
+    def test_clave_de_varios_atributos_y_funcion(self):
+        grupos = self.municipios.agrupar("departamento, es_capital")
+        self.assertEqual(2, grupos[("ANTIOQUIA", False)]["cantidad"])
+        grandes = self.municipios.agrupar(lambda m: m.poblacion_urbana > 1_000_000)
+        self.assertEqual(3, grandes[True]["cantidad"])
+
+
+    def test_contar_sin_selector_cuenta_todos(self):
+        grupos = crear_lista(0, 1, 2, 0, 3).agrupar(lambda x: x % 2, n=("contar", None))
+        self.assertEqual({"cantidad": 3, "n": 3}, grupos[0])
+        self.assertEqual({"cantidad": 2, "n": 2}, grupos[1])
+        grupos = crear_lista("", "a", "").agrupar(len, n=("contar", None))
+        self.assertEqual(2, grupos[0]["n"])
+
+
+    def test_contar_con_predicado(self):
+        grupos = crear_lista(0, 1, 2, 0, 3, 4).agrupar(lambda x: x % 2, positivos=("contar", lambda x: x > 0))
+        self.assertEqual(2, grupos[0]["positivos"])
+        self.assertEqual(2, grupos[1]["positivos"])
+
+
+    def test_errores(self):
+        self.assertEqual({}, Lista().agrupar("departamento"))
+        with self.assertRaises(ValueError):
+            self.municipios.agrupar("departamento", x=("moda", None))
+        with self.assertRaises(ValueError):
+            self.municipios.agrupar("-departamento")
@@ -0,0 +1,64 @@
+# Pruebas de los recorridos y medidas de árboles binarios sin recursión
+import sys
+import unittest
+
+from ean_estructuras_datos import (Lista, NodoArbin, altura_arbol, arbol_de_letras, crear_arbol_de_lista,
+                                   hojas_arbol, inorden, por_niveles, postorden, preorden, tam_arbol)
+
+
+def cadena(n: int) -> NodoArbin[int]:
+    """
+    Un árbol con n nodos donde cada nodo solo tiene hijo izquierdo
+    """
+    raiz = None
+    for i in range(n):
+        raiz = NodoArbin(i, raiz)
+    return raiz
+
+
+class TestArboles(unittest.TestCase):
+    def setUp(self):
+        self.letras = arbol_de_letras()
+
+
+    def test_recorridos(self):
+        self.assertEqual("ABDGEHICFJK", "".join(preorden(self.letras)))
+        self.assertEqual("GDBHEIACJKF", "".join(inorden(self.letras)))
+        self.assertEqual("GDHIEBKJFCA", "".join(postorden(self.letras)))
+        self.assertEqual("ABCDEFGHIJK", "".join(por_niveles(self.letras)))
+
+
+    def test_medidas(self):
+        self.assertEqual(5, altura_arbol(self.letras))
+        self.assertEqual(11, tam_arbol(self.letras))
+        self.assertEqual(4, hojas_arbol(self.letras))
+
+
+    def test_arbol_vacio(self):
+        for recorrido in (preorden, inorden, postorden, por_niveles):
+            self.assertEqual([], list(recorrido(None)))
+        self.assertEqual((0, 0, 0), (altura_arbol(None), tam_arbol(None), hojas_arbol(None)))
+        self.assertIsNone(crear_arbol_de_lista(Lista()))
+
+
+    def test_crear_arbol_de_lista(self):
+        arbol = crear_arbol_de_lista(Lista.desde_iterable(range(1, 8)))
+        self.assertEqual([1, 2, 3, 4, 5, 6, 7], list(por_niveles(arbol)))
+        self.assertEqual([4, 2, 5, 1, 6, 3, 7], list(inorden(arbol)))
+        self.assertEqual((3, 7, 4), (altura_arbol(arbol), tam_arbol(arbol), hojas_arbol(arbol)))
+        incompleto = crear_arbol_de_lista(Lista.desde_iterable(range(6)))
+        self.assertEqual(3, hojas_arbol(incompleto))
+        self.assertIsNone(incompleto.izq.der.der)
+
+
+    def test_arboles_muy_profundos(self):
+        n = sys.getrecursionlimit() * 20
+        arbol = cadena(n)
+        self.assertEqual(list(range(n)), list(inorden(arbol)))
+        self.assertEqual(list(range(n - 1, -1, -1)), list(preorden(arbol)))
+        self.assertEqual(list(range(n)), list(postorden(arbol)))
+        self.assertEqual(n, sum(1 for _ in por_niveles(arbol)))
+        self.assertEqual((n, n, 1), (altura_arbol(arbol), tam_arbol(arbol), hojas_arbol(arbol)))
+        grande = crear_arbol_de_lista(Lista.desde_iterable(range(100_000)))
+        self.assertEqual(17, altura_arbol(grande))
+        self.assertEqual(100_000, tam_arbol(grande))
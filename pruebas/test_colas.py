@@ -0,0 +1,85 @@
+# Pruebas de la cola y la bicola
+import unittest
+
+from ean_estructuras_datos import Bicola, Cola, Lista, crear_bicola, crear_cola
+
+
+class TestCola(unittest.TestCase):
+    def setUp(self):
+        self.cola = crear_cola(1, 2, 3)
+
+
+    def test_primero_en_entrar_primero_en_salir(self):
+        self.cola.encolar(4)
+        salida = []
+        while not self.cola.vacia:
+            salida.append(self.cola.frente)
+            self.cola.desencolar()
+        self.assertEqual([1, 2, 3, 4], salida)
+        self.assertEqual(0, self.cola.tam)
+
+
+    def test_cola_vacia(self):
+        cola = Cola()
+        self.assertTrue(cola.vacia)
+        self.assertFalse(cola)
+        with self.assertRaises(IndexError):
+            cola.desencolar()
+        with self.assertRaises(IndexError):
+            _ = cola.frente
+
+
+    def test_copiar(self):
+        copia = self.cola.copiar()
+        self.assertIsInstance(copia, Cola)
+        copia.desencolar()
+        self.cola.encolar(4)
+        self.assertEqual([2, 3], list(copia))
+        self.assertEqual([1, 2, 3, 4], list(self.cola))
+
+
+    def test_recorrido_y_tamano(self):
+        self.assertEqual(3, len(self.cola))
+        self.assertEqual(3, self.cola.tam)
+        self.assertEqual([1, 2, 3], list(self.cola))
+        # Recorrer no desencola
+        self.assertEqual(1, self.cola.frente)
+        self.assertEqual("1 <- 2 <- 3", str(self.cola))
+        self.assertEqual("Cola[1, 2, 3]", repr(self.cola))
+
+
+class TestBicola(unittest.TestCase):
+    def setUp(self):
+        self.bicola = crear_bicola(1, 2, 3)
+
+
+    def test_operaciones_en_los_dos_extremos(self):
+        self.bicola.encolar_al_frente(0)
+        self.bicola.encolar(4)
+        self.assertEqual((0, 4), (self.bicola.frente, self.bicola.final))
+        self.bicola.desencolar_al_final()
+        self.bicola.desencolar()
+        self.assertEqual([1, 2, 3], list(self.bicola))
+        self.assertEqual([3, 2, 1], list(reversed(self.bicola)))
+
+
+    def test_bicola_vacia(self):
+        bicola = Bicola()
+        with self.assertRaises(IndexError):
+            bicola.desencolar_al_final()
+        with self.assertRaises(IndexError):
+            _ = bicola.final
+
+
+    def test_copiar_conserva_el_tipo(self):
+        copia = self.bicola.copiar()
+        self.assertIsInstance(copia, Bicola)
+        copia.desencolar_al_final()
+        self.assertEqual(3, self.bicola.final)
+        self.assertEqual(2, copia.final)
+
+
+    def test_invertir_lista(self):
+        lista = Lista.desde_iterable(range(10_000))
+        self.assertEqual(list(range(9_999, -1, -1)), list(lista.invertir()))
+        self.assertEqual(list(range(10_000)), list(lista))
@@ -0,0 +1,56 @@
+# Pruebas de las versiones compactas de los registros
+import unittest
+from dataclasses import FrozenInstanceError, fields
+
+from ean_estructuras_datos import (Carro, CarroCompacto, Departamento, DepartamentoCompacto, EquipoFutbol,
+                                   EquipoFutbolCompacto, Municipio, MunicipioCompacto, Persona, PersonaCompacta,
+                                   Producto, ProductoCompacto, Punto, PuntoCompacto, TablaColumnar)
+from pruebas.datos import municipios, persona
+
+
+class TestCompactos(unittest.TestCase):
+    def setUp(self):
+        self.parejas = [(Persona, PersonaCompacta), (Departamento, DepartamentoCompacto),
+                        (EquipoFutbol, EquipoFutbolCompacto), (Municipio, MunicipioCompacto), (Punto, PuntoCompacto),
+                        (Producto, ProductoCompacto), (Carro, CarroCompacto)]
+
+
+    def test_mismos_campos_sin_dict(self):
+        for original, compacta in self.parejas:
+            with self.subTest(clase=compacta.__name__):
+                self.assertEqual([c.name for c in fields(original)], [c.name for c in fields(compacta)])
+                self.assertEqual(original.__dataclass_params__.frozen, compacta.__dataclass_params__.frozen)
+                self.assertNotIn('__dict__', vars(compacta))
+                self.assertTrue(compacta.__slots__)
+
+
+    def test_persona_compacta(self):
+        normal = persona(7, 30, 2, fuma=True)
+        compacta = persona(7, 30, 2, fuma=True, clase=PersonaCompacta)
+        self.assertFalse(hasattr(compacta, '__dict__'))
+        for nombre, valor in vars(Persona).items():
+            if isinstance(valor, property):
+                self.assertEqual(getattr(normal, nombre), getattr(compacta, nombre), nombre)
+
+
+    def test_metodos_y_propiedades(self):
+        municipio = MunicipioCompacto(5001, "MEDELLIN", 2_400_000, 30_000, "ANTIOQUIA", True)
+        self.assertEqual(2_430_000, municipio.poblacion_total())
+        self.assertEqual(5.0, PuntoCompacto(3, 4).radio)
+        producto = ProductoCompacto(1, 2, "MESA", "M1", "MESA DE MADERA", "CAFE", 100.0, 150.0)
+        self.assertEqual(50.0, producto.ganancia())
+
+
+    def test_inmutables_y_comparables(self):
+        municipio = MunicipioCompacto(5001, "MEDELLIN", 2_400_000, 30_000, "ANTIOQUIA", True)
+        with self.assertRaises(FrozenInstanceError):
+            municipio.codigo = 1
+        self.assertEqual(MunicipioCompacto(5001, "MEDELLIN", 2_400_000, 30_000, "ANTIOQUIA", True), municipio)
+        self.assertEqual(1, len({municipio, MunicipioCompacto(*[getattr(municipio, c.name)
+                                                                for c in fields(municipio)])}))
+
+
+    def test_tabla_columnar(self):
+        compactos = municipios().seleccionar(lambda m: MunicipioCompacto(*[getattr(m, c.name) for c in fields(m)]))
+        tabla = TablaColumnar.desde_lista(compactos)
+        self.assertEqual(list(compactos), list(tabla.a_lista()))
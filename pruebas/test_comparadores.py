@@ -0,0 +1,57 @@
+# Pruebas de los comparadores compilados
+import unittest
+
+from ean_estructuras_datos import Comparador, compilar_atributos, comparador_para, es_menor_que, son_iguales, Punto
+from pruebas.datos import municipios
+
+
+class TestComparadores(unittest.TestCase):
+    def setUp(self):
+        self.medellin, self.bello = municipios()[0], municipios()[1]
+
+
+    def test_es_menor_que(self):
+        self.assertTrue(es_menor_que(self.bello, self.medellin, "nombre"))
+        self.assertFalse(es_menor_que(self.medellin, self.bello, "nombre"))
+        self.assertTrue(es_menor_que(self.medellin, self.bello, "departamento, codigo"))
+        self.assertTrue(es_menor_que(self.medellin, self.bello, "-poblacion_total()"))
+        self.assertTrue(es_menor_que(1, 2))
+        # Objetos de distinto tipo nunca son menores
+        self.assertFalse(es_menor_que(1, "2"))
+
+
+    def test_son_iguales(self):
+        self.assertTrue(son_iguales(self.medellin, self.bello, "departamento"))
+        self.assertFalse(son_iguales(self.medellin, self.bello, "departamento, nombre"))
+        self.assertTrue(son_iguales(Punto(3.0, 4.0), Punto(4.0, 3.0), "radio"))
+
+
+    def test_valores_nan(self):
+        # Un NaN no es ni menor ni mayor, así que se compara el siguiente atributo
+        nan = float("nan")
+        self.assertTrue(es_menor_que(Punto(nan, 1.0), Punto(nan, 2.0), "x, y"))
+        self.assertFalse(es_menor_que(Punto(nan, 2.0), Punto(nan, 1.0), "x, y"))
+        self.assertTrue(es_menor_que(Punto(nan, 1.0), Punto(0.0, 2.0), "x, y"))
+        self.assertTrue(es_menor_que(Punto(nan, 2.0), Punto(0.0, 1.0), "x, -y"))
+        self.assertFalse(es_menor_que(Punto(nan, 1.0), Punto(nan, 1.0), "x, y"))
+        self.assertFalse(son_iguales(Punto(nan, 1.0), Punto(nan, 1.0), "x, y"))
+        self.assertTrue(son_iguales(Punto(nan, 1.0), Punto(nan, 1.0), "y"))
+
+
+    def test_comparador_en_cache(self):
+        self.assertIs(compilar_atributos("estrato, edad"), compilar_atributos("estrato, edad"))
+        comparador = comparador_para("nombre", self.medellin)
+        self.assertIsInstance(comparador, Comparador)
+        self.assertEqual("MEDELLIN", comparador.clave(self.medellin))
+
+
+    def test_clave_de_varios_atributos(self):
+        clave = compilar_atributos("departamento, -codigo").clave
+        self.assertLess(clave(self.bello), clave(self.medellin))
+
+
+    def test_atributos_invalidos(self):
+        with self.assertRaises(ValueError):
+            Comparador("nombre, 2x")
+        with self.assertRaises(AttributeError):
+            es_menor_que(self.medellin, self.bello, "no_existe")
@@ -0,0 +1,195 @@
+# Pruebas de las pilas y colas para varios hilos o tareas
+import asyncio
+import threading
+import time
+import unittest
+from itertools import chain
+
+from ean_estructuras_datos import ColaAsincrona, ColaConcurrente, PilaAsincrona, PilaConcurrente
+
+PRODUCTORES = 4
+CONSUMIDORES = 3
+POR_PRODUCTOR = 2_000
+
+
+def operaciones(estructura) -> tuple:
+    """
+    Los métodos para poner y sacar elementos de la estructura
+    """
+    if isinstance(estructura, (PilaConcurrente, PilaAsincrona)):
+        return estructura.apilar, estructura.desapilar
+    return estructura.encolar, estructura.desencolar
+
+
+class TestConcurrentes(unittest.TestCase):
+    def productores_y_consumidores(self, estructura) -> None:
+        """
+        Varios hilos ponen números y otros los sacan hasta que la estructura se
+        cierra. Cada número debe recibirse exactamente una vez.
+        """
+        poner, sacar = operaciones(estructura)
+        recibidos = [[] for _ in range(CONSUMIDORES)]
+
+        def producir(numero: int) -> None:
+            for i in range(numero * POR_PRODUCTOR, (numero + 1) * POR_PRODUCTOR):
+                poner(i)
+
+        def consumir(destino: list) -> None:
+            while True:
+                try:
+                    destino.append(sacar())
+                except IndexError:
+                    return
+
+        productores = [threading.Thread(target=producir, args=(i,)) for i in range(PRODUCTORES)]
+        consumidores = [threading.Thread(target=consumir, args=(destino,)) for destino in recibidos]
+        for hilo in productores + consumidores:
+            hilo.start()
+        for hilo in productores:
+            hilo.join()
+        estructura.cerrar()
+        for hilo in consumidores:
+            hilo.join(10)
+            self.assertFalse(hilo.is_alive())
+        self.assertEqual(list(range(PRODUCTORES * POR_PRODUCTOR)), sorted(chain.from_iterable(recibidos)))
+        self.assertTrue(estructura.vacia)
+
+
+    def test_sin_perdidas_ni_repetidos(self):
+        for clase in (PilaConcurrente, ColaConcurrente):
+            for capacidad in (None, 8):
+                with self.subTest(clase=clase.__name__, capacidad=capacidad):
+                    self.productores_y_consumidores(clase(capacidad))
+
+
+    def test_orden(self):
+        pila, cola = PilaConcurrente(), ColaConcurrente()
+        for i in range(3):
+            pila.apilar(i)
+            cola.encolar(i)
+        self.assertEqual((2, 0), (pila.tope, cola.frente))
+        self.assertEqual([2, 1, 0], [pila.desapilar() for _ in range(3)])
+        self.assertEqual([0, 1, 2], [cola.desencolar() for _ in range(3)])
+
+
+    def test_sin_bloquear_y_con_tiempo(self):
+        cola = ColaConcurrente(1)
+        with self.assertRaises(IndexError):
+            cola.desencolar(bloquear=False)
+        with self.assertRaises(TimeoutError):
+            cola.desencolar(tiempo=0.01)
+        cola.encolar(1)
+        self.assertTrue(cola.llena)
+        with self.assertRaises(OverflowError):
+            cola.encolar(2, bloquear=False)
+        with self.assertRaises(TimeoutError):
+            cola.encolar(2, tiempo=0.01)
+        with self.assertRaises(ValueError):
+            ColaConcurrente(0)
+
+
+    def test_cerrar_despierta_a_los_que_esperan(self):
+        for clase in (PilaConcurrente, ColaConcurrente):
+            with self.subTest(clase=clase.__name__):
+                vacia, llena = clase(), clase(1)
+                operaciones(llena)[0]("x")
+                errores = []
+
+                def esperar(operacion, *argumentos) -> None:
+                    try:
+                        operacion(*argumentos)
+                    except (IndexError, ValueError) as error:
+                        errores.append(type(error))
+
+                hilos = [threading.Thread(target=esperar, args=(operaciones(vacia)[1],)),
+                         threading.Thread(target=esperar, args=(operaciones(llena)[0], "y"))]
+                for hilo in hilos:
+                    hilo.start()
+                time.sleep(0.05)
+                vacia.cerrar()
+                llena.cerrar()
+                for hilo in hilos:
+                    hilo.join(5)
+                    self.assertFalse(hilo.is_alive())
+                self.assertEqual({IndexError, ValueError}, set(errores))
+                # Lo que quedó se puede sacar, pero no se puede agregar nada más
+                self.assertEqual("x", operaciones(llena)[1]())
+                with self.assertRaises(ValueError):
+                    operaciones(llena)[0]("z")
+                with self.assertRaises(IndexError):
+                    operaciones(llena)[1]()
+
+
+class TestAsincronas(unittest.TestCase):
+    async def productores_y_consumidores(self, estructura) -> list:
+        """
+        Lo mismo que con hilos, con tareas de asyncio
+        """
+        poner, sacar = operaciones(estructura)
+        recibidos = [[] for _ in range(CONSUMIDORES)]
+
+        async def producir(numero: int) -> None:
+            for i in range(numero * POR_PRODUCTOR, (numero + 1) * POR_PRODUCTOR):
+                await poner(i)
+
+        async def consumir(destino: list) -> None:
+            while True:
+                try:
+                    destino.append(await sacar())
+                except IndexError:
+                    return
+
+        consumidores = [asyncio.create_task(consumir(destino)) for destino in recibidos]
+        await asyncio.gather(*(producir(i) for i in range(PRODUCTORES)))
+        estructura.cerrar()
+        await asyncio.wait_for(asyncio.gather(*consumidores), 10)
+        return sorted(chain.from_iterable(recibidos))
+
+
+    def test_sin_perdidas_ni_repetidos(self):
+        for clase in (PilaAsincrona, ColaAsincrona):
+            for capacidad in (None, 8):
+                with self.subTest(clase=clase.__name__, capacidad=capacidad):
+                    estructura = clase(capacidad)
+                    recibidos = asyncio.run(self.productores_y_consumidores(estructura))
+                    self.assertEqual(list(range(PRODUCTORES * POR_PRODUCTOR)), recibidos)
+                    self.assertTrue(estructura.vacia)
+
+
+    def test_orden_y_tiempo(self):
+        async def probar():
+            pila, cola = PilaAsincrona(), ColaAsincrona(2)
+            for i in range(2):
+                await pila.apilar(i)
+                await cola.encolar(i)
+            self.assertEqual((1, 0), (pila.tope, cola.frente))
+            with self.assertRaises(TimeoutError):
+                await cola.encolar(2, tiempo=0.01)
+            self.assertEqual([1, 0], [await pila.desapilar(), await pila.desapilar()])
+            self.assertEqual([0, 1], [await cola.desencolar(), await cola.desencolar()])
+            with self.assertRaises(TimeoutError):
+                await pila.desapilar(tiempo=0.01)
+
+        asyncio.run(probar())
+
+
+    def test_cerrar_despierta_a_las_que_esperan(self):
+        async def probar(clase):
+            vacia, llena = clase(), clase(1)
+            await operaciones(llena)[0]("x")
+            sacar = asyncio.create_task(operaciones(vacia)[1]())
+            poner = asyncio.create_task(operaciones(llena)[0]("y"))
+            await asyncio.sleep(0.01)
+            vacia.cerrar()
+            llena.cerrar()
+            resultados = await asyncio.wait_for(asyncio.gather(sacar, poner, return_exceptions=True), 5)
+            self.assertEqual([IndexError, ValueError], list(map(type, resultados)))
+            self.assertEqual("x", await operaciones(llena)[1]())
+            with self.assertRaises(ValueError):
+                await operaciones(llena)[0]("z")
+            with self.assertRaises(IndexError):
+                await operaciones(llena)[1]()
+
+        for clase in (PilaAsincrona, ColaAsincrona):
+            with self.subTest(clase=clase.__name__):
+                asyncio.run(probar(clase))
@@ -0,0 +1,67 @@
+# Pruebas de las consultas perezosas sobre listas
+import unittest
+
+from ean_estructuras_datos import Lista, crear_lista
+from pruebas.datos import municipios
+
+
+class TestConsulta(unittest.TestCase):
+    def setUp(self):
+        self.numeros = Lista.desde_iterable(range(1, 11))
+        self.municipios = municipios()
+
+
+    def test_etapas_en_un_solo_recorrido(self):
+        vistos = []
+
+        def es_par(x):
+            vistos.append(x)
+            return x % 2 == 0
+
+        consulta = self.numeros.consulta().filtrar(es_par).seleccionar(lambda x: x * 10)
+        # Las etapas solo se registran
+        self.assertEqual([], vistos)
+        self.assertEqual(crear_lista(20, 40, 60, 80, 100), consulta.a_lista())
+        self.assertEqual(list(range(1, 11)), vistos)
+
+
+    def test_limitar_se_detiene_pronto(self):
+        vistos = []
+        primeros = self.numeros.consulta().seleccionar(lambda x: vistos.append(x) or x).limitar(3).a_lista()
+        self.assertEqual(crear_lista(1, 2, 3), primeros)
+        self.assertEqual([1, 2, 3], vistos)
+
+
+    def test_saltar_e_invertir(self):
+        self.assertEqual(crear_lista(10, 9, 8), self.numeros.consulta().invertir().limitar(3).a_lista())
+        self.assertEqual(crear_lista(10, 8, 6), self.numeros.consulta().saltar(4).filtrar(lambda x: x % 2 == 0)
+                         .invertir().a_lista())
+
+
+    def test_consultas_independientes(self):
+        base = self.numeros.consulta().filtrar(lambda x: x > 5)
+        self.assertEqual(5, base.contar())
+        self.assertEqual(2, base.limitar(2).contar())
+        self.assertEqual(5, base.contar())
+
+
+    def test_operaciones_terminales(self):
+        consulta = self.municipios.consulta().filtrar(lambda m: m.departamento == "ANTIOQUIA")
+        self.assertEqual(3, consulta.contar())
+        self.assertEqual(3_235_000, consulta.sumar(lambda m: m.poblacion_total()))
+        self.assertAlmostEqual(3_235_000 / 3, consulta.promedio(lambda m: m.poblacion_total()))
+        self.assertEqual("MEDELLIN", consulta.mayor(atributo="poblacion_urbana").nombre)
+        self.assertEqual("ITAGUI", consulta.menor(atributo="poblacion_total()").nombre)
+        self.assertAlmostEqual(100 / 3, consulta.porcentaje(lambda m: m.es_capital))
+        self.assertEqual("BELLO", consulta.encontrar_primero(lambda m: not m.es_capital).nombre)
+        self.assertTrue(consulta.alguno(lambda m: m.es_capital))
+        self.assertFalse(consulta.todos(lambda m: m.es_capital))
+        self.assertEqual(3, consulta.estadisticas(lambda m: m.codigo).cantidad)
+
+
+    def test_consulta_vacia(self):
+        vacia = self.numeros.consulta().filtrar(lambda x: x > 100)
+        self.assertEqual(0.0, vacia.promedio())
+        self.assertIsNone(vacia.mayor())
+        self.assertIsNone(vacia.encontrar_primero())
+        self.assertEqual(0, vacia.acumular(0, lambda a, x: a + x))
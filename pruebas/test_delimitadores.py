@@ -0,0 +1,117 @@
+# Pruebas de la validación de delimitadores balanceados por bloques
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from ean_estructuras_datos import validar_delimitadores
+
+
+def validar(texto: str, **opciones):
+    return validar_delimitadores(io.StringIO(texto), **opciones)
+
+
+def resumen(resultado) -> tuple:
+    return (resultado.balanceado, resultado.mensaje, resultado.linea, resultado.columna,
+            resultado.profundidad_maxima, resultado.caracteres)
+
+
+class TestDelimitadores(unittest.TestCase):
+    def test_balanceados(self):
+        resultado = validar("{a: [1, (2)], b: []}")
+        self.assertTrue(resultado)
+        self.assertEqual(3, resultado.profundidad_maxima)
+        self.assertEqual(20, resultado.caracteres)
+        self.assertIsNone(resultado.bytes_leidos)
+        self.assertTrue(validar(""))
+
+
+    def test_errores_con_linea_y_columna(self):
+        resultado = validar("(a\n[b)\n")
+        self.assertFalse(resultado)
+        self.assertEqual("Se esperaba ']' pero se encontró ')'", resultado.mensaje)
+        self.assertEqual((2, 3), (resultado.linea, resultado.columna))
+        resultado = validar("x\n  }")
+        self.assertEqual("Se encontró '}' sin su apertura", resultado.mensaje)
+        self.assertEqual((2, 3), (resultado.linea, resultado.columna))
+        resultado = validar("((\n[")
+        self.assertEqual("Falta cerrar '[' (3 delimitadores sin cerrar)", resultado.mensaje)
+        self.assertEqual((2, 2), (resultado.linea, resultado.columna))
+
+
+    def test_comillas(self):
+        self.assertTrue(validar('f("(", \')]\', "{")'))
+        resultado = validar('a\n  "sin cerrar (')
+        self.assertEqual('La comilla " no se cerró', resultado.mensaje)
+        self.assertEqual((2, 3), (resultado.linea, resultado.columna))
+        self.assertTrue(validar('"(" )', comillas=""))
+        self.assertFalse(validar('"(" )'))
+        self.assertTrue(validar('"(" )', comillas="'"))
+
+
+    def test_escapes(self):
+        self.assertTrue(validar(r'"a \" (" \( \\ ()'))
+        self.assertFalse(validar(r'\\('))
+        self.assertTrue(validar(r'"\\" ()'))
+        self.assertFalse(validar(r'\()'))
+        self.assertTrue(validar(r'\()', escape=None))
+        self.assertTrue(validar('^( "^"" ', escape="^", comillas='"'))
+        self.assertEqual("La comilla \" no se cerró", validar(r'"\"').mensaje)
+
+
+    def test_cortes_de_bloque(self):
+        textos = [r'{"a": "x\"(", "b": [1, 2]}', r'"\\\\" (', '"abc"\\', '(\\\n)', "'\\'' [", 'ñ("á") é]',
+                  '{\n  "k": "v"\n}\n)']
+        for texto in textos:
+            esperado = resumen(validar(texto))
+            for tam_bloque in range(1, len(texto) + 1):
+                with self.subTest(texto=texto, tam_bloque=tam_bloque):
+                    self.assertEqual(esperado, resumen(validar(texto, tam_bloque=tam_bloque)))
+
+
+    def test_cortes_de_bloque_al_azar(self):
+        azar = random.Random(23)
+        for _ in range(300):
+            texto = "".join(azar.choice('ab\n()[]{}"\'\\') for _ in range(azar.randint(0, 30)))
+            esperado = resumen(validar(texto))
+            for tam_bloque in (1, 2, 3, 5):
+                self.assertEqual(esperado, resumen(validar(texto, tam_bloque=tam_bloque)), texto)
+
+
+    def test_bytes_y_texto(self):
+        texto = 'añ ("é", [ü]) }'
+        datos = texto.encode("utf-8")
+        for tam_bloque in (1, 2, 3, 1 << 20):
+            with self.subTest(tam_bloque=tam_bloque):
+                de_bytes = validar_delimitadores(datos, tam_bloque=tam_bloque)
+                de_texto = validar(texto, tam_bloque=tam_bloque)
+                self.assertEqual(resumen(de_texto), resumen(de_bytes))
+                self.assertEqual(len(datos), de_bytes.bytes_leidos)
+                self.assertEqual((1, 15), (de_bytes.linea, de_bytes.columna))
+        latin = validar_delimitadores(io.BytesIO("(ñ)".encode("latin-1")), codificacion="latin-1")
+        self.assertTrue(latin)
+        self.assertEqual(3, latin.bytes_leidos)
+
+
+    def test_archivo(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "datos.json")
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write('{"a": [1, 2]}\n' * 100)
+            resultado = validar_delimitadores(ruta, tam_bloque=7)
+            self.assertTrue(resultado)
+            self.assertEqual(1_400, resultado.bytes_leidos)
+
+
+    def test_otros_pares(self):
+        resultado = validar("«(»)", pares={"«": "»", "(": ")"})
+        self.assertEqual("Se esperaba ')' pero se encontró '»'", resultado.mensaje)
+        self.assertTrue(validar("<a <b>> ()", pares="<>"))
+        self.assertTrue(validar('"(" x', pares=""))
+        with self.assertRaises(ValueError):
+            validar("", pares="(")
+        with self.assertRaises(ValueError):
+            validar("", pares="((")
+        with self.assertRaises(ValueError):
+            validar("", comillas="(")
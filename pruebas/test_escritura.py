@@ -0,0 +1,96 @@
+# Pruebas de la escritura de estructuras en CSV y JSON Lines
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from ean_estructuras_datos import (Lista, Persona, crear_arbol_de_lista, crear_lista, crear_pila, escribir_csv,
+                                   escribir_jsonl)
+from pruebas.datos import municipios, persona
+
+
+class TestEscritura(unittest.TestCase):
+    def setUp(self):
+        self.municipios = municipios()
+
+
+    def test_csv_de_dataclasses(self):
+        salida = io.StringIO()
+        self.assertEqual(8, escribir_csv(self.municipios, salida, tam_lote=3))
+        filas = list(csv.reader(io.StringIO(salida.getvalue())))
+        self.assertEqual(["codigo", "nombre", "poblacion_urbana", "poblacion_rural", "departamento", "es_capital"],
+                         filas[0])
+        self.assertEqual(["5001", "MEDELLIN", "2400000", "30000", "ANTIOQUIA", "True"], filas[1])
+        self.assertEqual(9, len(filas))
+
+
+    def test_csv_con_campos_y_separador(self):
+        salida = io.StringIO()
+        escribir_csv(self.municipios, salida, campos=["nombre", "codigo"], separador=";", encabezado=False)
+        self.assertEqual("MEDELLIN;5001", salida.getvalue().splitlines()[0])
+
+
+    def test_csv_de_campos_privados_y_valores(self):
+        salida = io.StringIO()
+        escribir_csv(Lista.desde_iterable([persona(7, 30, 2)]), salida, campos=["cedula", "edad"])
+        self.assertEqual(["cedula,edad", "7,30"], salida.getvalue().splitlines())
+        salida = io.StringIO()
+        escribir_csv(crear_pila(1, 2), salida)
+        self.assertEqual(["valor", "2", "1"], salida.getvalue().splitlines())
+
+
+    def test_csv_sin_registros(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "vacio.csv")
+            self.assertEqual(0, escribir_csv(Lista(), ruta, campos=["codigo", "nombre"]))
+            with open(ruta, encoding="utf-8") as archivo:
+                self.assertEqual("codigo,nombre\n", archivo.read())
+            ruta = os.path.join(directorio, "sin_campos.csv")
+            self.assertEqual(0, escribir_csv(Lista(), ruta))
+            self.assertTrue(os.path.exists(ruta))
+
+
+    def test_jsonl(self):
+        salida = io.StringIO()
+        self.assertEqual(8, escribir_jsonl(self.municipios, salida, tam_lote=5))
+        lineas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual(8, len(lineas))
+        self.assertEqual({"codigo": 5001, "nombre": "MEDELLIN", "poblacion_urbana": 2_400_000,
+                          "poblacion_rural": 30_000, "departamento": "ANTIOQUIA", "es_capital": True}, lineas[0])
+
+
+    def test_jsonl_con_valores_de_numpy(self):
+        # Así quedan los registros que crean los lectores de archivos con pandas
+        registro = Persona(np.int64(1), "ANA", np.int64(30), "F", np.int64(0), "PROFESIONAL", np.int64(3),
+                           np.int64(2_000_000), np.float64(61.5), np.int64(165), np.bool_(True), np.bool_(False),
+                           False, False)
+        salida = io.StringIO()
+        escribir_jsonl(crear_lista(registro, {"valores": np.arange(3), "fecha": complex(1, 2)}), salida)
+        primera, segunda = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual(1, primera["cedula"])
+        self.assertEqual(61.5, primera["peso"])
+        self.assertIs(True, primera["fuma"])
+        self.assertIs(False, primera["usa_lentes"])
+        self.assertEqual([0, 1, 2], segunda["valores"])
+        self.assertEqual("(1+2j)", segunda["fecha"])
+
+
+    def test_jsonl_de_un_arbol(self):
+        salida = io.StringIO()
+        self.assertEqual(5, escribir_jsonl(crear_arbol_de_lista(crear_lista(4, 2, 6, 1, 3)), salida))
+        self.assertEqual(["1", "2", "3", "4", "6"], salida.getvalue().split())
+
+
+    def test_jsonl_sin_registros(self):
+        salida = io.StringIO()
+        self.assertEqual(0, escribir_jsonl([], salida))
+        self.assertEqual("", salida.getvalue())
+
+
+    def test_repr_de_la_pila(self):
+        self.assertEqual("Pila[3, 2, 1]", repr(crear_pila(1, 2, 3)))
+        self.assertTrue(repr(crear_pila(*range(100))).endswith("(100 elementos)"))
@@ -0,0 +1,72 @@
+# Pruebas de las estadísticas en un solo recorrido
+import statistics
+import unittest
+
+from ean_estructuras_datos import Estadisticas, Lista, crear_lista
+from pruebas.datos import municipios
+
+
+class TestEstadisticas(unittest.TestCase):
+    def setUp(self):
+        self.valores = [2.5, 7.0, 1.0, 9.5, 4.0, 4.0, 12.25]
+        self.lista = Lista.desde_iterable(self.valores)
+
+
+    def test_estadisticas_de_la_lista(self):
+        est = self.lista.estadisticas()
+        self.assertEqual(7, est.cantidad)
+        self.assertAlmostEqual(sum(self.valores), est.suma)
+        self.assertAlmostEqual(statistics.fmean(self.valores), est.promedio)
+        self.assertEqual(1.0, est.minimo)
+        self.assertEqual(12.25, est.maximo)
+        self.assertAlmostEqual(statistics.pvariance(self.valores), est.varianza)
+        self.assertAlmostEqual(statistics.variance(self.valores), est.varianza_muestral)
+        self.assertAlmostEqual(statistics.pstdev(self.valores), est.desviacion)
+        self.assertAlmostEqual(statistics.stdev(self.valores), est.desviacion_muestral)
+
+
+    def test_selector(self):
+        est = municipios().estadisticas(lambda m: m.poblacion_rural)
+        self.assertEqual(5_000, est.minimo)
+        self.assertEqual(60_000, est.maximo)
+        self.assertEqual(190_000, est.suma)
+
+
+    def test_incremental(self):
+        est = Estadisticas()
+        for valor in self.valores:
+            est.agregar(valor)
+        self.assertAlmostEqual(statistics.pvariance(self.valores), est.varianza)
+        self.assertEqual(est.maximo, self.lista.estadisticas().maximo)
+
+
+    def test_observar(self):
+        est = Estadisticas(lambda x: x * 2)
+        vistos = list(est.observar(iter(self.valores)))
+        self.assertEqual(self.valores, vistos)
+        self.assertAlmostEqual(2 * sum(self.valores), est.suma)
+
+
+    def test_combinar(self):
+        izq = crear_lista(*self.valores[:3]).estadisticas()
+        der = crear_lista(*self.valores[3:]).estadisticas()
+        total = izq.combinar(der)
+        self.assertEqual(7, total.cantidad)
+        self.assertAlmostEqual(statistics.fmean(self.valores), total.promedio)
+        self.assertAlmostEqual(statistics.pvariance(self.valores), total.varianza)
+        self.assertEqual(1.0, total.minimo)
+        self.assertEqual(12.25, total.maximo)
+        self.assertEqual(3, izq.combinar(Estadisticas()).cantidad)
+
+
+    def test_estable_con_valores_grandes(self):
+        valores = [1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16]
+        self.assertAlmostEqual(22.5, Lista.desde_iterable(valores).estadisticas().varianza)
+
+
+    def test_sin_valores(self):
+        est = Lista().estadisticas()
+        self.assertEqual(0, est.cantidad)
+        self.assertEqual(0.0, est.promedio)
+        self.assertEqual(0.0, est.varianza)
+        self.assertIsNone(est.minimo)
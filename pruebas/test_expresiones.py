@@ -0,0 +1,82 @@
+# Pruebas de las expresiones compiladas
+import time
+import unittest
+
+import numpy as np
+
+from ean_estructuras_datos import Lista, compilar_expresion, evaluar_expresion, evaluar_lote
+
+
+def instrucciones(expresion: str) -> tuple:
+    """
+    Las instrucciones de la máquina de pila, para saber qué se calculó al compilar
+    """
+    return compilar_expresion(expresion)._ExpresionCompilada__codigo
+
+
+class TestExpresiones(unittest.TestCase):
+    def test_evaluar(self):
+        self.assertEqual(63, evaluar_expresion("(4 + 5) * (7 - x)", x=0))
+        self.assertEqual(-4, evaluar_expresion("-2 ^ 2"))
+        self.assertEqual(19, evaluar_expresion("a * x ^ 2 + b", {"a": 2, "x": 3}, b=1))
+        with self.assertRaises(ValueError):
+            evaluar_expresion("x + y", x=1)
+
+
+    def test_calcula_las_constantes_al_compilar(self):
+        self.assertEqual(1, len(instrucciones("2 ^ 10 * (3 - 1)")))
+        self.assertEqual(2048, evaluar_expresion("2 ^ 10 * (3 - 1)"))
+        self.assertEqual(3, len(instrucciones("x + 2 * 3")))
+
+
+    def test_errores_al_evaluar_y_no_al_compilar(self):
+        for texto, error in (("1 / 0 + x", ZeroDivisionError), ("x + 5 % 0", ZeroDivisionError),
+                             ("(2 ^ 2000 + 0.5) * x", OverflowError)):
+            with self.subTest(texto=texto):
+                expresion = compilar_expresion(texto)
+                self.assertEqual(("x",), expresion.variables)
+                with self.assertRaises(error):
+                    expresion.evaluar(x=1)
+
+
+    def test_potencias_enormes_no_se_calculan_al_compilar(self):
+        inicio = time.perf_counter()
+        expresion = compilar_expresion("2 ^ 10 ^ 10")
+        self.assertLess(time.perf_counter() - inicio, 1)
+        self.assertEqual(3, len(instrucciones("2 ^ 10 ^ 10")))
+        self.assertEqual("2 10 10 ^ ^", " ".join(expresion.postfijo))
+
+
+    def test_evaluar_lote(self):
+        filas = Lista.desde_iterable([{"x": 1}, {"x": 2}, {"x": 3}])
+        self.assertEqual([3, 5, 7], list(evaluar_lote("2 * x + 1", filas)))
+        self.assertEqual([3, 5, 7], evaluar_lote("2 * x + 1", {"x": np.array([1, 2, 3])}).tolist())
+
+
+    def test_evaluar_lote_con_escalares_y_tamanos_distintos(self):
+        resultado = evaluar_lote("a * x + b", {"a": 2, "x": np.array([1, 2, 3]), "b": 1})
+        self.assertEqual([3, 5, 7], resultado.tolist())
+        self.assertEqual([7], evaluar_lote("a * x + b", {"a": 2, "x": 3, "b": 1}).tolist())
+        with self.assertRaises(ValueError):
+            evaluar_lote("x + y", {"x": np.array([1, 2, 3]), "y": np.array([1, 2])})
+
+
+    def test_evaluar_lote_da_lo_mismo_que_evaluar(self):
+        valores = [0, 1, 2, 3, -7, 1_000_000]
+        for texto in ("x ^ 40", "x * x * x * x", "x + 2 ^ 62 + 2 ^ 62", "x ^ 3 - 1", "x / 2 + 1", "(x + 1) ^ 2"):
+            with self.subTest(texto=texto):
+                esperado = [evaluar_expresion(texto, x=x) for x in valores]
+                filas = Lista.desde_iterable({"x": x} for x in valores)
+                self.assertEqual(esperado, list(evaluar_lote(texto, filas)))
+                self.assertEqual(esperado, evaluar_lote(texto, {"x": np.array(valores)}).tolist())
+
+
+    def test_evaluar_lote_con_division_por_cero(self):
+        for texto in ("1 / x", "5 % x", "x ^ -1"):
+            with self.subTest(texto=texto):
+                with self.assertRaises(ZeroDivisionError):
+                    evaluar_expresion(texto, x=0)
+                with self.assertRaises(ZeroDivisionError):
+                    evaluar_lote(texto, Lista.desde_iterable([{"x": 1}, {"x": 0}]))
+                with self.assertRaises(ZeroDivisionError):
+                    evaluar_lote(texto, {"x": np.array([1, 0])})
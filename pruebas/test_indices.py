@@ -0,0 +1,78 @@
+# Pruebas de los índices hash de las listas
+import unittest
+
+from ean_estructuras_datos import Lista, Municipio, crear_lista
+from pruebas.datos import municipios
+
+
+class TestIndices(unittest.TestCase):
+    def setUp(self):
+        self.municipios = municipios()
+        self.municipios.crear_indice("codigo", unico=True)
+        self.municipios.crear_indice("departamento")
+
+
+    def test_buscar_por(self):
+        self.assertTrue(self.municipios.tiene_indice("codigo"))
+        self.assertEqual("CALI", self.municipios.buscar_por("codigo", 76001).nombre)
+        self.assertIsNone(self.municipios.buscar_por("codigo", 1))
+        self.assertEqual(5, self.municipios.posicion_por("codigo", 76001))
+        self.assertEqual([0, 1, 7], self.municipios.posiciones_por("departamento", "ANTIOQUIA"))
+        self.assertEqual(["SOACHA", "CHIA"],
+                         [m.nombre for m in self.municipios.buscar_todos_por("departamento", "CUNDINAMARCA")])
+
+
+    def test_buscar_sin_indice(self):
+        self.assertEqual("BELLO", self.municipios.buscar_por("nombre", "BELLO").nombre)
+        self.assertEqual(1, self.municipios.posicion_por("departamento, nombre", ("ANTIOQUIA", "BELLO")))
+        self.assertIsNone(Lista().buscar_por("nombre", "BELLO"))
+
+
+    def test_indice_de_varios_atributos(self):
+        self.municipios.crear_indice("departamento, es_capital")
+        self.assertEqual([3, 4], self.municipios.posiciones_por("departamento,es_capital", ("CUNDINAMARCA", False)))
+
+
+    def test_indice_al_dia(self):
+        nuevo = Municipio(5266, "ENVIGADO", 230_000, 5_000, "ANTIOQUIA", False)
+        self.municipios.agregar(nuevo)
+        self.assertIs(nuevo, self.municipios.buscar_por("codigo", 5266))
+        self.municipios.eliminar(0)
+        self.assertEqual([0, 6, 7], self.municipios.posiciones_por("departamento", "ANTIOQUIA"))
+        self.municipios.insertar_al_principio(Municipio(5045, "APARTADO", 100_000, 20_000, "ANTIOQUIA", False))
+        self.assertEqual(0, self.municipios.posicion_por("codigo", 5045))
+        self.municipios[0] = Municipio(5045, "APARTADO", 100_000, 20_000, "CHOCO", False)
+        self.assertEqual([0], self.municipios.posiciones_por("departamento", "CHOCO"))
+        self.municipios.ordenar_en_sitio(atributo="codigo")
+        self.assertEqual(0, self.municipios.posicion_por("codigo", 5045))
+        self.assertEqual(8, self.municipios.posicion_por("codigo", 76520))
+        self.municipios.limpiar()
+        self.assertIsNone(self.municipios.buscar_por("codigo", 5045))
+
+
+    def test_indice_unico(self):
+        repetido = Municipio(5001, "OTRO", 1, 1, "ANTIOQUIA", False)
+        with self.assertRaises(ValueError):
+            self.municipios.agregar(repetido)
+        with self.assertRaises(ValueError):
+            self.municipios[1] = repetido
+        self.assertEqual(8, self.municipios.tam)
+        with self.assertRaises(ValueError):
+            self.municipios.crear_indice("departamento", unico=True)
+
+
+    def test_indices_no_descendentes(self):
+        with self.assertRaises(ValueError):
+            self.municipios.crear_indice("-codigo")
+
+
+    def test_eliminar_indice(self):
+        self.municipios.eliminar_indice("codigo")
+        self.assertFalse(self.municipios.tiene_indice("codigo"))
+        self.assertEqual("CALI", self.municipios.buscar_por("codigo", 76001).nombre)
+
+
+    def test_indice_de_numeros(self):
+        numeros = crear_lista(3, 1, 3)
+        numeros.crear_indice("real")
+        self.assertEqual([0, 2], numeros.posiciones_por("real", 3))
@@ -0,0 +1,150 @@
+# Pruebas de las instantáneas con copia al escribir
+import copy
+import gc
+import pickle
+import unittest
+
+from ean_estructuras_datos import Lista, concatenar_listas, copiar_lista, crear_lista, resto_lista
+
+
+def datos_de(lista: Lista) -> list:
+    """
+    Los datos internos de la lista, para saber si se copiaron
+    """
+    return lista._Lista__datos
+
+
+class TestInstantaneas(unittest.TestCase):
+    def setUp(self):
+        self.lista = Lista.desde_iterable(range(5))
+
+
+    def test_instantanea_independiente(self):
+        copia = self.lista.instantanea()
+        self.assertEqual(self.lista, copia)
+        copia.agregar(5)
+        self.lista[0] = -1
+        self.assertEqual(crear_lista(-1, 1, 2, 3, 4), self.lista)
+        self.assertEqual(crear_lista(0, 1, 2, 3, 4, 5), copia)
+
+
+    def test_version(self):
+        version = self.lista.version
+        self.lista.agregar(5)
+        self.lista.eliminar(0)
+        self.assertEqual(version + 2, self.lista.version)
+        self.assertEqual(self.lista.version, self.lista.version)
+
+
+    def test_copias_en_o1(self):
+        self.assertIs(datos_de(self.lista), datos_de(copiar_lista(self.lista)))
+        self.assertIs(datos_de(self.lista), datos_de(concatenar_listas(self.lista, Lista())))
+
+
+    def test_sin_copia_al_descartar_la_instantanea(self):
+        datos = datos_de(self.lista)
+        copia = self.lista.instantanea()
+        del copia
+        gc.collect()
+        self.lista.agregar(5)
+        self.assertIs(datos, datos_de(self.lista))
+
+
+    def test_sin_copia_al_descartar_las_vistas(self):
+        datos = datos_de(self.lista)
+        resto_lista(self.lista)
+        self.lista.invertir()
+        vista = self.lista[1:3]
+        sub_vista = vista[1:]
+        del vista, sub_vista
+        gc.collect()
+        self.lista.agregar(5)
+        self.assertIs(datos, datos_de(self.lista))
+
+
+    def test_la_ultima_copia_no_copia(self):
+        copia = self.lista.instantanea()
+        datos = datos_de(copia)
+        del self.lista
+        gc.collect()
+        copia.agregar(5)
+        self.assertIs(datos, datos_de(copia))
+
+
+    def test_vista_modificada_suelta_los_datos(self):
+        datos = datos_de(self.lista)
+        vista = self.lista[1:]
+        vista.agregar(10)
+        self.lista.agregar(5)
+        self.assertIs(datos, datos_de(self.lista))
+        self.assertEqual(crear_lista(1, 2, 3, 4, 10), vista)
+
+
+    def test_sigue_copiando_mientras_se_comparte(self):
+        datos = datos_de(self.lista)
+        copia = self.lista.instantanea()
+        self.lista.limpiar()
+        self.assertIsNot(datos, datos_de(self.lista))
+        self.assertEqual(Lista.desde_iterable(range(5)), copia)
+
+
+    def test_copy(self):
+        copia = copy.copy(self.lista.instantanea())
+        otra = self.lista.instantanea()
+        copia.agregar(5)
+        otra.agregar(6)
+        self.assertEqual(Lista.desde_iterable(range(5)), self.lista)
+        self.assertEqual(5, copia.ultimo)
+        self.assertEqual(6, otra.ultimo)
+
+
+    def test_pickle_y_deepcopy_escriben_sin_copiar(self):
+        instantanea = self.lista.instantanea()
+        for copiar in (lambda lista: pickle.loads(pickle.dumps(lista)), copy.deepcopy):
+            for original in (self.lista, instantanea, self.lista[1:4]):
+                copia = copiar(original)
+                datos = datos_de(copia)
+                copia.agregar(5)
+                self.assertIs(datos, datos_de(copia))
+                self.assertEqual(len(original) + 1, len(copia))
+        self.assertEqual(Lista.desde_iterable(range(5)), self.lista)
+        self.assertEqual(self.lista, instantanea)
+
+
+    def test_pickle_de_listas_que_comparten_datos(self):
+        lista, instantanea = pickle.loads(pickle.dumps([self.lista, self.lista.instantanea()]))
+        lista[0] = -1
+        instantanea.agregar(5)
+        self.assertEqual(crear_lista(-1, 1, 2, 3, 4), lista)
+        self.assertEqual(crear_lista(0, 1, 2, 3, 4, 5), instantanea)
+
+
+    def test_consultas_de_una_vista_sin_copiarla(self):
+        lista = Lista.desde_iterable(range(10))
+        datos = datos_de(lista)
+        vista = lista[2:8]
+        self.assertEqual(27, vista.sumar())
+        self.assertEqual(crear_lista(3, 5, 7), vista.filtrar(lambda x: x % 2 == 1))
+        self.assertEqual(7, vista.mayor())
+        self.assertEqual(4.5, vista.mediana())
+        self.assertEqual(3, vista.encontrar_posicion_primero(lambda x: x > 4))
+        self.assertEqual(Lista.desde_iterable(range(2, 8)), vista)
+        self.assertIn(5, vista)
+        self.assertEqual(crear_lista(7, 6), vista.mayores(2))
+        # La vista sigue compartiendo los datos: la original copia los suyos al cambiar
+        lista.agregar(10)
+        self.assertIsNot(datos, datos_de(lista))
+        self.assertEqual(Lista.desde_iterable(range(2, 8)), vista)
+
+
+    def test_modificar_una_vista_despues_de_consultarla(self):
+        vista = self.lista[1:4]
+        copia = vista.instantanea()
+        self.assertEqual(6, vista.sumar())
+        vista.agregar(10)
+        vista.ordenar_en_sitio(descendente=True)
+        self.assertEqual(crear_lista(10, 3, 2, 1), vista)
+        self.assertEqual(crear_lista(1, 2, 3), copia)
+        copia.limpiar()
+        self.assertTrue(copia.vacia)
+        self.assertEqual(Lista.desde_iterable(range(5)), self.lista)
@@ -0,0 +1,54 @@
+# Pruebas del protocolo de iteración y los constructores de Lista
+import unittest
+
+from ean_estructuras_datos import Lista, LIMITE_REPR, crear_lista, crear_pila, Pila
+
+
+class TestLista(unittest.TestCase):
+    def setUp(self):
+        self.lista = crear_lista(4, 8, 15, 16, 23, 42)
+
+
+    def test_iteracion(self):
+        self.assertEqual([4, 8, 15, 16, 23, 42], [x for x in self.lista])
+        self.assertEqual([42, 23, 16, 15, 8, 4], list(reversed(self.lista)))
+        self.assertIn(15, self.lista)
+        self.assertNotIn(5, self.lista)
+        self.assertEqual(108, sum(self.lista))
+
+
+    def test_len(self):
+        self.assertEqual(6, len(self.lista))
+        self.assertEqual(self.lista.tam, len(self.lista))
+        self.assertEqual(0, len(Lista()))
+
+
+    def test_valor_de_verdad(self):
+        self.assertTrue(self.lista)
+        self.assertFalse(Lista())
+        self.assertFalse(self.lista[10:])
+        self.assertTrue(crear_pila(1))
+        self.assertFalse(Pila())
+        self.assertFalse(Pila("arreglo"))
+
+
+    def test_desde_iterable(self):
+        self.assertEqual(self.lista, Lista.desde_iterable([4, 8, 15, 16, 23, 42]))
+        self.assertEqual(crear_lista(0, 1, 4), Lista.desde_iterable(x * x for x in range(3)))
+        self.assertEqual(self.lista, Lista.desde_iterable(self.lista))
+
+
+    def test_extender(self):
+        lista = crear_lista(1, 2)
+        lista.extender(range(3, 5))
+        self.assertEqual(crear_lista(1, 2, 3, 4), lista)
+        lista.extender(lista)
+        self.assertEqual(crear_lista(1, 2, 3, 4, 1, 2, 3, 4), lista)
+
+
+    def test_repr_limitado(self):
+        self.assertEqual("Lista[4, 8, 15, 16, 23, 42]", repr(self.lista))
+        larga = Lista.desde_iterable(range(1000))
+        texto = repr(larga)
+        self.assertTrue(texto.endswith(", ...] (1000 elementos)"))
+        self.assertEqual(LIMITE_REPR, texto.count(","))
@@ -0,0 +1,66 @@
+# Pruebas de la lista numérica guardada en un arreglo contiguo
+import unittest
+
+import numpy as np
+
+from ean_estructuras_datos import Lista, ListaNumerica
+
+
+class TestListaNumerica(unittest.TestCase):
+    def setUp(self):
+        self.enteros = ListaNumerica([1, 2, 3])
+        self.reales = ListaNumerica([1.5, 2, 3])
+
+
+    def test_tipo(self):
+        self.assertEqual('q', self.enteros.tipo)
+        self.assertEqual('d', self.reales.tipo)
+        self.assertEqual('d', ListaNumerica([2 ** 70]).tipo)
+        self.assertEqual('q', ListaNumerica(np.arange(4)).tipo)
+        with self.assertRaises(TypeError):
+            ListaNumerica([1, "2"])
+
+
+    def test_agregar_escalares_de_numpy(self):
+        self.enteros.agregar(np.int64(4))
+        self.enteros.agregar(np.int32(5))
+        self.reales.agregar(np.float64(4.5))
+        self.reales.agregar(np.int64(5))
+        self.assertEqual([1, 2, 3, 4, 5], list(self.enteros))
+        self.assertEqual([1.5, 2.0, 3.0, 4.5, 5.0], list(self.reales))
+
+
+    def test_agregar_rechaza_lo_que_no_es_numero(self):
+        for valor in (True, np.bool_(False), "4", None):
+            with self.subTest(valor=valor):
+                with self.assertRaises(TypeError):
+                    self.enteros.agregar(valor)
+        self.assertEqual(3, self.enteros.tam)
+
+
+    def test_operaciones(self):
+        self.assertEqual(6, self.enteros.sumar())
+        self.assertEqual(2, self.enteros.promedio())
+        self.assertEqual((3, 1), (self.enteros.mayor(), self.enteros.menor()))
+        self.assertEqual([2, 4, 6], list(self.enteros * 2))
+        self.assertEqual([2, 4, 6], list(self.enteros + self.enteros))
+        self.assertEqual([11, 12, 13], list(self.enteros + np.int64(10)))
+        with self.assertRaises(ValueError):
+            self.enteros + ListaNumerica([1])
+
+
+    def test_seleccionar_numerica(self):
+        numeros = Lista.desde_iterable(range(5))
+        cuadrados = numeros.seleccionar(lambda x: x * x, numerica=True)
+        self.assertIsInstance(cuadrados, ListaNumerica)
+        self.assertEqual([0, 1, 4, 9, 16], list(cuadrados))
+        self.assertIsInstance(numeros.seleccionar(np.float64, numerica=True), ListaNumerica)
+
+
+    def test_seleccionar_numerica_sin_booleanos(self):
+        numeros = Lista.desde_iterable(range(5))
+        for selector in (lambda x: x % 2 == 0, lambda x: np.bool_(x > 2), lambda x: x if x else False, str):
+            resultado = numeros.seleccionar(selector, numerica=True)
+            self.assertNotIsInstance(resultado, ListaNumerica)
+            self.assertEqual([selector(x) for x in range(5)], list(resultado))
+        self.assertIs(True, numeros.seleccionar(lambda x: x == 0, numerica=True)[0])
@@ -0,0 +1,93 @@
+# Pruebas de la lista ordenada
+import unittest
+
+from ean_estructuras_datos import Lista, ListaOrdenada, Municipio, crear_lista, fusionar_ordenadas
+from pruebas.datos import municipios
+
+
+class TestListaOrdenada(unittest.TestCase):
+    def setUp(self):
+        self.numeros = ListaOrdenada([7, 3, 9, 1, 5, 3])
+        self.municipios = municipios()
+
+
+    def test_orden(self):
+        self.assertEqual([1, 3, 3, 5, 7, 9], list(self.numeros))
+        self.assertEqual(6, len(self.numeros))
+        self.assertEqual(1, self.numeros.primero)
+        self.assertEqual(9, self.numeros.ultimo)
+        self.assertIsNone(self.numeros[6])
+        self.assertIn(5, self.numeros)
+        self.assertNotIn(4, self.numeros)
+
+
+    def test_agregar_y_eliminar(self):
+        self.numeros.agregar(4)
+        self.numeros.agregar_varios([10, 0])
+        self.assertEqual([0, 1, 3, 3, 4, 5, 7, 9, 10], list(self.numeros))
+        self.numeros.eliminar(0)
+        self.assertEqual(1, self.numeros.primero)
+        self.numeros.limpiar()
+        self.assertTrue(self.numeros.vacia)
+
+
+    def test_busquedas(self):
+        self.assertEqual(1, self.numeros.posicion(3))
+        self.assertIsNone(self.numeros.posicion(4))
+        self.assertEqual(crear_lista(3, 3, 5), self.numeros.rango(2, 5))
+        self.assertEqual(crear_lista(7, 9), self.numeros.rango(desde=6))
+        self.assertEqual(3, self.numeros.contar_en_rango(hasta=3))
+        self.assertEqual(0, self.numeros.contar_en_rango(6, 2))
+        self.assertEqual(5, self.numeros.piso(6))
+        self.assertIsNone(self.numeros.piso(0))
+        self.assertEqual(7, self.numeros.techo(6))
+        self.assertIsNone(self.numeros.techo(10))
+
+
+    def test_atributo(self):
+        ordenada = ListaOrdenada(self.municipios, atributo="poblacion_rural")
+        self.assertEqual("ITAGUI", ordenada.primero.nombre)
+        self.assertEqual("SOACHA", ordenada.buscar(10_000).nombre)
+        self.assertEqual(["BELLO", "CHIA"], [m.nombre for m in ordenada.rango(20_000, 20_000)])
+
+
+    def test_un_atributo_descendente(self):
+        ordenada = ListaOrdenada(self.municipios, atributo="-codigo")
+        self.assertEqual(76520, ordenada.primero.codigo)
+        self.assertEqual("CALI", ordenada.buscar(76001).nombre)
+        self.assertEqual(1, ordenada.posicion(76001))
+        self.assertIsNone(ordenada.buscar(3))
+        # Con una clave descendente, desde es el valor más grande
+        self.assertEqual([25754, 25175, 11001], [m.codigo for m in ordenada.rango(30_000, 10_000)])
+        self.assertEqual(3, ordenada.contar_en_rango(30_000, 10_000))
+        self.assertEqual(11001, ordenada.piso(10_000).codigo)
+        self.assertEqual(11001, ordenada.techo(20_000).codigo)
+        self.assertEqual(25175, ordenada.piso(20_000).codigo)
+        ordenada.agregar(Municipio(50001, "VILLAVICENCIO", 500_000, 30_000, "META", True))
+        self.assertEqual(2, ordenada.posicion(50001))
+
+
+    def test_atributos_mixtos(self):
+        ordenada = ListaOrdenada(self.municipios, atributo="departamento, -codigo")
+        self.assertEqual([5360, 5088, 5001, 11001, 25754, 25175, 76520, 76001], [m.codigo for m in ordenada])
+        self.assertEqual("BELLO", ordenada.buscar(("ANTIOQUIA", 5088)).nombre)
+        self.assertIsNone(ordenada.buscar(("ANTIOQUIA", 1)))
+        self.assertEqual(["SOACHA", "CHIA"],
+                         [m.nombre for m in ordenada.rango(("CUNDINAMARCA", 99_999), ("CUNDINAMARCA", 0))])
+        self.assertEqual("ITAGUI", ordenada.techo(("ANTIOQUIA", 99_999)).nombre)
+        self.assertEqual("MEDELLIN", ordenada.piso(("BOGOTA", 99_999)).nombre)
+
+
+    def test_clave(self):
+        palabras = ListaOrdenada(["pera", "kiwi", "banano", "uva"], clave=len)
+        self.assertEqual(["uva", "pera", "kiwi", "banano"], list(palabras))
+        self.assertEqual("pera", palabras.buscar(4))
+
+
+    def test_fusionar(self):
+        otra = ListaOrdenada([2, 3, 8])
+        self.assertEqual([1, 2, 3, 3, 3, 5, 7, 8, 9], list(self.numeros.fusionar(otra)))
+        self.assertEqual([0, 1, 2, 3, 3, 3, 5, 7, 8, 9],
+                         list(fusionar_ordenadas(self.numeros, otra, ListaOrdenada([0]))))
+        self.assertTrue(fusionar_ordenadas().vacia)
+        self.assertIsInstance(self.numeros.a_lista(), Lista)
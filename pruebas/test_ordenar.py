@@ -0,0 +1,56 @@
+# Pruebas del ordenamiento de listas
+import unittest
+
+from ean_estructuras_datos import crear_lista, es_menor_que
+from pruebas.datos import municipios
+
+
+class TestOrdenar(unittest.TestCase):
+    def setUp(self):
+        self.municipios = municipios()
+
+
+    def test_ordenar_numeros(self):
+        lista = crear_lista(5, 3, 9, 1, 7)
+        self.assertEqual(crear_lista(1, 3, 5, 7, 9), lista.ordenar())
+        self.assertEqual(crear_lista(9, 7, 5, 3, 1), lista.ordenar(descendente=True))
+        # La lista original no cambia
+        self.assertEqual(crear_lista(5, 3, 9, 1, 7), lista)
+
+
+    def test_ordenar_por_atributos(self):
+        ordenados = self.municipios.ordenar(atributo="departamento, nombre")
+        self.assertEqual(["BELLO", "ITAGUI", "MEDELLIN", "BOGOTA", "CHIA", "SOACHA", "CALI", "PALMIRA"],
+                         [m.nombre for m in ordenados])
+
+
+    def test_ordenar_con_atributo_descendente(self):
+        ordenados = self.municipios.ordenar(atributo="departamento, -codigo")
+        self.assertEqual([5360, 5088, 5001, 11001, 25754, 25175, 76520, 76001], [m.codigo for m in ordenados])
+
+
+    def test_ordenar_por_metodo(self):
+        ordenados = self.municipios.ordenar(atributo="poblacion_total()", descendente=True)
+        self.assertEqual("BOGOTA", ordenados.primero.nombre)
+        self.assertEqual("CHIA", ordenados.ultimo.nombre)
+
+
+    def test_ordenar_con_menor_que(self):
+        ordenados = self.municipios.ordenar(menor_que=lambda x, y: es_menor_que(x, y, "poblacion_urbana"))
+        self.assertEqual(sorted(m.poblacion_urbana for m in self.municipios), [m.poblacion_urbana for m in ordenados])
+
+
+    def test_ordenar_es_estable(self):
+        ordenados = self.municipios.ordenar(atributo="es_capital")
+        self.assertEqual(["BELLO", "SOACHA", "CHIA", "PALMIRA", "ITAGUI", "MEDELLIN", "BOGOTA", "CALI"],
+                         [m.nombre for m in ordenados])
+
+
+    def test_ordenar_en_sitio(self):
+        lista = crear_lista(4, 2, 8, 6)
+        self.assertIsNone(lista.ordenar_en_sitio(descendente=True))
+        self.assertEqual(crear_lista(8, 6, 4, 2), lista)
+
+
+    def test_ordenar_lista_vacia(self):
+        self.assertTrue(crear_lista().ordenar(atributo="edad").vacia)
@@ -0,0 +1,78 @@
+# Pruebas del ordenamiento externo
+import random
+import unittest
+from dataclasses import dataclass
+
+from ean_estructuras_datos import ordenar_externo
+
+
+@dataclass
+class Registro:
+    llave: int
+    orden: int
+
+    # Cuántos registros hay en memoria en este momento
+    vivos = 0
+
+    def __new__(cls, *args, **kwargs):
+        Registro.vivos += 1
+        return super().__new__(cls)
+
+    def __del__(self):
+        Registro.vivos -= 1
+
+
+class TestOrdenarExterno(unittest.TestCase):
+    def setUp(self):
+        azar = random.Random(14)
+        self.llaves = [azar.randint(0, 50) for _ in range(1_000)]
+        self.maximo_en_memoria = 0
+
+
+    def generar(self):
+        for i, llave in enumerate(self.llaves):
+            yield Registro(llave, i)
+            self.maximo_en_memoria = max(self.maximo_en_memoria, Registro.vivos)
+
+
+    def test_ordena_de_forma_estable(self):
+        esperado = sorted(((llave, i) for i, llave in enumerate(self.llaves)))
+        for max_en_memoria in (7, 100, 999, 1_000, 5_000):
+            resultado = [(r.llave, r.orden) for r in ordenar_externo(self.generar(), atributo="llave",
+                                                                    max_en_memoria=max_en_memoria)]
+            self.assertEqual(esperado, resultado)
+
+
+    def test_descendente_y_menor_que(self):
+        resultado = [r.llave for r in ordenar_externo(self.generar(), atributo="llave", descendente=True,
+                                                      max_en_memoria=64)]
+        self.assertEqual(sorted(self.llaves, reverse=True), resultado)
+        resultado = [r.llave for r in ordenar_externo(self.generar(), menor_que=lambda a, b: a.llave > b.llave,
+                                                      max_en_memoria=64)]
+        self.assertEqual(sorted(self.llaves, reverse=True), resultado)
+
+
+    def test_registros_en_memoria(self):
+        for max_en_memoria in (50, 1_000):
+            self.maximo_en_memoria = 0
+            for _ in ordenar_externo(self.generar(), atributo="llave", max_en_memoria=max_en_memoria):
+                pass
+            # El bloque que se está leyendo más el registro que se mira de más
+            self.assertLessEqual(self.maximo_en_memoria, max_en_memoria + 1)
+
+
+    def test_registros_en_memoria_al_mezclar_muchos_bloques(self):
+        self.llaves *= 2
+        for max_en_memoria in (64, 500):
+            maximo = 0
+            for _ in ordenar_externo(self.generar(), atributo="llave", max_en_memoria=max_en_memoria):
+                maximo = max(maximo, Registro.vivos)
+            # Con 64 hay 32 bloques: un lote de 2 registros por bloque, más el que se está entregando
+            self.assertLessEqual(maximo, max_en_memoria + 1)
+
+
+    def test_casos_limite(self):
+        self.assertEqual([], list(ordenar_externo([], atributo="llave")))
+        self.assertEqual([3, 2, 1], list(ordenar_externo(iter([2, 1, 3]), descendente=True, max_en_memoria=1)))
+        with self.assertRaises(ValueError):
+            list(ordenar_externo([1], max_en_memoria=0))
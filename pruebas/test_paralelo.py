@@ -0,0 +1,48 @@
+# Pruebas de la ejecución en paralelo
+import operator
+import unittest
+
+from ean_estructuras_datos import Lista, EjecutorParalelo
+
+
+def al_cuadrado(x: int) -> int:
+    return x * x
+
+
+def es_multiplo_de_tres(x: int) -> bool:
+    return x % 3 == 0
+
+
+class TestParalelo(unittest.TestCase):
+    def setUp(self):
+        self.numeros = Lista.desde_iterable(range(1_000))
+
+
+    def test_en_varios_procesos(self):
+        with self.numeros.paralelo(2, minimo=0) as p:
+            self.assertFalse(p.es_serial)
+            self.assertEqual(self.numeros.seleccionar(al_cuadrado), p.seleccionar(al_cuadrado))
+            self.assertEqual(self.numeros.filtrar(es_multiplo_de_tres), p.filtrar(es_multiplo_de_tres))
+            self.assertEqual(334, p.contar(es_multiplo_de_tres))
+            self.assertEqual(sum(range(1_000)) + 10, p.acumular(10, operator.add))
+            self.assertEqual(sum(range(1_000)), p.reducir(operator.add))
+
+
+    def test_sin_with(self):
+        ejecutor = EjecutorParalelo(list(range(100)), trabajadores=2, minimo=0, tam_trozo=7)
+        self.assertEqual([x * x for x in range(100)], list(ejecutor.seleccionar(al_cuadrado)))
+
+
+    def test_serial(self):
+        p = self.numeros.paralelo(2)
+        self.assertTrue(p.es_serial)
+        # En el proceso actual sí se pueden usar lambdas
+        self.assertEqual(500, p.contar(lambda x: x % 2 == 0))
+        self.assertTrue(self.numeros.paralelo(1, minimo=0).es_serial)
+
+
+    def test_sin_elementos(self):
+        with Lista().paralelo(2, minimo=0) as p:
+            self.assertEqual(5, p.acumular(5, operator.add))
+            self.assertIsNone(p.reducir(operator.add))
+            self.assertTrue(p.seleccionar(al_cuadrado).vacia)
@@ -0,0 +1,82 @@
+# Pruebas de la pila persistente
+import unittest
+
+from ean_estructuras_datos import Pila, PilaPersistente, crear_pila, crear_pila_persistente
+
+
+class TestPilaPersistente(unittest.TestCase):
+    def setUp(self):
+        self.pila = crear_pila_persistente(1, 2, 3)
+
+
+    def test_apilar_no_modifica(self):
+        otra = self.pila.apilar(4)
+        self.assertEqual([3, 2, 1], list(self.pila))
+        self.assertEqual([4, 3, 2, 1], list(otra))
+        self.assertEqual((3, 4), (self.pila.tam, otra.tam))
+        self.assertEqual(4, otra.tope)
+
+
+    def test_desapilar_no_modifica(self):
+        sin_tope = self.pila.desapilar()
+        self.assertEqual([2, 1], list(sin_tope))
+        self.assertEqual(2, len(sin_tope))
+        self.assertEqual(3, self.pila.tope)
+        vacia = sin_tope.desapilar().desapilar()
+        self.assertTrue(vacia.vacia)
+        self.assertEqual(0, vacia.tam)
+        with self.assertRaises(IndexError):
+            vacia.desapilar()
+        with self.assertRaises(IndexError):
+            _ = vacia.tope
+
+
+    def test_comparten_la_cola(self):
+        a = self.pila.apilar("a")
+        b = self.pila.apilar("b")
+        self.assertIs(a.desapilar()._PilaPersistente__cabeza, b.desapilar()._PilaPersistente__cabeza)
+        self.assertIs(self.pila, self.pila.copiar())
+
+
+    def test_apilar_varios(self):
+        otra = self.pila.apilar_varios(iter([4, 5]))
+        self.assertEqual([5, 4, 3, 2, 1], list(otra))
+        self.assertEqual(5, otra.tam)
+        self.assertEqual(3, self.pila.tam)
+
+
+    def test_backtracking(self):
+        # Todas las versiones de la pila siguen disponibles
+        versiones = [PilaPersistente()]
+        for i in range(5):
+            versiones.append(versiones[-1].apilar(i))
+        self.assertEqual([list(range(i - 1, -1, -1)) for i in range(6)], [list(v) for v in versiones])
+
+
+    def test_a_pila(self):
+        for almacenamiento in ("enlazada", "arreglo"):
+            with self.subTest(almacenamiento=almacenamiento):
+                pila = self.pila.a_pila(almacenamiento)
+                self.assertIsInstance(pila, Pila)
+                self.assertEqual(almacenamiento, pila.almacenamiento)
+                self.assertEqual(3, pila.tam)
+                pila.desapilar()
+                pila.apilar(10)
+                self.assertEqual([10, 2, 1], list(pila))
+                self.assertEqual([3, 2, 1], list(self.pila))
+
+
+    def test_desde_pila(self):
+        for almacenamiento in ("enlazada", "arreglo"):
+            with self.subTest(almacenamiento=almacenamiento):
+                pila = crear_pila(1, 2, 3, almacenamiento=almacenamiento)
+                persistente = PilaPersistente.desde_pila(pila)
+                pila.desapilar()
+                pila.apilar(10)
+                self.assertEqual([3, 2, 1], list(persistente))
+                self.assertEqual(3, persistente.tam)
+
+
+    def test_str_y_repr(self):
+        self.assertEqual("3 -> 2 -> 1", str(self.pila))
+        self.assertEqual("PilaPersistente[3, 2, 1]", repr(self.pila))
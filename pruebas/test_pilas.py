@@ -0,0 +1,85 @@
+# Pruebas de la pila con almacenamiento enlazado y en arreglo
+import unittest
+
+from ean_estructuras_datos import Lista, Pila, crear_pila
+
+
+class TestPila(unittest.TestCase):
+    def setUp(self):
+        self.pilas = [crear_pila(1, 2, 3, almacenamiento=almacenamiento) for almacenamiento in ("enlazada", "arreglo")]
+
+
+    def test_ultimo_en_entrar_primero_en_salir(self):
+        for pila in self.pilas:
+            with self.subTest(almacenamiento=pila.almacenamiento):
+                pila.apilar(4)
+                salida = []
+                while not pila.vacia:
+                    salida.append(pila.tope)
+                    pila.desapilar()
+                self.assertEqual([4, 3, 2, 1], salida)
+                self.assertEqual(0, pila.tam)
+                with self.assertRaises(IndexError):
+                    pila.desapilar()
+                with self.assertRaises(IndexError):
+                    _ = pila.tope
+
+
+    def test_tam_y_recorrido(self):
+        for pila in self.pilas:
+            with self.subTest(almacenamiento=pila.almacenamiento):
+                self.assertEqual(3, pila.tam)
+                self.assertEqual(3, len(pila))
+                self.assertEqual([3, 2, 1], list(pila))
+                # Recorrer no desapila
+                self.assertEqual([3, 2, 1], list(pila))
+                pila.desapilar()
+                self.assertEqual(2, pila.tam)
+
+
+    def test_apilar_varios_y_desapilar_n(self):
+        for pila in self.pilas:
+            with self.subTest(almacenamiento=pila.almacenamiento):
+                pila.apilar_varios(iter(range(4, 7)))
+                self.assertEqual(6, pila.tam)
+                self.assertEqual(6, pila.tope)
+                desapilados = pila.desapilar_n(4)
+                self.assertIsInstance(desapilados, Lista)
+                self.assertEqual([6, 5, 4, 3], list(desapilados))
+                self.assertEqual([2, 1], list(pila))
+                self.assertEqual(2, pila.tam)
+                self.assertTrue(pila.desapilar_n(0).vacia)
+                with self.assertRaises(IndexError):
+                    pila.desapilar_n(3)
+                with self.assertRaises(IndexError):
+                    pila.desapilar_n(-1)
+                self.assertEqual([2, 1], list(pila))
+
+
+    def test_copiar(self):
+        for pila in self.pilas:
+            with self.subTest(almacenamiento=pila.almacenamiento):
+                copia = pila.copiar()
+                self.assertEqual(pila.almacenamiento, copia.almacenamiento)
+                copia.desapilar()
+                pila.apilar(4)
+                self.assertEqual([2, 1], list(copia))
+                self.assertEqual(2, copia.tam)
+                self.assertEqual([4, 3, 2, 1], list(pila))
+
+
+    def test_mismo_comportamiento(self):
+        enlazada, arreglo = self.pilas
+        for pila in self.pilas:
+            pila.apilar_varios(range(10))
+            pila.desapilar_n(3)
+            pila.apilar("x")
+        self.assertEqual(list(enlazada), list(arreglo))
+        self.assertEqual(str(enlazada), str(arreglo))
+        self.assertEqual(repr(enlazada), repr(arreglo))
+
+
+    def test_almacenamiento_desconocido(self):
+        with self.assertRaises(ValueError):
+            Pila("circular")
+        self.assertEqual("enlazada", Pila().almacenamiento)
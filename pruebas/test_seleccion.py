@@ -0,0 +1,52 @@
+# Pruebas de la selección de los k mayores, k menores y el k-ésimo
+import random
+import unittest
+
+from ean_estructuras_datos import Lista, crear_lista, es_menor_que
+from pruebas.datos import municipios
+
+
+class TestSeleccion(unittest.TestCase):
+    def setUp(self):
+        azar = random.Random(10)
+        self.valores = [azar.randint(0, 500) for _ in range(1_000)]
+        self.lista = Lista.desde_iterable(self.valores)
+
+
+    def test_mayores_y_menores(self):
+        self.assertEqual(Lista.desde_iterable(sorted(self.valores, reverse=True)[:5]), self.lista.mayores(5))
+        self.assertEqual(Lista.desde_iterable(sorted(self.valores)[:5]), self.lista.menores(5))
+        self.assertEqual(self.lista.tam, self.lista.mayores(5_000).tam)
+        self.assertTrue(self.lista.menores(0).vacia)
+
+
+    def test_mayores_por_atributo(self):
+        ms = municipios()
+        self.assertEqual(["BOGOTA", "MEDELLIN", "CALI"], [m.nombre for m in ms.mayores(3, atributo="poblacion_total()")])
+        self.assertEqual(["ITAGUI", "SOACHA"], [m.nombre for m in ms.menores(2, atributo="poblacion_rural")])
+        menores = ms.menores(2, menor_que=lambda x, y: es_menor_que(x, y, "nombre"))
+        self.assertEqual(["BELLO", "BOGOTA"], [m.nombre for m in menores])
+
+
+    def test_k_esimo(self):
+        ordenados = sorted(self.valores)
+        for k in (0, 1, 499, 998, 999, -1, -10):
+            self.assertEqual(ordenados[k], self.lista.k_esimo(k))
+        self.assertIsNone(self.lista.k_esimo(1_000))
+        self.assertIsNone(self.lista.k_esimo(-1_001))
+        self.assertIsNone(Lista().k_esimo(0))
+
+
+    def test_k_esimo_es_estable(self):
+        ms = municipios()
+        por_capital = ms.ordenar(atributo="es_capital")
+        for k in range(ms.tam):
+            self.assertIs(por_capital[k], ms.k_esimo(k, atributo="es_capital"))
+
+
+    def test_mediana(self):
+        self.assertEqual(3, crear_lista(5, 1, 3).mediana())
+        self.assertEqual(2.5, crear_lista(4, 1, 3, 2).mediana())
+        self.assertEqual("b", crear_lista("d", "a", "c", "b").mediana())
+        self.assertEqual("BELLO", municipios().mediana(atributo="poblacion_total()").nombre)
+        self.assertIsNone(Lista().mediana())
@@ -0,0 +1,91 @@
+# Pruebas de la tabla columnar
+import unittest
+from dataclasses import dataclass
+
+import numpy as np
+
+from ean_estructuras_datos import Lista, Persona, TablaColumnar
+from pruebas.datos import municipios, persona
+
+
+@dataclass
+class Medida:
+    valor: int
+
+
+class TestTablaColumnar(unittest.TestCase):
+    def setUp(self):
+        self.municipios = municipios()
+        self.tabla = self.municipios.a_tabla_columnar()
+
+
+    def test_columnas_y_registros(self):
+        self.assertEqual(8, self.tabla.tam)
+        self.assertEqual(["codigo", "nombre", "poblacion_urbana", "poblacion_rural", "departamento", "es_capital"],
+                         self.tabla.nombres_columnas)
+        self.assertEqual(np.int64, self.tabla["codigo"].dtype)
+        self.assertEqual(bool, self.tabla["es_capital"].dtype)
+        self.assertEqual(self.municipios[2], self.tabla[2])
+        self.assertIsNone(self.tabla[100])
+        self.assertEqual(self.municipios, self.tabla.a_lista())
+
+
+    def test_nombres_sin_prefijo_privado(self):
+        personas = Lista.desde_iterable(persona(c, 20 + c, c % 6 + 1) for c in range(1, 6))
+        tabla = TablaColumnar.desde_lista(personas)
+        self.assertIn("edad", tabla.nombres_columnas)
+        self.assertEqual(personas[0], tabla[0])
+        self.assertIsInstance(tabla[0], Persona)
+
+
+    def test_agregados(self):
+        self.assertEqual(sum(m.poblacion_rural for m in self.municipios), self.tabla.sumar("poblacion_rural"))
+        self.assertEqual("BOGOTA", self.tabla.mayor(lambda t: t["poblacion_urbana"] + t["poblacion_rural"]).nombre)
+        self.assertEqual("ITAGUI", self.tabla.menor("poblacion_rural").nombre)
+        self.assertEqual(3, self.tabla.contar(lambda t: t["es_capital"]))
+        self.assertEqual(37.5, self.tabla.porcentaje(lambda t: t["es_capital"]))
+        self.assertEqual(["MEDELLIN", "BOGOTA", "CALI"],
+                         [m.nombre for m in self.tabla.filtrar(lambda t: t["es_capital"]).registros()])
+
+
+    def test_predicado_invalido(self):
+        with self.assertRaises(ValueError):
+            self.tabla.contar(lambda t: t["codigo"])
+
+
+    def test_ordenar(self):
+        ordenada = self.tabla.ordenar("departamento, -codigo")
+        self.assertEqual([5360, 5088, 5001, 11001, 25754, 25175, 76520, 76001], list(ordenada["codigo"]))
+        ordenada = self.tabla.ordenar("es_capital, nombre", descendente=True)
+        self.assertEqual(["MEDELLIN", "CALI", "BOGOTA", "SOACHA", "PALMIRA", "ITAGUI", "CHIA", "BELLO"],
+                         list(ordenada["nombre"]))
+
+
+    def test_ordenar_descendente_con_el_menor_entero(self):
+        minimo = np.iinfo(np.int64).min
+        tabla = TablaColumnar(Medida, {"valor": np.array([3, minimo, 0, -5], dtype=np.int64)})
+        self.assertEqual([3, 0, -5, minimo], list(tabla.ordenar("-valor")["valor"]))
+        self.assertEqual([3, 0, -5, minimo], list(tabla.ordenar("valor", descendente=True)["valor"]))
+
+
+    def test_ordenar_descendente_sin_signo(self):
+        tabla = TablaColumnar(Medida, {"valor": np.array([1, 7, 0, 2**64 - 1], dtype=np.uint64)})
+        self.assertEqual([2**64 - 1, 7, 1, 0], [int(v) for v in tabla.ordenar("-valor")["valor"]])
+        self.assertEqual([0, 1, 7, 2**64 - 1], [int(v) for v in tabla.ordenar("valor")["valor"]])
+
+
+    def test_ordenar_descendente_es_estable(self):
+        tabla = TablaColumnar.desde_lista(self.municipios)
+        ordenada = tabla.ordenar("-departamento")
+        self.assertEqual(["SOACHA", "CHIA"], [m.nombre for m in ordenada.registros()
+                                              if m.departamento == "CUNDINAMARCA"])
+
+
+    def test_tabla_vacia(self):
+        tabla = TablaColumnar(Medida, {"valor": np.array([], dtype=np.int64)})
+        self.assertTrue(tabla.vacia)
+        self.assertEqual(0.0, tabla.sumar("valor"))
+        self.assertIsNone(tabla.mayor("valor"))
+        self.assertEqual(0, tabla.ordenar("-valor").tam)
+        with self.assertRaises(ValueError):
+            TablaColumnar.desde_lista(Lista())
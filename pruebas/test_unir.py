@@ -0,0 +1,65 @@
+# Pruebas de la unión de listas por una clave
+import unittest
+
+from ean_estructuras_datos import Lista, Municipio, unir
+from pruebas.datos import departamentos, municipios
+
+
+class TestUnir(unittest.TestCase):
+    def setUp(self):
+        self.municipios = municipios()
+        self.departamentos = departamentos()
+
+
+    def test_union_interna(self):
+        parejas = unir(self.municipios, self.departamentos, "departamento", "nombre")
+        # BOGOTA no tiene departamento en los datos de prueba
+        self.assertEqual(7, parejas.tam)
+        self.assertEqual(("MEDELLIN", "ANTIOQUIA"), (parejas[0][0].nombre, parejas[0][1].nombre))
+        self.assertTrue(all(m.departamento == d.nombre for m, d in parejas))
+
+
+    def test_union_izquierda(self):
+        parejas = unir(self.municipios, self.departamentos, "departamento", "nombre", tipo="left")
+        self.assertEqual(8, parejas.tam)
+        self.assertEqual([("BOGOTA", None)], [(m.nombre, d) for m, d in parejas if d is None])
+
+
+    def test_union_izquierda_con_la_izquierda_mas_pequena(self):
+        pocos = Lista.desde_iterable([self.municipios[2], self.municipios[5]])
+        parejas = unir(pocos, self.departamentos, "departamento", "nombre", tipo="left")
+        self.assertEqual([("CALI", "VALLE"), ("BOGOTA", None)],
+                         [(m.nombre, None if d is None else d.nombre) for m, d in parejas])
+
+
+    def test_combinar_y_funciones_clave(self):
+        regiones = unir(self.departamentos, self.municipios, lambda d: d.nombre, lambda m: m.departamento,
+                        combinar=lambda d, m: (d.region, m.nombre))
+        self.assertEqual(7, regiones.tam)
+        self.assertIn(("PACIFICA", "PALMIRA"), regiones)
+
+
+    def test_union_por_mezcla(self):
+        ordenados = self.municipios.ordenar(atributo="departamento")
+        deptos = self.departamentos.ordenar(atributo="nombre")
+        esperado = unir(ordenados, deptos, "departamento", "nombre", tipo="left")
+        mezcla = unir(ordenados, deptos, "departamento", "nombre", tipo="left", ordenadas=True)
+        self.assertEqual(list(esperado), list(mezcla))
+
+
+    def test_claves_repetidas(self):
+        izq = Lista.desde_iterable([("a", 1), ("a", 2), ("b", 3)])
+        der = Lista.desde_iterable([("a", 10), ("a", 20), ("c", 30)])
+        primero = lambda t: t[0]
+        suma = lambda x, y: x[1] + y[1]
+        self.assertEqual([11, 21, 12, 22], list(unir(izq, der, primero, primero, combinar=suma)))
+        self.assertEqual([11, 21, 12, 22], list(unir(izq, der, primero, primero, combinar=suma, ordenadas=True)))
+
+
+    def test_errores_y_vacias(self):
+        with self.assertRaises(ValueError):
+            unir(self.municipios, self.departamentos, "departamento", "nombre", tipo="outer")
+        self.assertTrue(unir(Lista(), self.departamentos, "departamento", "nombre").vacia)
+        sin_pareja = unir(self.municipios, Lista(), "departamento", "nombre", tipo="left")
+        self.assertEqual(8, sin_pareja.tam)
+        self.assertIsInstance(sin_pareja[0][0], Municipio)
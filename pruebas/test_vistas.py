@@ -0,0 +1,93 @@
+# Pruebas de las vistas de listas
+import unittest
+
+from ean_estructuras_datos import Lista, VistaLista, copiar_lista, crear_lista, resto_lista
+
+
+class TestVistas(unittest.TestCase):
+    def setUp(self):
+        self.lista = Lista.desde_iterable(range(10))
+
+
+    def test_porciones(self):
+        vista = self.lista[2:8:2]
+        self.assertIsInstance(vista, VistaLista)
+        self.assertEqual(crear_lista(2, 4, 6), vista)
+        self.assertEqual(3, vista.tam)
+        self.assertEqual(3, len(vista))
+        self.assertEqual(2, vista.primero)
+        self.assertEqual(6, vista.ultimo)
+        self.assertEqual(6, vista[-1])
+        self.assertIsNone(vista[3])
+        self.assertEqual([6, 4, 2], list(reversed(vista)))
+        self.assertEqual(crear_lista(9, 8, 7), self.lista[::-1][:3])
+
+
+    def test_resto_lista(self):
+        resto = resto_lista(self.lista)
+        self.assertEqual(Lista.desde_iterable(range(1, 10)), resto)
+        self.assertEqual(Lista.desde_iterable(range(3, 10)), resto_lista(resto_lista(resto)))
+        self.assertTrue(resto_lista(crear_lista(1)).vacia)
+
+
+    def test_resto_lista_en_recursion(self):
+        def sumar(lista: Lista[int]) -> int:
+            return 0 if lista.vacia else lista.primero + sumar(resto_lista(lista))
+        self.assertEqual(45, sumar(self.lista))
+
+
+    def test_copiar_lista(self):
+        self.assertEqual(self.lista, copiar_lista(self.lista))
+        self.assertEqual(crear_lista(3, 4), copiar_lista(self.lista, 3, 5))
+        with self.assertRaises(ValueError):
+            copiar_lista(self.lista, 5, 5)
+
+
+    def test_modificar_la_vista_no_cambia_la_original(self):
+        vista = self.lista[0:3]
+        vista.agregar(100)
+        vista[0] = -1
+        self.assertEqual(crear_lista(-1, 1, 2, 100), vista)
+        self.assertEqual(Lista.desde_iterable(range(10)), self.lista)
+
+
+    def test_modificar_la_original_no_cambia_la_vista(self):
+        vista = self.lista[5:]
+        self.lista[5] = 50
+        self.lista.eliminar(0)
+        self.lista.limpiar()
+        self.assertEqual(crear_lista(5, 6, 7, 8, 9), vista)
+        self.assertTrue(self.lista.vacia)
+
+
+    def test_invertir(self):
+        invertida = self.lista.invertir()
+        self.assertEqual(Lista.desde_iterable(range(9, -1, -1)), invertida)
+        invertida.agregar(-1)
+        self.assertEqual(9, self.lista.ultimo)
+
+
+    def test_tipos_de_invertir_y_copiar_lista(self):
+        self.assertIs(VistaLista, type(self.lista.invertir()))
+        self.assertIs(Lista, type(copiar_lista(self.lista)))
+        self.assertIs(VistaLista, type(copiar_lista(self.lista, 2, 4)))
+        for resultado in (self.lista.invertir(), copiar_lista(self.lista), copiar_lista(self.lista, 2, 4)):
+            self.assertIsInstance(resultado, Lista)
+
+
+    def test_invertir_y_copiar_lista_son_independientes(self):
+        invertida = self.lista.invertir()
+        copia = copiar_lista(self.lista)
+        parte = copiar_lista(self.lista, 2, 4)
+        self.lista[3] = 30
+        self.lista.agregar(10)
+        self.assertEqual(Lista.desde_iterable(range(9, -1, -1)), invertida)
+        self.assertEqual(Lista.desde_iterable(range(10)), copia)
+        self.assertEqual(crear_lista(2, 3), parte)
+        invertida[0] = -9
+        copia.eliminar(0)
+        parte.agregar(-4)
+        self.assertEqual(crear_lista(0, 1, 2, 30, 4, 5, 6, 7, 8, 9, 10), self.lista)
+        self.assertEqual(-9, invertida.primero)
+        self.assertEqual(1, copia.primero)
+        self.assertEqual(crear_lista(2, 3, -4), parte)